@@ -5,13 +5,21 @@
 
 import streamlit as st
 import os
+import time
 from datetime import datetime
 from dotenv import load_dotenv
-import json
-import time
 
 from scraper import SafetyNewsScraper
+from collector import CollectionScheduler
+from pipeline import run_pipeline
+from dedup import deduplicate
 from briefing_generator import BriefingGenerator
+import models
+from archive import get_archive
+from briefing_store import get_briefing_store
+from date_utils import now_kst
+from source_health import CircuitOpenError, get_source_health, start_prober
+from telemetry import get_telemetry, start_metrics_server, waterfall_rows
 
 
 # 페이지 설정
@@ -82,6 +90,32 @@ def init_session_state():
         st.session_state.collection_done = False
     if 'briefing_done' not in st.session_state:
         st.session_state.briefing_done = False
+    # 게시 저장소에서 불러온 자료·브리핑의 시각 (직접 수집·생성하면 None)
+    if 'data_published_at' not in st.session_state:
+        st.session_state.data_published_at = None
+    if 'briefing_published_at' not in st.session_state:
+        st.session_state.briefing_published_at = None
+
+
+def load_published():
+    """백그라운드 실행(briefing_daemon)이 게시한 최신 브리핑을 세션에 반영
+
+    직접 수집하지 않은 세션에만 적용하고, 더 새 게시본이 나오면 바꿔 보여 준다.
+    """
+    latest = get_briefing_store().latest()
+    if latest is None:
+        return
+    state = st.session_state
+    own_data = state.scraped_data is not None and state.data_published_at is None
+    if own_data or state.data_published_at == latest.collected_at:
+        return
+    state.scraped_data = latest.data
+    state.collection_done = True
+    state.data_published_at = latest.collected_at
+    if state.briefing_published_at is not None or not state.briefing_done:
+        state.briefing_text = latest.briefing
+        state.briefing_done = True
+        state.briefing_published_at = latest.generated_at
 
 
 def main():
@@ -91,8 +125,12 @@ def main():
     load_dotenv()
     api_key = os.getenv('ANTHROPIC_API_KEY')
     
+    # METRICS_PORT를 지정하면 Prometheus용 /metrics 제공 (프로세스당 한 번)
+    start_metrics_server()
+    
     # 세션 상태 초기화
     init_session_state()
+    load_published()
     
     # 헤더
     st.markdown('<h1 class="main-header">🌟 새움터 일일 동향 브리핑</h1>', unsafe_allow_html=True)
@@ -103,7 +141,7 @@ def main():
         
         st.subheader("데이터 수집 소스")
         
-        # Playwright 가용성 체크 (scraper 모듈에서 확인)
+        # Playwright 가용성 체크 (브라우저 설치·실행은 첫 브라우저 수집 때 진행)
         from scraper import PLAYWRIGHT_AVAILABLE
         
         if not PLAYWRIGHT_AVAILABLE:
@@ -111,6 +149,14 @@ def main():
             st.caption("Playwright 미설치 또는 초기화 실패")
         else:
             st.success("✅ 모든 소스 사용 가능")
+            
+            from browser_pool import get_browser_pool
+            pool_stats = get_browser_pool().stats()
+            if pool_stats['pages']:
+                st.caption(f"🧭 브라우저 실행 {pool_stats['launches']}회 · "
+                           f"페이지 {pool_stats['pages']}건 · "
+                           f"재사용률 {pool_stats['browser_reuse_ratio']:.0%} · "
+                           f"요청 차단 {pool_stats['requests_blocked']}건")
         
         source_moel = st.checkbox("고용노동부 보도자료", value=True)
         source_kosha = st.checkbox("산업안전포털 공지사항", value=True, 
@@ -121,6 +167,24 @@ def main():
         source_bigkinds = st.checkbox("언론사 뉴스 검색", value=True,
                                      help="동적 페이지" if not PLAYWRIGHT_AVAILABLE else None)
         
+        # 소스별 상태 (연속 실패로 차단된 소스는 수집 때 바로 건너뜀)
+        health = get_source_health()
+        if health is not None:
+            start_prober()
+            snapshot = health.snapshot()
+            if snapshot:
+                with st.expander("🩺 소스 상태"):
+                    for source, h in snapshot.items():
+                        mark = {'closed': '🟢', 'half_open': '🟡', 'open': '🔴'}[h['state']]
+                        line = f"{mark} {get_category_name(source)} · 성공률 {h['success_rate']:.0%}"
+                        if h['p50'] is not None:
+                            line += f" · {h['p50']:.1f}초"
+                        if h['state'] == 'open':
+                            line += f" · {h['retry_in']:.0f}초 뒤 재확인"
+                        if h['last_error'] and h['state'] != 'closed':
+                            line += f" · {h['last_error']}"
+                        st.caption(line)
+        
         st.subheader("뉴스 검색 키워드")
         keywords = st.text_input("키워드", value="산업안전 중대재해", 
                                 help="Bigkinds에서 검색할 키워드를 입력하세요")
@@ -141,7 +205,7 @@ def main():
         st.caption("🕐 " + datetime.now().strftime("%H:%M:%S"))
     
     # 메인 영역
-    tab1, tab2, tab3 = st.tabs(["📊 데이터 수집", "📄 브리핑 생성", "ℹ️ 도움말"])
+    tab1, tab2, tab3, tab4 = st.tabs(["📊 데이터 수집", "📄 브리핑 생성", "🔎 자료 검색", "ℹ️ 도움말"])
     
     # 탭 1: 데이터 수집
     with tab1:
@@ -159,15 +223,22 @@ def main():
         
         # 수집 결과 표시
         if st.session_state.collection_done and st.session_state.scraped_data:
-            st.success("✅ 데이터 수집 완료!")
+            if st.session_state.data_published_at:
+                st.success(f"✅ {format_published(st.session_state.data_published_at)}에 "
+                           f"미리 수집한 자료입니다.")
+                st.caption("🔄 지금 다시 수집하려면 '🚀 수집 시작'을 누르세요.")
+            else:
+                st.success("✅ 데이터 수집 완료!")
             
             # 요약 통계
             total = sum(len(v) for v in st.session_state.scraped_data.values())
+            new_count = sum(1 for v in st.session_state.scraped_data.values()
+                            for item in v if item.fresh)
             
             col1, col2, col3, col4, col5 = st.columns(5)
             
             with col1:
-                st.metric("총 수집", f"{total}건")
+                st.metric("총 수집", f"{total}건", f"새 항목 {new_count}건", delta_color="off")
             with col2:
                 st.metric("고용노동부", f"{len(st.session_state.scraped_data.get('moel_press', []))}건")
             with col3:
@@ -185,10 +256,17 @@ def main():
                 if items:
                     with st.expander(f"📂 {get_category_name(category)} ({len(items)}건)"):
                         for i, item in enumerate(items, 1):
-                            st.markdown(f"**{i}. [{item.get('date', '')}]** {item.get('title', '')}")
-                            if 'link' in item:
-                                st.markdown(f"🔗 [{item['link']}]({item['link']})")
+                            badge = "🆕 " if item.is_new else ""
+                            st.markdown(f"**{i}. [{item.date}]** {badge}{item.title}")
+                            if item.link:
+                                st.markdown(f"🔗 [{item.link}]({item.link})")
+                            if item.alternates:
+                                st.caption("함께 보도: " + ", ".join(
+                                    alt['source'] or get_category_name(alt['category'])
+                                    for alt in item.alternates))
                             st.divider()
+            
+            render_profile('collect.run', "⏱️ 수집 실행 프로파일")
     
     # 탭 2: 브리핑 생성
     with tab2:
@@ -196,27 +274,34 @@ def main():
         
         if not st.session_state.collection_done:
             st.warning("⚠️ 먼저 데이터를 수집해주세요.")
-        elif not api_key:
-            st.error("❌ API 키가 설정되지 않았습니다. `.env` 파일을 확인하세요.")
         else:
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                st.info("수집된 데이터를 분석하여 안전보건 중심의 브리핑을 생성합니다.")
-            
-            with col2:
-                if st.button("✨ 브리핑 생성", type="primary", use_container_width=True):
-                    generate_briefing(api_key)
+            if not api_key:
+                st.error("❌ API 키가 설정되지 않았습니다. `.env` 파일을 확인하세요.")
+            else:
+                col1, col2 = st.columns([3, 1])
+                
+                with col1:
+                    st.info("수집된 데이터를 분석하여 안전보건 중심의 브리핑을 생성합니다.")
+                
+                with col2:
+                    if st.button("✨ 브리핑 생성", type="primary", use_container_width=True):
+                        generate_briefing(api_key)
             
-            # 브리핑 표시
+            # 브리핑 표시 (미리 만든 브리핑은 API 키 없이도 표시)
             if st.session_state.briefing_done and st.session_state.briefing_text:
-                st.success("✅ 브리핑 생성 완료!")
+                if st.session_state.briefing_published_at:
+                    st.success(f"✅ {format_published(st.session_state.briefing_published_at)}에 "
+                               f"미리 만든 브리핑입니다.")
+                else:
+                    st.success("✅ 브리핑 생성 완료!")
                 
                 # 브리핑 내용
                 st.markdown("---")
                 st.markdown(st.session_state.briefing_text)
                 st.markdown("---")
                 
+                render_profile('briefing.generate', "⏱️ 브리핑 생성 프로파일")
+                
                 # 다운로드 버튼
                 col1, col2 = st.columns(2)
                 
@@ -232,8 +317,7 @@ def main():
                 
                 with col2:
                     if st.session_state.scraped_data:
-                        json_data = json.dumps(st.session_state.scraped_data, 
-                                             ensure_ascii=False, indent=2)
+                        json_data = models.dumps(st.session_state.scraped_data, indent=2)
                         st.download_button(
                             label="📥 원본 데이터 (JSON)",
                             data=json_data,
@@ -242,8 +326,12 @@ def main():
                             use_container_width=True
                         )
     
-    # 탭 3: 도움말
+    # 탭 3: 자료 검색
     with tab3:
+        render_archive_search()
+    
+    # 탭 4: 도움말
+    with tab4:
         st.header("📖 사용 방법")
         
         st.markdown("""
@@ -261,6 +349,15 @@ def main():
         3. AI가 안전보건 중심으로 브리핑 생성
         4. 생성된 브리핑을 다운로드
         
+        ### 3️⃣ 자료 검색
+        
+        수집한 항목과 생성한 브리핑은 모두 보관소에 쌓입니다. **"🔎 자료 검색"** 탭에서
+        기간·소스를 골라 다시 수집하지 않고 찾을 수 있습니다.
+        
+        - 띄어 쓴 낱말은 모두 포함: `추락 사망`
+        - 앞에 `-`를 붙이면 제외: `추락 -교육`
+        - 붙여 쓴 말 안에서도 찾음: `추락` → "추락사고"
+        
         ### 💡 팁
         
         - **빠른 브리핑**: 고용노동부 + 중대재해만 선택
@@ -324,42 +421,62 @@ def collect_data(source_moel, source_kosha, source_accident,
         sources = []
         
         if source_moel:
-            sources.append('moel')
+            sources.append('moel_press')
         if source_kosha:
-            sources.append('kosha')
+            sources.append('kosha_notice')
         if source_accident:
-            sources.append('accident')
+            sources.append('major_accident')
         if source_labor:
-            sources.append('labor')
+            sources.append('labor_news')
         if source_bigkinds:
-            sources.append('bigkinds')
+            sources.append('bigkinds_news')
         
         total_sources = len(sources)
-        
-        for i, source in enumerate(sources):
-            progress = (i + 1) / total_sources
-            
-            if source == 'moel':
-                status_text.text("📄 고용노동부 보도자료 수집 중...")
-                scraper.scrape_moel_press_release()
-            elif source == 'kosha':
-                status_text.text("📄 산업안전포털 공지사항 수집 중...")
-                scraper.scrape_kosha_with_playwright()
-            elif source == 'accident':
-                status_text.text("🚨 중대재해 발생알림 수집 중...")
-                scraper.scrape_major_accidents()
-            elif source == 'labor':
-                status_text.text("📰 매일노동뉴스 수집 중...")
-                scraper.scrape_labor_news()
-            elif source == 'bigkinds':
-                status_text.text(f"🔍 뉴스 검색 중 (키워드: {keywords})...")
-                scraper.search_bigkinds_news(keywords)
-            
-            progress_bar.progress(progress)
-            time.sleep(0.5)
-        
-        st.session_state.scraped_data = scraper.results
+        done = []
+        data = {key: [] for key in scraper.results}
+        
+        if sources:
+            status_text.text(f"📡 {total_sources}개 소스 동시 수집 중...")
+        
+        # 항목이 도착하는 대로 화면에 표시 (수집이 끝나면 지우고 아래 전체 결과로 대체)
+        count_text = st.empty()
+        live = st.empty()
+        feed = live.container()
+        
+        events = CollectionScheduler(scraper).stream(sources, keywords)
+        for event in run_pipeline(events):
+            if event.kind == 'item':
+                item = event.item
+                data[event.source].append(item)
+                total = sum(len(v) for v in data.values())
+                count_text.caption(f"📥 지금까지 {total}건 수집")
+                badge = "🆕 " if item.is_new else ""
+                feed.markdown(f"- `{get_category_name(event.source)}` "
+                              f"[{item.date}] {badge}{item.title}")
+            else:
+                done.append(event.source)
+                progress_bar.progress(len(done) / total_sources)
+                if isinstance(event.error, CircuitOpenError):
+                    status_text.text(f"⛔ {get_category_name(event.source)} 건너뜀 "
+                                     f"({event.error}) - {len(done)}/{total_sources}")
+                    continue
+                mark = "⚠️" if event.error else "✅"
+                status_text.text(f"{mark} {get_category_name(event.source)} 완료 "
+                                 f"({event.elapsed:.1f}초, {len(data[event.source])}건) "
+                                 f"- {len(done)}/{total_sources}")
+        
+        live.empty()
+        count_text.empty()
+        
+        # 여러 소스에 실린 같은 소식은 하나로 묶음 (대표 항목에 다른 출처를 남김)
+        data, report = deduplicate(data, render=BriefingGenerator().format_data_for_prompt)
+        if report.removed:
+            saved = f" (프롬프트 약 {report.tokens_saved}토큰 절감)" if report.tokens_saved > 0 else ""
+            st.caption(f"🧬 유사 제목 {report.clusters}개 묶음으로 {report.removed}건 병합{saved}")
+        
+        st.session_state.scraped_data = data
         st.session_state.collection_done = True
+        st.session_state.data_published_at = None
         
         progress_bar.progress(1.0)
         status_text.text("✅ 수집 완료!")
@@ -376,6 +493,9 @@ def generate_briefing(api_key):
             if briefing:
                 st.session_state.briefing_text = briefing
                 st.session_state.briefing_done = True
+                st.session_state.briefing_published_at = None
+                if generator.cache_hit:
+                    st.info("♻️ 같은 자료로 이미 만든 브리핑을 불러왔습니다 (API 호출 없음).")
             else:
                 st.error("❌ 브리핑 생성에 실패했습니다.")
                 
@@ -383,6 +503,98 @@ def generate_briefing(api_key):
             st.error(f"❌ 오류 발생: {e}")
 
 
+def render_archive_search():
+    """보관소 검색 화면 (수집 항목·브리핑)"""
+    st.header("🔎 자료 검색")
+    
+    archive = get_archive()
+    if archive is None:
+        st.info("자료 보관소가 꺼져 있습니다 (ARCHIVE_DISABLED).")
+        return
+    
+    stats = archive.stats()
+    st.caption(f"📦 항목 {stats['items']:,}건 · 브리핑 {stats['briefings']:,}건"
+               + (f" · {stats['oldest'][:10]} ~ {stats['newest'][:10]}" if stats['oldest'] else ""))
+    
+    col1, col2, col3 = st.columns([3, 1, 1])
+    with col1:
+        query = st.text_input("검색어", placeholder="예: 추락 사망, 화학물질 -교육")
+    with col2:
+        period = st.selectbox("기간", list(SEARCH_PERIODS), index=3)
+    with col3:
+        target = st.radio("대상", ["수집 항목", "브리핑"], horizontal=True)
+    
+    if target == "브리핑":
+        briefings = archive.search_briefings(query)
+        if not briefings:
+            st.info("찾은 브리핑이 없습니다.")
+        for briefing in briefings:
+            with st.expander(f"📄 {briefing.created_at[:16].replace('T', ' ')} "
+                             f"(자료 {briefing.item_count}건)"):
+                st.markdown(briefing.text)
+        return
+    
+    sources = st.multiselect("소스", SEARCH_SOURCES, format_func=get_category_name)
+    days = SEARCH_PERIODS[period]
+    started = time.perf_counter()
+    items = archive.search(query, days=days, sources=sources, limit=200)
+    total = archive.count(query, days=days, sources=sources)
+    elapsed = (time.perf_counter() - started) * 1000
+    
+    st.caption(f"{total:,}건 찾음 ({elapsed:.0f}ms)"
+               + (f" - 최근 {len(items)}건 표시" if total > len(items) else ""))
+    for item in items:
+        title = f"[{item.title}]({item.link})" if item.link else item.title
+        date = item.published_at[:10] if item.published_at else item.date
+        st.markdown(f"- `{get_category_name(item.category)}` [{date}] {title}")
+
+
+def render_profile(root, title):
+    """가장 최근 실행의 구간을 폭포형 차트로 표시 (telemetry)"""
+    telemetry = get_telemetry()
+    rows = waterfall_rows(telemetry.last_trace(root)) if telemetry else []
+    if not rows:
+        return
+    
+    import altair as alt
+    
+    with st.expander(f"{title} (총 {rows[0]['duration_ms'] / 1000:.1f}초)"):
+        chart = alt.Chart(alt.Data(values=rows)).mark_bar().encode(
+            x=alt.X('start_ms:Q', title="실행 시작 후 (ms)"),
+            x2='end_ms:Q',
+            y=alt.Y('label:N', sort=None, title=None, axis=alt.Axis(labelLimit=320)),
+            color=alt.Color('status:N', legend=None,
+                            scale=alt.Scale(domain=['ok', 'error'], range=['#4c78a8', '#e45756'])),
+            tooltip=['label:N', 'duration_ms:Q', 'detail:N'],
+        ).properties(height=max(120, 22 * len(rows)))
+        st.altair_chart(chart, use_container_width=True)
+        
+        slowest = sorted(rows[1:], key=lambda r: -r['duration_ms'])[:3]
+        if slowest:
+            st.caption("가장 오래 걸린 구간: " + ", ".join(
+                f"{r['label'].split('. ', 1)[1].lstrip('·')} {r['duration_ms']:.0f}ms" for r in slowest))
+
+
+SEARCH_PERIODS = {
+    "최근 1주": 7,
+    "최근 1개월": 31,
+    "최근 3개월": 92,
+    "최근 6개월": 183,
+    "최근 1년": 366,
+    "전체": None,
+}
+SEARCH_SOURCES = ['moel_press', 'kosha_notice', 'major_accident', 'labor_news', 'bigkinds_news']
+
+
+def format_published(timestamp):
+    """게시 시각(ISO)을 'HH:MM (n분 전)' 형식으로"""
+    when = datetime.fromisoformat(timestamp)
+    minutes = int((now_kst() - when).total_seconds() // 60)
+    ago = f"{minutes}분 전" if minutes < 60 else f"{minutes // 60}시간 전"
+    day = "" if when.date() == now_kst().date() else when.strftime("%m월 %d일 ")
+    return f"{day}{when:%H:%M} ({ago})"
+
+
 def get_category_name(category):
     """카테고리 이름 변환"""
     names = {
@@ -0,0 +1,283 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+자료 보관소 모듈 - 수집한 모든 항목과 생성한 브리핑을 SQLite에 쌓고 FTS5로 검색
+
+항목은 한 번 들어가면 바꾸거나 지우지 않는다 (같은 게시물을 다시 수집하면 건너뜀).
+한국어는 띄어쓰기 단위로 찾으면 '추락사고'에서 '추락'을 못 찾으므로, 한글 구간을 두 글자씩
+겹쳐 자른 토큰(바이그램)으로 색인한다: '추락사고' → 추락 락사 사고.
+검색어도 같은 방식으로 잘라 이어진 토큰(구문)으로 찾으므로 두 글자 이상이면 어디에 붙어
+있어도 찾고, 한 글자는 그 글자로 시작하는 토큰으로 찾는다. 색인에는 토큰만 두고(contentless)
+제목·링크는 items 테이블에서 읽는다. 게시 월도 토큰(ym202610)으로 함께 색인해, 기간을 준
+검색은 그 달들의 문서만 FTS 안에서 교집합으로 좁힌 뒤 정확한 날짜로 거른다.
+
+    archive = get_archive()
+    archive.search('추락 -교육', days=180, sources=['moel_press'])
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from date_utils import now_kst, parse_dates
+from models import NewsItem, as_item
+from seen_store import item_key
+from storage import data_path
+
+
+# 한글·한자 구간은 바이그램, 그 밖의 글자·숫자 묶음은 단어 하나를 토큰으로
+_NGRAM_CHARS = '가-힣ㄱ-ㅎㅏ-ㅣ一-鿿'
+_WORD = re.compile(rf'[{_NGRAM_CHARS}]+|[^\W_{_NGRAM_CHARS}]+')
+_NGRAM_RUN = re.compile(rf'[{_NGRAM_CHARS}]')
+
+# 기간이 이보다 길면 월 토큰으로 좁히지 않음 (OR 항이 너무 많아짐)
+_MAX_MONTH_TERMS = 36
+
+
+def ngram_tokens(text: str) -> List[str]:
+    """색인·검색에 쓰는 토큰 목록"""
+    tokens = []
+    for word in _WORD.findall((text or '').lower()):
+        if len(word) > 1 and _NGRAM_RUN.match(word):
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def match_query(query: str) -> Optional[str]:
+    """검색어를 FTS5 MATCH 식으로 (띄어 쓴 낱말은 모두 포함, '-'로 시작하면 제외)
+
+    찾을 토큰이 하나도 없으면 None.
+    """
+    include, exclude = [], []
+    for term in query.split():
+        negate = term.startswith('-') and len(term) > 1
+        tokens = ngram_tokens(term[1:] if negate else term)
+        if not tokens:
+            continue
+        if len(tokens) == 1 and len(tokens[0]) == 1:
+            expr = f'"{tokens[0]}"*'          # 한 글자는 그 글자로 시작하는 토큰
+        else:
+            expr = '"' + ' '.join(tokens) + '"'
+        (exclude if negate else include).append(expr)
+    if not include:
+        return None
+    return ' AND '.join(include) + ''.join(f' NOT {expr}' for expr in exclude)
+
+
+def _month_token(when: datetime) -> str:
+    return f'ym{when:%Y%m}'
+
+
+def _month_tokens(since: datetime, until: datetime) -> List[str]:
+    tokens = []
+    year, month = since.year, since.month
+    while (year, month) <= (until.year, until.month):
+        tokens.append(f'ym{year:04d}{month:02d}')
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return tokens
+
+
+@dataclass(frozen=True)
+class ArchivedBriefing:
+    id: int
+    created_at: str
+    model: str
+    item_count: int
+    text: str
+
+
+class Archive:
+    """SQLite + FTS5 자료 보관소"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS items (
+                id INTEGER PRIMARY KEY,
+                key TEXT UNIQUE,
+                category TEXT,
+                source TEXT,
+                title TEXT,
+                link TEXT,
+                date TEXT,
+                published_at TEXT,
+                archived_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS items_published ON items(published_at);
+            CREATE INDEX IF NOT EXISTS items_category ON items(category, published_at);
+            CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+                tokens, content='', columnsize=0
+            );
+            CREATE TABLE IF NOT EXISTS briefings (
+                id INTEGER PRIMARY KEY,
+                created_at TEXT,
+                model TEXT,
+                item_count INTEGER,
+                text TEXT
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS briefings_fts USING fts5(
+                tokens, content='', columnsize=0
+            );
+        """)
+        self._conn.commit()
+
+    def add_items(self, category: str, items: Iterable, now: Optional[datetime] = None) -> int:
+        """항목을 보관하고 새로 들어간 건수를 반환 (이미 있는 항목은 건너뜀)"""
+        items = [as_item(item, category) for item in items]
+        if not items:
+            return 0
+        published = parse_dates([item.published_at or item.date for item in items], now)
+        archived_at = time.time()
+        added = 0
+        with self._lock:
+            with self._conn:
+                for item, parsed in zip(items, published):
+                    cursor = self._conn.execute(
+                        "INSERT OR IGNORE INTO items "
+                        "(key, category, source, title, link, date, published_at, archived_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (item_key(item), item.category or category, item.source, item.title,
+                         item.link, item.date,
+                         parsed.isoformat(timespec='minutes') if parsed else None, archived_at))
+                    if cursor.rowcount:
+                        tokens = ngram_tokens(item.title)
+                        if parsed is not None:
+                            tokens.append(_month_token(parsed))
+                        self._conn.execute("INSERT INTO items_fts (rowid, tokens) VALUES (?, ?)",
+                                           (cursor.lastrowid, ' '.join(tokens)))
+                        added += 1
+        return added
+
+    def add_briefing(self, text: str, model: str = '', item_count: int = 0) -> int:
+        created_at = now_kst().isoformat(timespec='seconds')
+        with self._lock:
+            with self._conn:
+                cursor = self._conn.execute(
+                    "INSERT INTO briefings (created_at, model, item_count, text) VALUES (?, ?, ?, ?)",
+                    (created_at, model, item_count, text))
+                self._conn.execute("INSERT INTO briefings_fts (rowid, tokens) VALUES (?, ?)",
+                                   (cursor.lastrowid, ' '.join(ngram_tokens(text))))
+        return cursor.lastrowid
+
+    def _where(self, query: str, days: Optional[float], since: Optional[datetime],
+               sources: Optional[List[str]]) -> Tuple[str, list]:
+        clauses, params = [], []
+        now = now_kst()
+        if since is None and days is not None:
+            since = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days)
+        expr = match_query(query or '')
+        if expr:
+            if since is not None:
+                # 다음 달까지 넣어 시계가 조금 어긋난 게시물도 놓치지 않음
+                months = _month_tokens(since, now + timedelta(days=31))
+                if len(months) <= _MAX_MONTH_TERMS:
+                    expr = f"({expr}) AND ({' OR '.join(months)})"
+            clauses.append("id IN (SELECT rowid FROM items_fts WHERE items_fts MATCH ?)")
+            params.append(expr)
+        if since is not None:
+            clauses.append("published_at >= ?")
+            params.append(since.isoformat(timespec='minutes'))
+        if sources:
+            clauses.append(f"category IN ({', '.join('?' * len(sources))})")
+            params.extend(sources)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def search(self, query: str = '', days: Optional[float] = None,
+               since: Optional[datetime] = None, sources: Optional[List[str]] = None,
+               limit: int = 100) -> List[NewsItem]:
+        """검색어·기간·소스로 찾은 항목 (최신순, 날짜를 모르는 항목은 기간을 주지 않을 때만)"""
+        where, params = self._where(query, days, since, sources)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT category, source, title, link, date, published_at FROM items" + where +
+                " ORDER BY published_at IS NULL, published_at DESC, id DESC LIMIT ?",
+                params + [limit]).fetchall()
+        return [NewsItem(title=title, date=date or '', link=link or '', source=source or '',
+                         category=category or '', published_at=published_at)
+                for category, source, title, link, date, published_at in rows]
+
+    def count(self, query: str = '', days: Optional[float] = None,
+              since: Optional[datetime] = None, sources: Optional[List[str]] = None) -> int:
+        expr = match_query(query or '')
+        with self._lock:
+            if expr and days is None and since is None and not sources:
+                # 검색어만 있으면 색인에서 바로 셈
+                return self._conn.execute(
+                    "SELECT COUNT(*) FROM items_fts WHERE items_fts MATCH ?", (expr,)).fetchone()[0]
+            where, params = self._where(query, days, since, sources)
+            return self._conn.execute("SELECT COUNT(*) FROM items" + where, params).fetchone()[0]
+
+    def search_briefings(self, query: str = '', limit: int = 20) -> List[ArchivedBriefing]:
+        """검색어가 든 브리핑 (검색어가 없으면 최근 브리핑)"""
+        expr = match_query(query or '')
+        sql = "SELECT id, created_at, model, item_count, text FROM briefings"
+        params: list = []
+        if expr:
+            sql += " WHERE id IN (SELECT rowid FROM briefings_fts WHERE briefings_fts MATCH ?)"
+            params.append(expr)
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY id DESC LIMIT ?", params + [limit]).fetchall()
+        return [ArchivedBriefing(*row) for row in rows]
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            items, oldest, newest = self._conn.execute(
+                "SELECT COUNT(*), MIN(published_at), MAX(published_at) FROM items").fetchone()
+            briefings = self._conn.execute("SELECT COUNT(*) FROM briefings").fetchone()[0]
+        return {'items': items, 'briefings': briefings, 'oldest': oldest, 'newest': newest}
+
+
+_archive: Optional[Archive] = None
+_archive_lock = threading.Lock()
+
+
+def get_archive() -> Optional[Archive]:
+    """프로세스 공용 보관소 (ARCHIVE_DISABLED=1이면 None)"""
+    global _archive
+    if os.getenv('ARCHIVE_DISABLED', '') in ('1', 'true'):
+        return None
+    with _archive_lock:
+        if _archive is None:
+            _archive = Archive(data_path('archive.sqlite3'))
+        return _archive
+
+
+if __name__ == "__main__":
+    import argparse
+    from models import loads
+
+    parser = argparse.ArgumentParser(description="자료 보관소 검색·가져오기")
+    sub = parser.add_subparsers(dest='command', required=True)
+    find = sub.add_parser('search', help="항목 검색")
+    find.add_argument('query')
+    find.add_argument('--days', type=float, help="최근 며칠 (기본: 전체)")
+    find.add_argument('--source', action='append', help="소스 키 (여러 번 지정 가능)")
+    find.add_argument('--limit', type=int, default=50)
+    load = sub.add_parser('import', help="앱에서 받은 원본 데이터(JSON)를 보관소에 추가")
+    load.add_argument('paths', nargs='+')
+    args = parser.parse_args()
+
+    archive = Archive(data_path('archive.sqlite3'))
+    if args.command == 'search':
+        started = time.perf_counter()
+        found = archive.search(args.query, days=args.days, sources=args.source, limit=args.limit)
+        total = archive.count(args.query, days=args.days, sources=args.source)
+        print(f"🔎 {total}건 ({(time.perf_counter() - started) * 1000:.1f}ms)")
+        for item in found:
+            print(f"  [{item.date}] {item.title} ({item.source or item.category})")
+    else:
+        for path in args.paths:
+            with open(path, encoding='utf-8') as f:
+                data = loads(f.read())
+            added = sum(archive.add_items(category, items) for category, items in data.items())
+            print(f"📦 {path}: {added}건 추가")
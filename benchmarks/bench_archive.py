@@ -0,0 +1,79 @@
+"""
+자료 보관소 벤치마크 - 수년 치 항목을 쌓은 보관소에서 검색 응답 시간 측정
+
+실행: python benchmarks/bench_archive.py [연수]
+하루 100건(소스 5개)씩 지정한 햇수만큼 제목을 만들어 임시 보관소에 넣고,
+자주 쓰는 검색(검색어 + 기간 + 소스)의 응답 시간을 출력한다.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from archive import Archive  # noqa: E402
+from date_utils import now_kst  # noqa: E402
+
+SOURCES = ['moel_press', 'kosha_notice', 'major_accident', 'labor_news', 'bigkinds_news']
+PLACES = ['건설현장', '제조업체', '물류센터', '조선소', '화학공장', '식품공장', '공사장', '택배터미널']
+EVENTS = ['추락사고', '끼임사고', '화재', '폭발사고', '질식사고', '붕괴사고', '감전사고', '폭염 온열질환']
+TAILS = ['노동자 1명 사망', '2명 중상', '안전조치 미흡 확인', '작업중지 명령', '중대재해처벌법 수사',
+         '특별감독 착수', '예방 교육 실시', '재발방지 대책 발표']
+
+QUERIES = [
+    ('추락', {'days': 180}),
+    ('추락 사망', {'days': 180}),
+    ('끼임사고', {}),
+    ('화학 -교육', {'days': 365}),
+    ('폭염', {'days': 30, 'sources': ['moel_press', 'labor_news']}),
+    ('', {'days': 7}),
+]
+
+
+def fill(archive: Archive, years: int, per_day: int = 100):
+    rng = random.Random(7)
+    today = now_kst()
+    for day in range(int(365 * years)):
+        date = (today - timedelta(days=day)).strftime('%Y.%m.%d')
+        for source in SOURCES:
+            items = [{
+                'title': f"{rng.choice(PLACES)} {rng.choice(EVENTS)} {rng.choice(TAILS)} ({day}-{i})",
+                'date': date,
+                'link': f"https://example.com/{source}/{day}/{i}",
+            } for i in range(per_day // len(SOURCES))]
+            archive.add_items(source, items)
+
+
+def main():
+    years = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'archive.sqlite3')
+        archive = Archive(path)
+        started = time.perf_counter()
+        fill(archive, years)
+        elapsed = time.perf_counter() - started
+        stats = archive.stats()
+        print(f"항목 {stats['items']:,}건 적재 {elapsed:.1f}초 "
+              f"({stats['items'] / elapsed:,.0f}건/초, 파일 {os.path.getsize(path) / 1e6:.0f}MB)")
+
+        print(f"\n{'검색':<36}{'일치':>10}{'상위100(ms)':>14}{'건수(ms)':>12}")
+        for query, options in QUERIES:
+            timings = []
+            for _ in range(5):
+                t = time.perf_counter()
+                archive.search(query, limit=100, **options)
+                timings.append(time.perf_counter() - t)
+            t = time.perf_counter()
+            total = archive.count(query, **options)
+            count_ms = (time.perf_counter() - t) * 1000
+            label = f"{query or '(전체)'} {options}"
+            print(f"{label:<36}{total:>10,}{sorted(timings)[2] * 1000:>14.1f}{count_ms:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+import 시간 벤치마크 - 앱 시작 시 불러오는 모듈의 콜드 스타트 비용 측정
+
+실행: python benchmarks/bench_import.py [반복횟수]
+매번 새 인터프리터에서 모듈을 import해 걸린 시간을 재고(인터프리터 기동 시간 제외),
+예전처럼 anthropic·playwright를 함께 즉시 import하는 경우와 비교한다.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# app.py가 시작할 때 불러오는 모듈
+APP_MODULES = ['scraper', 'collector', 'briefing_generator']
+# 지연 로드 전에는 import 시점에 함께 불러오던 모듈
+EAGER_MODULES = ['anthropic', 'playwright.sync_api']
+
+CASES = {
+    'scraper': ['scraper'],
+    'briefing_generator': ['briefing_generator'],
+    'app 시작 (지연 로드)': APP_MODULES,
+    'app 시작 (즉시 로드 재현)': APP_MODULES + EAGER_MODULES,
+}
+
+TIMER = """
+import sys, time
+started = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - started
+loaded = [m for m in {eager!r} if m in sys.modules]
+print(elapsed, ','.join(loaded))
+"""
+
+
+def time_import(modules, runs: int):
+    code = TIMER.format(modules=modules, eager=EAGER_MODULES)
+    times = []
+    loaded = ''
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', code], cwd=ROOT,
+                             capture_output=True, text=True, check=True).stdout.split()
+        times.append(float(out[0]))
+        loaded = out[1] if len(out) > 1 else ''
+    return times, loaded
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print(f"{'항목':<28}{'중앙값(ms)':>12}{'최소(ms)':>10}  함께 로드된 무거운 모듈")
+    medians = {}
+    for name, modules in CASES.items():
+        times, loaded = time_import(modules, runs)
+        medians[name] = statistics.median(times)
+        print(f"{name:<28}{medians[name] * 1000:>12.1f}{min(times) * 1000:>10.1f}  {loaded or '-'}")
+
+    lazy = medians['app 시작 (지연 로드)']
+    eager = medians['app 시작 (즉시 로드 재현)']
+    print(f"\n⚡ 시작 시간 {eager * 1000:.0f}ms → {lazy * 1000:.0f}ms "
+          f"({(eager - lazy) * 1000:.0f}ms, {1 - lazy / eager:.0%} 단축)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+항목 메모리 벤치마크 - 백필 규모 수집 결과를 dict로 둘 때와 NewsItem으로 둘 때 비교
+
+실행: python benchmarks/bench_memory.py [항목수]
+실제 사이트에서 나오는 형태(소스 5개, 날짜 반복, 소스 이름 반복)의 항목을 만들어
+tracemalloc으로 잰 메모리, JSON(필요하면 msgpack) 직렬화·역직렬화 시간과 크기를 출력한다.
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import models  # noqa: E402
+
+SOURCES = {
+    'moel_press': '고용노동부',
+    'kosha_notice': '산업안전포털',
+    'major_accident': '안전보건공단',
+    'labor_news': '매일노동뉴스',
+    'bigkinds_news': 'Bigkinds',
+}
+
+
+def raw_items(count: int):
+    """파서가 내놓는 것과 같은 dict 항목 (문자열은 항목마다 새로 만들어짐)"""
+    data = {key: [] for key in SOURCES}
+    keys = list(SOURCES)
+    for i in range(count):
+        key = keys[i % len(keys)]
+        data[key].append({
+            'title': f"건설현장 추락 사망사고 {i}번째 보도 - 안전조치 미흡",
+            'date': '2026.01.%02d' % (1 + i % 28),
+            'link': f"https://example.com/{key}/{i}",
+            'source': ''.join(SOURCES[key]),
+            'category': ''.join(key),
+            'is_new': i % 3 == 0,
+        })
+    return data
+
+
+def measure(build):
+    tracemalloc.start()
+    started = time.perf_counter()
+    value = build()
+    elapsed = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size, elapsed
+
+
+def timed(fn, runs: int = 3):
+    best = float('inf')
+    result = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    dicts, dict_bytes, _ = measure(lambda: raw_items(count))
+    items, item_bytes, convert = measure(lambda: models.as_results(raw_items(count)))
+
+    print(f"항목 {count:,}건")
+    print(f"{'형식':<14}{'메모리(MB)':>12}{'항목당(B)':>12}")
+    print(f"{'dict':<14}{dict_bytes / 1e6:>12.1f}{dict_bytes / count:>12.0f}")
+    print(f"{'NewsItem':<14}{item_bytes / 1e6:>12.1f}{item_bytes / count:>12.0f}"
+          f"   ({1 - item_bytes / dict_bytes:.0%} 절감, 생성·변환 {convert:.2f}초)")
+
+    print(f"\n{'직렬화':<22}{'쓰기(ms)':>10}{'읽기(ms)':>10}{'크기(KB)':>10}")
+    text, write = timed(lambda: json.dumps(dicts, ensure_ascii=False, indent=2))
+    _, read = timed(lambda: json.loads(text))
+    print(f"{'json.dumps(dict, 기존)':<22}{write * 1000:>10.0f}{read * 1000:>10.0f}"
+          f"{len(text.encode()) / 1024:>10.0f}")
+    text, write = timed(lambda: models.dumps(items))
+    _, read = timed(lambda: models.loads(text))
+    print(f"{'models.dumps':<22}{write * 1000:>10.0f}{read * 1000:>10.0f}"
+          f"{len(text.encode()) / 1024:>10.0f}")
+    if models.msgpack is not None:
+        blob, write = timed(lambda: models.pack(items))
+        _, read = timed(lambda: models.unpack(blob))
+        print(f"{'models.pack (msgpack)':<22}{write * 1000:>10.0f}{read * 1000:>10.0f}"
+              f"{len(blob) / 1024:>10.0f}")
+    else:
+        print("(msgpack 미설치 - pack/unpack은 JSON과 같음)")
+
+
+if __name__ == '__main__':
+    main()
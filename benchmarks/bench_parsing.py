@@ -0,0 +1,137 @@
+"""
+HTML 파싱 벤치마크 - 기존 BeautifulSoup(html.parser) 방식과 lxml 부분 파싱 비교
+
+실행: python benchmarks/bench_parsing.py [반복횟수]
+fixtures/ 의 저장된 목록 페이지를 소스별로 파싱해 결과가 같은지 확인하고 소요시간을 비교한다.
+"""
+
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from html_parser import parse_kosha_notice, parse_labor_news, parse_moel_press  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+# ----- 기존 방식 (scraper.py에서 쓰던 BeautifulSoup 코드) -----
+
+def legacy_moel_press(content: bytes):
+    soup = BeautifulSoup(content.decode('utf-8'), 'html.parser')
+    table = soup.find('table')
+    if not table:
+        return None
+    items = []
+    for row in table.find_all('tr')[1:][:15]:
+        cols = row.find_all('td')
+        if len(cols) < 4:
+            continue
+        title_col = None
+        for col in cols:
+            if col.find('a'):
+                title_col = col
+                break
+        if not title_col:
+            continue
+        link_tag = title_col.find('a')
+        title = link_tag.get_text(strip=True)
+        href = link_tag.get('href', '')
+        link = href if href.startswith('http') else \
+            "https://www.moel.go.kr/news/enews/report/" + href
+        date = cols[-2].get_text(strip=True) if len(cols) >= 2 else ''
+        keywords = ['안전', '산재', '중대재해', '보건', '재해', '사고', '위험', '근로', '노동']
+        if any(keyword in title for keyword in keywords):
+            items.append({'title': title, 'date': date, 'link': link, 'source': '고용노동부'})
+    return items
+
+
+def legacy_kosha_notice(content: bytes):
+    soup = BeautifulSoup(content.decode('utf-8'), 'html.parser')
+    table = soup.find('table')
+    if not table:
+        return None
+    items = []
+    for row in table.find_all('tr')[1:][:15]:
+        link_tag = row.find('a')
+        if not link_tag:
+            continue
+        title = link_tag.get_text(strip=True)
+        href = link_tag.get('href', '')
+        link = href if href.startswith('http') else "https://portal.kosha.or.kr" + href
+        date = ''
+        for td in row.find_all('td'):
+            text = td.get_text(strip=True)
+            if '.' in text and len(text) < 15:
+                date = text
+                break
+        items.append({'title': title, 'date': date, 'link': link, 'source': '산업안전포털'})
+    return items
+
+
+def legacy_labor_news(content: bytes):
+    soup = BeautifulSoup(content.decode('utf-8'), 'html.parser')
+    articles = []
+    for selector in ['.article-list .article-item', 'article',
+                     '.list-group .list-group-item', 'table tbody tr']:
+        articles = soup.select(selector)
+        if articles:
+            break
+    items = []
+    for article in articles[:15]:
+        title_tag = article.find('a') or article.select_one('.article-title a')
+        if not title_tag:
+            continue
+        href = title_tag.get('href', '')
+        if href.startswith('http'):
+            link = href
+        elif href.startswith('/'):
+            link = "https://www.labortoday.co.kr" + href
+        else:
+            link = "https://www.labortoday.co.kr/news/" + href
+        date_tag = article.select_one('.article-date') or article.find('time')
+        items.append({
+            'title': title_tag.get_text(strip=True),
+            'date': date_tag.get_text(strip=True) if date_tag else '',
+            'link': link,
+            'source': '매일노동뉴스',
+        })
+    return items
+
+
+CASES = [
+    ('moel_press', legacy_moel_press, parse_moel_press),
+    ('kosha_notice', legacy_kosha_notice, parse_kosha_notice),
+    ('labor_news', legacy_labor_news, parse_labor_news),
+]
+
+
+def _best_of(fn, content: bytes, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(content)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(repeat: int = 50):
+    print(f"{'소스':<14}{'크기':>9}{'기존(ms)':>11}{'lxml(ms)':>11}{'배속':>8}  결과")
+    for name, legacy, fast in CASES:
+        with open(os.path.join(FIXTURES, f'{name}.html'), 'rb') as f:
+            content = f.read()
+
+        same = legacy(content) == fast(content)
+        legacy_time = _best_of(legacy, content, repeat)
+        fast_time = _best_of(fast, content, repeat)
+        print(f"{name:<14}{len(content) // 1024:>7}KB{legacy_time * 1000:>11.2f}"
+              f"{fast_time * 1000:>11.2f}{legacy_time / fast_time:>7.1f}x  "
+              f"{'일치' if same else '불일치!'}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
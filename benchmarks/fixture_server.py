@@ -0,0 +1,78 @@
+"""
+벤치마크용 로컬 대체 서버 - 저장된 소스 페이지(fixtures/)를 로컬 HTTP로 제공
+
+각 소스는 /<소스키> 경로로 제공되며, latency를 주면 실제 사이트처럼 응답을 지연시킨다.
+*.json 파일은 검색 API 대역으로 GET/POST 모두 같은 응답을 준다.
+"""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.json': 'application/json; charset=utf-8',
+}
+
+
+class FixtureServer:
+    """fixtures/*.html, *.json 을 제공하는 로컬 서버 (with 문으로 사용)"""
+
+    def __init__(self, latency: float = 0.0, fixtures_dir: str = FIXTURES):
+        self.latency = latency
+        self.pages: Dict[str, Tuple[bytes, str]] = {}
+        for name in os.listdir(fixtures_dir):
+            stem, ext = os.path.splitext(name)
+            if ext in CONTENT_TYPES:
+                with open(os.path.join(fixtures_dir, name), 'rb') as f:
+                    self.pages['/' + stem] = (f.read(), CONTENT_TYPES[ext])
+        self.requests = 0
+        self._server = None
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                page = server.pages.get(self.path.split('?')[0])
+                if page is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body, content_type = page
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                self.rfile.read(length)
+                self.do_GET()
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def url(self, source: str) -> str:
+        return f'http://127.0.0.1:{self._server.server_port}/{source}'
+
+    def urls(self) -> Dict[str, str]:
+        return {path[1:]: self.url(path[1:]) for path in self.pages}
+
+    def __enter__(self):
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
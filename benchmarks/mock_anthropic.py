@@ -0,0 +1,46 @@
+"""
+벤치마크·테스트용 모의 Anthropic 클라이언트
+
+import할 때 환경 변수나 sys.path를 건드리지 않으므로 테스트(tests/conftest.py)에서도 쓴다.
+"""
+
+import json
+import time
+from types import SimpleNamespace
+
+
+class MockAnthropic:
+    """messages.create만 흉내 내는 모의 클라이언트 (네트워크 호출 없음)
+
+    cache_control이 붙은 system 블록은 API처럼 첫 호출에 캐시에 쓰고(cache_creation_input_tokens)
+    같은 내용이 다시 오면 캐시에서 읽은 것으로(cache_read_input_tokens) 사용량을 돌려준다.
+    토큰 수는 글자 수의 절반으로 어림한다.
+    """
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+        self.usages = []
+        self._cached = set()
+        self.messages = self
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.delay:
+            time.sleep(self.delay)
+        cache_read = cache_write = 0
+        system = kwargs.get('system') or []
+        if system and system[-1].get('cache_control'):
+            prefix = json.dumps(system, ensure_ascii=False, sort_keys=True)
+            if prefix in self._cached:
+                cache_read = len(prefix) // 2
+            else:
+                cache_write = len(prefix) // 2
+                self._cached.add(prefix)
+        prompt_chars = len(json.dumps(kwargs, ensure_ascii=False))
+        usage = SimpleNamespace(
+            input_tokens=prompt_chars // 2 - cache_read - cache_write, output_tokens=20,
+            cache_read_input_tokens=cache_read, cache_creation_input_tokens=cache_write,
+        )
+        self.usages.append(usage)
+        return SimpleNamespace(content=[SimpleNamespace(text="## 핵심 요약\n- 모의 브리핑\n")], usage=usage)
@@ -0,0 +1,240 @@
+"""
+오프라인 벤치마크 - 로컬 대체 서버와 모의 Anthropic 클라이언트로 전체 경로 측정
+
+실행: python benchmarks/offline_suite.py [--iterations 20] [--latency 0.05]
+                                         [--update-baseline] [--tolerance 0.25]
+
+fixtures/의 저장 페이지를 로컬 서버로 제공하고 SafetyNewsScraper의 소스별 메서드와
+BriefingGenerator.format_data_for_prompt / generate_briefing을 실행해
+지연시간 백분위수, 최대 RSS, 초당 처리 건수를 출력한다.
+baseline.json과 비교해 느려진 항목이 있으면 표시하고 종료 코드 1을 반환한다.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# 측정 대상은 실제 파싱 경로이므로 HTTP 캐시·수집 이력·XHR 레시피·셀렉터 학습·자료 보관소·브리핑 캐시는 끈다
+os.environ.setdefault('HTTP_CACHE_DISABLED', '1')
+os.environ.setdefault('SEEN_STORE_DISABLED', '1')
+os.environ.setdefault('XHR_RECIPES_DISABLED', '1')
+os.environ.setdefault('SELECTOR_CACHE_DISABLED', '1')
+os.environ.setdefault('ARCHIVE_DISABLED', '1')
+os.environ.setdefault('BRIEFING_CACHE_DISABLED', '1')
+os.environ.setdefault('TELEMETRY_JSONL', '0')
+
+from fixture_server import FixtureServer  # noqa: E402
+from mock_anthropic import MockAnthropic  # noqa: E402
+from briefing_generator import BriefingGenerator  # noqa: E402
+from dedup import deduplicate  # noqa: E402
+from keyword_matcher import rank_items  # noqa: E402
+from browser_pool import ensure_playwright_ready  # noqa: E402
+from collector import get_host_limiter  # noqa: E402
+import scraper as scraper_module  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+SCRAPER_CASES = {
+    'moel_press': lambda s: s.scrape_moel_press_release(),
+    'kosha_notice': lambda s: s.scrape_kosha_with_playwright(),
+    'major_accident': lambda s: s.scrape_major_accidents(),
+    'labor_news': lambda s: s.scrape_labor_news(),
+    'bigkinds_news': lambda s: s.search_bigkinds_news("산업안전 중대재해"),
+}
+BROWSER_SOURCES = {'major_accident'}
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    # Linux는 KB, macOS는 byte 단위
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def measure(run, iterations: int):
+    """run()은 처리 건수를 반환. 반복 측정 후 통계 반환"""
+    latencies = []
+    items = 0
+    for _ in range(iterations):
+        started = time.perf_counter()
+        items = run()
+        latencies.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    run()
+    _, py_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = sum(latencies)
+    return {
+        'items': items,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p90_ms': percentile(latencies, 90) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'items_per_sec': items * iterations / total if total else 0.0,
+        'py_peak_mb': py_peak / (1024 * 1024),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def browser_available() -> bool:
+    # 벤치마크 중에는 브라우저를 설치하지 않음
+    if not ensure_playwright_ready(install=False):
+        return False
+    try:
+        scraper_module.get_browser_pool().warm_up(timeout=60)
+        return True
+    except Exception:
+        return False
+
+
+def run_suite(iterations: int, latency: float):
+    results = {}
+    skipped = []
+    collected = {}
+
+    with FixtureServer(latency=latency) as server:
+        get_host_limiter().per_host['127.0.0.1'] = 0.0
+        urls = server.urls()
+        has_browser = browser_available()
+
+        for source, call in SCRAPER_CASES.items():
+            if source in BROWSER_SOURCES and not has_browser:
+                skipped.append(source)
+                continue
+            if source == 'kosha_notice' and not has_browser:
+                # Playwright가 없을 때 운영에서도 쓰는 requests 경로로 측정
+                call = lambda s: s.scrape_kosha_with_requests()  # noqa: E731
+
+            def run(call=call, source=source):
+                scraper = scraper_module.SafetyNewsScraper(urls=urls)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    call(scraper)
+                collected[source] = scraper.results[source]
+                return len(scraper.results[source])
+
+            results[f'scrape.{source}'] = measure(run, iterations)
+
+    # 프롬프트 생성 경로 (백필 규모를 흉내 내기 위해 수집 결과를 50배로 복제)
+    data = {key: items * 50 for key, items in collected.items()}
+    item_count = sum(len(v) for v in data.values())
+    client = MockAnthropic()
+    generator = BriefingGenerator(api_key='offline', client=client)
+
+    def run_format():
+        generator.format_data_for_prompt(data)
+        return item_count
+
+    def run_generate():
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator.generate_briefing(data)
+        return item_count
+
+    def run_dedup():
+        deduplicate(data)
+        return item_count
+
+    def run_rank():
+        rank_items(data, generator.max_items_per_source)
+        return item_count
+
+    results['dedup.deduplicate'] = measure(run_dedup, max(iterations, 20))
+    results['keywords.rank_items'] = measure(run_rank, max(iterations, 20))
+    results['briefing.format_data_for_prompt'] = measure(run_format, max(iterations, 20))
+    results['briefing.generate_briefing'] = measure(run_generate, max(iterations, 20))
+    # 두 번째 호출부터는 작성 지침(system 블록)이 캐시에서 읽혀야 함
+    usages = client.usages
+    prompt_tokens = sum(u.input_tokens + u.cache_read_input_tokens + u.cache_creation_input_tokens
+                        for u in usages)
+    results['briefing.generate_briefing']['cache_hits'] = sum(
+        1 for u in usages if u.cache_read_input_tokens)
+    results['briefing.generate_briefing']['cache_read_share'] = (
+        sum(u.cache_read_input_tokens for u in usages) / prompt_tokens if prompt_tokens else 0.0)
+    return results, skipped
+
+
+def compare(results, baseline, tolerance: float):
+    """기준 대비 p50이 tolerance 이상 느려졌거나 수집 건수가 줄어든 항목"""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        slower = current['p50_ms'] > base['p50_ms'] * (1 + tolerance) \
+            and current['p50_ms'] - base['p50_ms'] > 1.0
+        fewer = current['items'] < base['items']
+        if slower or fewer:
+            regressions.append((name, base, current))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 수집/프롬프트 벤치마크")
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help="로컬 서버 응답 지연(초)")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="허용 성능 저하 비율 (기본 25%%)")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true')
+    args = parser.parse_args()
+
+    results, skipped = run_suite(args.iterations, args.latency)
+
+    print(f"{'항목':<34}{'건수':>6}{'p50(ms)':>10}{'p90(ms)':>10}{'p99(ms)':>10}"
+          f"{'건/초':>10}{'py최대(MB)':>12}{'RSS(MB)':>9}")
+    for name, r in results.items():
+        rss = f"{r['peak_rss_mb']:.0f}" if r['peak_rss_mb'] is not None else '-'
+        print(f"{name:<34}{r['items']:>6}{r['p50_ms']:>10.2f}{r['p90_ms']:>10.2f}"
+              f"{r['p99_ms']:>10.2f}{r['items_per_sec']:>10.0f}{r['py_peak_mb']:>12.2f}{rss:>9}")
+    if skipped:
+        print(f"⏭️  브라우저 없음 - 건너뜀: {', '.join(skipped)}")
+    generate = results.get('briefing.generate_briefing')
+    if generate:
+        print(f"🗄️  프롬프트 캐시(모의): 적중 {generate['cache_hits']}회, "
+              f"입력 토큰의 {generate['cache_read_share']:.0%}를 캐시에서 읽음")
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"💾 기준값 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("ℹ️  기준값 없음 (--update-baseline으로 생성)")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    for name, base, current in regressions:
+        print(f"⚠️  성능 저하: {name} p50 {base['p50_ms']:.2f} → {current['p50_ms']:.2f}ms, "
+              f"건수 {base['items']} → {current['items']}")
+    if not regressions:
+        print("✅ 기준 대비 성능 저하 없음")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
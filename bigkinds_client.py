@@ -0,0 +1,158 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+Bigkinds 검색 모듈 - 화면 조작 대신 사이트의 검색 API(JSON)를 공용 HTTP 연결로 호출
+"""
+
+import contextvars
+import math
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from http_client import HttpTransport, get_transport
+
+
+BIGKINDS_SEARCH_URL = "https://www.bigkinds.or.kr/api/news/search.do"
+BIGKINDS_DETAIL_URL = "https://www.bigkinds.or.kr/v2/news/newsDetailView.do?newsId={news_id}"
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_DIGITS_RE = re.compile(r'\D')
+
+
+def normalize_date(value: str) -> str:
+    """'20240115', '2024/01/15', '2024.01.15 10:00' 등을 'YYYY-MM-DD'로"""
+    digits = _DIGITS_RE.sub('', value or '')[:8]
+    if len(digits) < 8:
+        return value or ''
+    return f"{digits[:4]}-{digits[4:6]}-{digits[6:8]}"
+
+
+def normalize_item(raw: Dict) -> Dict:
+    """검색 결과 1건을 수집 항목 형식으로 변환"""
+    news_id = raw.get('NEWS_ID', '')
+    link = raw.get('PROVIDER_LINK_PAGE') or (
+        BIGKINDS_DETAIL_URL.format(news_id=news_id) if news_id else ''
+    )
+    return {
+        'title': _TAG_RE.sub('', raw.get('TITLE', '')).strip(),
+        'date': normalize_date(raw.get('DATE', '')),
+        'link': link,
+        'source': raw.get('PROVIDER') or 'Bigkinds',
+        'news_id': news_id,
+    }
+
+
+class BigkindsClient:
+    """Bigkinds 검색 API 클라이언트
+
+    - 기간(start_date ~ end_date) 검색, 여러 검색어 동시 조회
+    - 검색어마다 첫 페이지로 전체 건수를 확인한 뒤 나머지 페이지를 병렬 요청
+    - 결과는 도착하는 대로 생성기로 내보내며 NEWS_ID 기준으로 중복 제거
+    """
+
+    def __init__(self, transport: Optional[HttpTransport] = None,
+                 search_url: str = BIGKINDS_SEARCH_URL,
+                 page_size: int = 10, max_pages: int = 3, max_workers: int = 4):
+        self.transport = transport or get_transport()
+        self.search_url = search_url
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.max_workers = max_workers
+
+    def _payload(self, keyword: str, start_date: str, end_date: str, page: int) -> Dict:
+        return {
+            'indexName': 'news',
+            'searchKey': keyword,
+            'searchKeys': [{}],
+            'searchFilterType': '1',
+            'searchScopeType': '1',
+            'searchSortType': 'date',
+            'sortMethod': 'date',
+            'startDate': start_date,
+            'endDate': end_date,
+            'newsIds': [],
+            'categoryCodes': [],
+            'providerCodes': [],
+            'incidentCodes': [],
+            'dateCodes': [],
+            'editorialIs': False,
+            'startNo': page,             # 페이지 번호 (1부터)
+            'resultNumber': self.page_size,
+            'isTmUsable': False,
+            'isNotTmUsable': False,
+        }
+
+    def search_page(self, keyword: str, start_date: str, end_date: str,
+                    page: int = 1) -> Tuple[List[Dict], int]:
+        """한 페이지 검색. (정규화된 항목 목록, 전체 건수) 반환"""
+        response = self.transport.post(
+            self.search_url,
+            json=self._payload(keyword, start_date, end_date, page),
+            headers={
+                'Accept': 'application/json',
+                'X-Requested-With': 'XMLHttpRequest',
+                'Referer': 'https://www.bigkinds.or.kr/v2/news/search.do',
+            },
+            timeout=15, deadline=25,
+        )
+        body = response.json()
+        if 'resultList' not in body:
+            raise ValueError("검색 API 응답에 resultList가 없습니다")
+        items = [normalize_item(raw) for raw in body.get('resultList') or []]
+        return items, int(body.get('totalCount') or len(items))
+
+    def search(self, queries: Union[str, List[str]], start_date: Optional[str] = None,
+               end_date: Optional[str] = None) -> Iterator[Dict]:
+        """검색어별 결과를 도착 순서대로 생성 (기본 기간: 어제 ~ 오늘)
+
+        아무 결과도 내보내기 전에 모든 요청이 실패하면 첫 오류를 다시 발생시킨다.
+        """
+        if isinstance(queries, str):
+            queries = [queries]
+        today = datetime.now()
+        start_date = start_date or (today - timedelta(days=1)).strftime("%Y-%m-%d")
+        end_date = end_date or today.strftime("%Y-%m-%d")
+
+        seen = set()
+        yielded = 0
+        errors = []
+        executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                      thread_name_prefix='bigkinds')
+        try:
+            pending = {
+                executor.submit(contextvars.copy_context().run,
+                                self.search_page, q, start_date, end_date, 1): (q, 1)
+                for q in queries
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    keyword, page = pending.pop(future)
+                    try:
+                        items, total = future.result()
+                    except Exception as e:
+                        errors.append(e)
+                        continue
+
+                    if page == 1:
+                        pages = min(self.max_pages, math.ceil(total / self.page_size))
+                        for next_page in range(2, pages + 1):
+                            pending[executor.submit(
+                                contextvars.copy_context().run,
+                                self.search_page, keyword, start_date, end_date, next_page
+                            )] = (keyword, next_page)
+
+                    for item in items:
+                        key = item['news_id'] or item['link'] or item['title']
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        yielded += 1
+                        yield item
+        finally:
+            # 호출자가 중간에 멈추면 남은 페이지 요청은 취소
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if errors and not yielded:
+            raise errors[0]
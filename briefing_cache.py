@@ -0,0 +1,169 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+브리핑 결과 캐시 - 같은 자료·모델·프롬프트로 만든 브리핑을 다시 쓰고 Claude 호출을 한 번으로 묶음
+
+키는 정규화한 프롬프트 자료, 날짜, 모델, 프롬프트 버전의 해시다(내용 주소). 항목은 ttl이 지나면
+버리고, max_entries를 넘으면 가장 오래 쓰지 않은 것부터 지운다(LRU). SQLite 파일이라 앱의
+모든 세션과 백그라운드 실행이 함께 쓴다. 같은 키의 요청이 동시에 오면 한 스레드만 생성하고
+나머지는 그 결과를 기다린다(single-flight, 프로세스 안에서).
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Callable, Dict, Optional, Tuple
+
+from storage import data_path
+
+
+_BLANK_LINES = re.compile(r'\n{3,}')
+
+
+def normalize_prompt_data(text: str) -> str:
+    """공백·유니코드 표기 차이만 있는 자료는 같은 키가 되도록"""
+    text = unicodedata.normalize('NFC', text)
+    lines = [' '.join(line.split()) for line in text.splitlines()]
+    return _BLANK_LINES.sub('\n\n', '\n'.join(lines)).strip()
+
+
+def cache_key(data_text: str, today: str, model: str, prompt_version: str) -> str:
+    basis = '\x00'.join([prompt_version, model, today, normalize_prompt_data(data_text)])
+    return hashlib.sha256(basis.encode('utf-8')).hexdigest()
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[str] = None
+        self.created_at: Optional[float] = None
+
+
+class BriefingCache:
+    """SQLite 기반 브리핑 결과 캐시"""
+
+    def __init__(self, path: str, ttl: float = 12 * 3600, max_entries: int = 100):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._flights_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS briefings (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                briefing TEXT,
+                created_at REAL,
+                last_used REAL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS briefings_last_used ON briefings(last_used)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """(브리핑, 만든 시각) - 없거나 ttl이 지났으면 None"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT briefing, created_at FROM briefings WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM briefings WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE briefings SET last_used = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            return row[0], row[1]
+
+    def put(self, key: str, briefing: str, model: str = ''):
+        now = time.time()
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO briefings VALUES (?, ?, ?, ?, ?)",
+                               (key, model, briefing, now, now))
+            # 만료된 것과 max_entries를 넘는 오래 안 쓴 것 정리
+            self._conn.execute("DELETE FROM briefings WHERE created_at < ?", (now - self.ttl,))
+            self._conn.execute("""
+                DELETE FROM briefings WHERE key IN (
+                    SELECT key FROM briefings ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,))
+            self._conn.commit()
+
+    def get_or_create(self, key: str, create: Callable[[], Optional[str]], model: str = '',
+                      reuse: bool = True) -> Tuple[Optional[str], Optional[float]]:
+        """캐시에 있으면 그대로, 없으면 create()로 만들어 저장
+
+        반환: (브리핑, 캐시에서 꺼냈으면 만든 시각 / 새로 만들었으면 None).
+        create()가 None을 돌려주면(실패) 저장하지 않는다. reuse=False면 캐시를 보지 않고
+        새로 만들어 덮어쓴다. 같은 키를 만드는 중이면 그 결과를 기다려 함께 쓴다.
+        """
+        if reuse:
+            cached = self.get(key)
+            if cached is not None:
+                self._hits += 1
+                return cached
+
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.result is None:      # 먼저 시작한 생성이 실패 - 같은 실패를 돌려줌
+                return None, None
+            self._hits += 1
+            return flight.result, flight.created_at
+
+        try:
+            # 앞선 생성이 캐시 확인과 잠금 사이에 끝났을 수 있음
+            cached = self.get(key) if reuse else None
+            if cached is not None:
+                self._hits += 1
+                flight.result, created_at = cached
+                flight.created_at = created_at
+                return cached
+            self._misses += 1
+            flight.result = create()
+            flight.created_at = time.time()
+            if flight.result is not None:
+                self.put(key, flight.result, model)
+        finally:
+            with self._flights_lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+        return flight.result, None
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM briefings").fetchone()[0]
+        return {'hits': self._hits, 'misses': self._misses, 'entries': entries}
+
+
+_cache: Optional[BriefingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_briefing_cache() -> Optional[BriefingCache]:
+    """프로세스 공용 브리핑 캐시 (BRIEFING_CACHE_DISABLED=1이면 None)"""
+    global _cache
+    if os.getenv('BRIEFING_CACHE_DISABLED', '') in ('1', 'true'):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = BriefingCache(
+                data_path('briefing_cache.sqlite3'),
+                ttl=float(os.getenv('BRIEFING_CACHE_TTL_HOURS', '12')) * 3600,
+                max_entries=int(os.getenv('BRIEFING_CACHE_MAX', '100')),
+            )
+        return _cache
@@ -0,0 +1,181 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+백그라운드 실행 - 정해진 시각에 수집 → 브리핑 생성을 미리 해 두고 게시 저장소(briefing_store)에 올림
+
+    python briefing_daemon.py                     # 매일 07:00(KST) 생성 + 60분마다 갱신
+    python briefing_daemon.py --once              # 한 번만 실행
+    python briefing_daemon.py --times 07:00,13:00 --refresh-minutes 0
+
+정기 실행(--times)은 항상 브리핑을 새로 만든다. 그 사이의 갱신 실행은 수집만 다시 하고,
+프롬프트에 들어갈 자료가 지난 게시본과 같으면 Claude를 부르지 않고 수집 결과만 바꾼다.
+앱과 같은 BRIEFING_DATA_DIR(또는 BRIEFING_STORE_DIR)을 쓰면 앱이 게시본을 바로 보여 준다.
+"""
+
+import argparse
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from briefing_generator import BriefingGenerator
+from briefing_store import BriefingStore, PublishedBriefing, fingerprint, get_briefing_store
+from date_utils import now_kst
+from scraper import SafetyNewsScraper
+from telemetry import span
+
+
+DEFAULT_KEYWORDS = "산업안전 중대재해"
+
+
+@dataclass
+class Schedule:
+    """매일 정기 실행 시각(KST)과 그 사이 갱신 간격"""
+    times: List[Tuple[int, int]]
+    refresh_minutes: int = 60          # 0이면 갱신 안 함
+
+    def __post_init__(self):
+        # 실행할 시각이 하나도 없으면 next_run이 정할 수 없음
+        if not self.times and not self.refresh_minutes:
+            raise ValueError("정기 실행 시각(--times)이나 갱신 간격(--refresh-minutes) 중 하나는 있어야 합니다")
+        for hour, minute in self.times:
+            if not (0 <= hour < 24 and 0 <= minute < 60):
+                raise ValueError(f"잘못된 시각: {hour}:{minute:02d}")
+
+    @classmethod
+    def parse(cls, times: str, refresh_minutes: int = 60) -> 'Schedule':
+        """'07:00,13:30' 형식 (형식이 틀리거나 실행할 시각이 없으면 ValueError)"""
+        parsed = []
+        for value in times.split(','):
+            if value.strip():
+                try:
+                    hour, minute = value.strip().split(':')
+                    parsed.append((int(hour), int(minute)))
+                except ValueError:
+                    raise ValueError(f"시각 형식은 HH:MM 입니다: {value.strip()!r}") from None
+        return cls(sorted(parsed), max(refresh_minutes, 0))
+
+    def _daily(self, now: datetime) -> List[datetime]:
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return [midnight + timedelta(days=day, hours=hour, minutes=minute)
+                for day in (-1, 0, 1) for hour, minute in self.times]
+
+    def last_daily(self, now: datetime) -> Optional[datetime]:
+        """지금까지 지난 가장 최근 정기 실행 시각"""
+        past = [when for when in self._daily(now) if when <= now]
+        return max(past) if past else None
+
+    def next_run(self, now: datetime) -> Tuple[datetime, bool]:
+        """(다음 실행 시각, 정기 실행 여부)"""
+        upcoming = [(when, True) for when in self._daily(now) if when > now]
+        if self.refresh_minutes:
+            midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            elapsed = (now - midnight) // timedelta(minutes=self.refresh_minutes) + 1
+            upcoming.append((midnight + elapsed * timedelta(minutes=self.refresh_minutes), False))
+        # 같은 시각이면 정기 실행이 우선
+        return min(upcoming, key=lambda run: (run[0], not run[1]))
+
+
+def run_once(sources: Optional[List[str]] = None, keywords: str = DEFAULT_KEYWORDS,
+             force: bool = False, store: Optional[BriefingStore] = None) -> Optional[PublishedBriefing]:
+    """수집하고 필요하면 브리핑을 만들어 게시 (다른 프로세스가 갱신 중이면 None)"""
+    store = store or get_briefing_store()
+    with store.refresh_lock() as locked:
+        if not locked:
+            print("⏳ 다른 프로세스가 갱신 중 - 이번 실행은 건너뜀")
+            return None
+        with span('daemon.run', forced=force) as s:
+            scraper = SafetyNewsScraper()
+            data = scraper.run_all_scrapers(sources, keywords)
+            generator = BriefingGenerator(reuse_cached=not force)
+            digest = fingerprint(generator.format_data_for_prompt(
+                data, per_source=generator.max_items_per_source))
+
+            latest = store.latest()
+            if not force and latest is not None and latest.fingerprint == digest:
+                store.publish(latest.briefing_path, data, digest, sources or [],
+                              generated_at=latest.generated_at)
+                s.set(generated=False)
+                print("⏭️ 프롬프트 자료 변화 없음 - 브리핑은 그대로 두고 수집 결과만 갱신")
+                return store.latest()
+
+            briefing, path = generator.generate_and_save(data, store.briefing_path())
+            if not briefing or not path:
+                s.error = 'BriefingFailed'
+                return None
+            store.publish(path, data, digest, sources or [])
+            s.set(generated=True)
+            print(f"📢 브리핑 게시: {path}")
+            return store.latest()
+
+
+def _sleep_until(when: datetime):
+    # 절전 등으로 시계가 건너뛸 수 있어 짧게 나눠 잔다
+    while True:
+        remaining = (when - now_kst()).total_seconds()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, 60))
+
+
+def serve(schedule: Schedule, sources: Optional[List[str]] = None,
+          keywords: str = DEFAULT_KEYWORDS, store: Optional[BriefingStore] = None):
+    """일정에 따라 계속 실행 (Ctrl+C로 종료)"""
+    store = store or get_briefing_store()
+    times = ', '.join(f"{hour:02d}:{minute:02d}" for hour, minute in schedule.times) or '없음'
+    refresh = f"{schedule.refresh_minutes}분마다" if schedule.refresh_minutes else "안 함"
+    print(f"🗓️ 정기 실행 {times} (KST), 갱신 {refresh} - 게시 위치 {store.directory}")
+
+    # 꺼져 있는 동안 지난 정기 실행이 있으면 바로 실행
+    latest = store.latest()
+    last_daily = schedule.last_daily(now_kst())
+    if latest is None or (last_daily is not None
+                          and datetime.fromisoformat(latest.generated_at) < last_daily):
+        try:
+            run_once(sources, keywords, force=True, store=store)
+        except Exception as e:
+            print(f"❌ 실행 실패: {e}")
+
+    while True:
+        when, daily = schedule.next_run(now_kst())
+        print(f"🕖 다음 실행: {when:%m-%d %H:%M} ({'정기' if daily else '갱신'})")
+        _sleep_until(when)
+        try:
+            run_once(sources, keywords, force=daily, store=store)
+        except Exception as e:
+            print(f"❌ 실행 실패: {e}")
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="일일 브리핑 백그라운드 실행")
+    parser.add_argument('--times', default=os.getenv('BRIEFING_TIMES', '07:00'),
+                        help="매일 브리핑을 새로 만드는 시각 (KST, 쉼표로 구분)")
+    parser.add_argument('--refresh-minutes', type=int,
+                        default=int(os.getenv('BRIEFING_REFRESH_MINUTES', '60')),
+                        help="정기 실행 사이 갱신 간격 (0이면 갱신 안 함)")
+    parser.add_argument('--sources', default=os.getenv('BRIEFING_SOURCES', ''),
+                        help="수집할 소스 키 (쉼표로 구분, 기본: 전체)")
+    parser.add_argument('--keywords', default=os.getenv('BRIEFING_KEYWORDS', DEFAULT_KEYWORDS))
+    parser.add_argument('--once', action='store_true', help="한 번만 실행하고 종료")
+    parser.add_argument('--force', action='store_true', help="자료가 같아도 브리핑을 새로 생성 (--once와 함께)")
+    args = parser.parse_args()
+
+    sources = [s.strip() for s in args.sources.split(',') if s.strip()] or None
+    if args.once:
+        run_once(sources, args.keywords, force=args.force)
+        return
+    try:
+        schedule = Schedule.parse(args.times, args.refresh_minutes)
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        serve(schedule, sources, args.keywords)
+    except KeyboardInterrupt:
+        print("\n👋 종료")
+
+
+if __name__ == "__main__":
+    main()
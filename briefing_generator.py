@@ -3,64 +3,25 @@ AI 브리핑 생성 모듈
 Claude API를 활용하여 수집된 데이터를 일일 동향 브리핑으로 변환
 """
 
-import anthropic
+import hashlib
 import os
+import sqlite3
+import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 import json
 
+from archive import get_archive
+from briefing_cache import cache_key, get_briefing_cache
+from date_utils import recent_items
+from keyword_matcher import rank_items
+from models import NewsItem, as_results
+from telemetry import current_span, get_telemetry, span
 
-class BriefingGenerator:
-    """AI 기반 브리핑 생성기"""
-    
-    def __init__(self, api_key: str = None):
-        self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
-        self.client = anthropic.Anthropic(api_key=self.api_key)
-        self.model = "claude-sonnet-4-20250514"
-    
-    def format_data_for_prompt(self, data: Dict[str, List[Dict]]) -> str:
-        """수집된 데이터를 프롬프트용 텍스트로 변환"""
-        
-        formatted_text = "# 오늘 수집된 노동안전보건 동향 자료\n\n"
-        
-        # 고용노동부 보도자료
-        if data.get('moel_press'):
-            formatted_text += "## 1. 고용노동부 보도자료\n"
-            for item in data['moel_press']:
-                formatted_text += f"- [{item['date']}] {item['title']}\n"
-                formatted_text += f"  링크: {item['link']}\n\n"
-        
-        # 산업안전포털 공지사항
-        if data.get('kosha_notice'):
-            formatted_text += "## 2. 산업안전포털 공지사항\n"
-            for item in data['kosha_notice']:
-                formatted_text += f"- [{item['date']}] {item['title']}\n"
-                formatted_text += f"  링크: {item['link']}\n\n"
-        
-        # 중대재해 발생알림
-        if data.get('major_accident'):
-            formatted_text += "## 3. 중대재해 발생알림\n"
-            for item in data['major_accident']:
-                formatted_text += f"- [{item['date']}] {item['title']}\n\n"
-        
-        # 매일노동뉴스
-        if data.get('labor_news'):
-            formatted_text += "## 4. 매일노동뉴스 안전과 건강\n"
-            for item in data['labor_news']:
-                formatted_text += f"- [{item['date']}] {item['title']}\n"
-                formatted_text += f"  링크: {item['link']}\n\n"
-        
-        return formatted_text
-    
-    def generate_briefing(self, scraped_data: Dict[str, List[Dict]]) -> str:
-        """수집된 데이터를 기반으로 브리핑 생성"""
-        
-        today = datetime.now().strftime("%Y년 %m월 %d일")
-        data_text = self.format_data_for_prompt(scraped_data)
-        
-        prompt = f"""당신은 **산업안전보건 전문가**입니다. 다음 자료를 바탕으로 새움터(노동안전보건 민간단체) 실무자들을 위한 일일 동향 브리핑을 작성해주세요.
 
-{data_text}
+# 매번 같은 작성 지침은 system 블록으로 앞에 두어 API의 프롬프트 캐시(접두부 캐시)에 걸리게 하고,
+# 날마다 바뀌는 자료와 날짜는 그 뒤 user 메시지로 보낸다.
+BRIEFING_GUIDE = """당신은 **산업안전보건 전문가**입니다. 사용자가 보내는 자료를 바탕으로 새움터(노동안전보건 민간단체) 실무자들을 위한 일일 동향 브리핑을 작성합니다.
 
 ## 브리핑 작성 가이드
 
@@ -85,6 +46,12 @@ class BriefingGenerator:
    - 새움터 활동에 참고할 만한 정보
    - 주의가 필요한 안전보건 현안
 
+### 자료 형식
+- 자료는 출처별 절(예: "## 1. 고용노동부 보도자료")로 나뉘고, 항목은 "- [날짜] 제목"과 링크로 되어 있습니다
+- 출처마다 안전보건 관련도가 높은 항목부터 실려 있습니다
+- "함께 보도:" 줄은 같은 소식을 다룬 다른 매체입니다. 한 항목으로 묶어 다루고 출처를 함께 적으세요
+- 날짜는 한국 시간 기준이며 최근 며칠 안의 자료만 들어 있습니다
+
 ### 작성 원칙
 - 명확하고 전문적인 톤 유지
 - 불필요한 서론/결론 없이 핵심만 전달
@@ -95,21 +62,139 @@ class BriefingGenerator:
 - 일반 고용/임금 이슈 (안전보건 무관)
 - 노사관계 일반론
 - 정치적 논평
-
-오늘 날짜: {today}
 """
+
+BRIEFING_REQUEST = "다음 자료로 오늘의 브리핑을 작성해주세요.\n\n{data_text}\n오늘 날짜: {today}"
+
+# 브리핑 결과 캐시 키에 들어감 - 지침이나 요청 문구가 바뀌면 예전 결과를 쓰지 않음
+PROMPT_VERSION = hashlib.sha256((BRIEFING_GUIDE + BRIEFING_REQUEST).encode('utf-8')).hexdigest()[:12]
+
+
+class BriefingGenerator:
+    """AI 기반 브리핑 생성기"""
+    
+    def __init__(self, api_key: str = None, client=None, max_items_per_source: int = 15,
+                 recency_days: Optional[float] = None, reuse_cached: bool = True):
+        self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
+        # client를 넘기면 그대로 사용 (벤치마크의 모의 클라이언트 등)
+        self._client = client
+        self.model = "claude-sonnet-4-20250514"
+        # 브리핑 프롬프트에는 소스별로 관련도 높은 항목만 이만큼 넣음
+        self.max_items_per_source = max_items_per_source
+        # 최근 며칠(오늘 0시 기준) 안의 항목만 프롬프트에 넣음 (주말을 넘기도록 기본 3일)
+        if recency_days is None:
+            recency_days = float(os.getenv('RECENCY_DAYS', '3'))
+        self.recency_days = recency_days if recency_days >= 0 else None
+        self.stale_dropped = 0
+        # 같은 자료·모델·프롬프트로 만든 브리핑이 캐시에 있으면 다시 씀 (False면 새로 만들어 덮어씀)
+        self.reuse_cached = reuse_cached
+        self.cache_hit = False
+    
+    @property
+    def client(self):
+        """Anthropic 클라이언트 (anthropic 패키지는 import가 무거워 첫 사용 때 로드)"""
+        if self._client is None:
+            import anthropic
+            self._client = anthropic.Anthropic(api_key=self.api_key)
+        return self._client
+    
+    @staticmethod
+    def _alternates_line(item: NewsItem) -> str:
+        """유사 제목 병합(dedup)으로 합쳐진 다른 출처"""
+        if not item.alternates:
+            return ""
+        sources = list(dict.fromkeys(alt['source'] for alt in item.alternates if alt.get('source')))
+        return f"  함께 보도: {', '.join(sources)}\n" if sources else ""
+    
+    def format_data_for_prompt(self, data: Dict[str, List[NewsItem]],
+                               only_new: bool = True,
+                               per_source: Optional[int] = None) -> str:
+        """수집된 데이터를 프롬프트용 텍스트로 변환
+        
+        only_new면 이전 실행에서 이미 다룬 항목(is_new=False)은 제외한다.
+        날짜가 recency_days일보다 오래된 항목도 빼고(stale_dropped에 건수 기록),
+        소스마다 제목 관련도(keyword_matcher) 높은 순으로 싣되 per_source를 주면 그만큼만 싣는다.
+        """
+        
+        data = as_results(data)   # 저장해 둔 JSON(dict 목록)도 받음
+        if only_new:
+            data = {key: [item for item in items if item.fresh]
+                    for key, items in data.items()}
+        data, self.stale_dropped = recent_items(data, self.recency_days)
+        data = rank_items(data, per_source)
+        
+        formatted_text = "# 오늘 수집된 노동안전보건 동향 자료\n\n"
+        
+        # 고용노동부 보도자료
+        if data.get('moel_press'):
+            formatted_text += "## 1. 고용노동부 보도자료\n"
+            for item in data['moel_press']:
+                formatted_text += f"- [{item.date}] {item.title}\n"
+                formatted_text += self._alternates_line(item)
+                formatted_text += f"  링크: {item.link}\n\n"
         
+        # 산업안전포털 공지사항
+        if data.get('kosha_notice'):
+            formatted_text += "## 2. 산업안전포털 공지사항\n"
+            for item in data['kosha_notice']:
+                formatted_text += f"- [{item.date}] {item.title}\n"
+                formatted_text += self._alternates_line(item)
+                formatted_text += f"  링크: {item.link}\n\n"
+        
+        # 중대재해 발생알림
+        if data.get('major_accident'):
+            formatted_text += "## 3. 중대재해 발생알림\n"
+            for item in data['major_accident']:
+                formatted_text += f"- [{item.date}] {item.title}\n"
+                formatted_text += self._alternates_line(item) + "\n"
+        
+        # 매일노동뉴스
+        if data.get('labor_news'):
+            formatted_text += "## 4. 매일노동뉴스 안전과 건강\n"
+            for item in data['labor_news']:
+                formatted_text += f"- [{item.date}] {item.title}\n"
+                formatted_text += self._alternates_line(item)
+                formatted_text += f"  링크: {item.link}\n\n"
+        
+        return formatted_text
+    
+    def generate_briefing(self, scraped_data: Dict[str, List[NewsItem]]) -> str:
+        """수집된 데이터를 기반으로 브리핑 생성"""
+        with span('briefing.generate', model=self.model):
+            return self._generate_briefing(scraped_data)
+    
+    def _generate_briefing(self, scraped_data: Dict[str, List[NewsItem]]) -> str:
+        today = datetime.now().strftime("%Y년 %m월 %d일")
+        with span('briefing.format') as s:
+            data_text = self.format_data_for_prompt(scraped_data, per_source=self.max_items_per_source)
+            s.set(chars=len(data_text), stale_dropped=self.stale_dropped)
+        if self.stale_dropped:
+            print(f"🗓️ 최근 {self.recency_days:g}일보다 오래된 항목 {self.stale_dropped}건 제외")
+        
+        cache = get_briefing_cache()
+        if cache is None:
+            briefing, cached_at = self._call_llm(data_text, today), None
+        else:
+            key = cache_key(data_text, today, self.model, PROMPT_VERSION)
+            briefing, cached_at = cache.get_or_create(
+                key, lambda: self._call_llm(data_text, today), self.model, reuse=self.reuse_cached)
+        
+        self.cache_hit = cached_at is not None
+        current_span().set(cache='hit' if self.cache_hit else 'miss')
+        if self.cache_hit:
+            print(f"♻️ 같은 자료로 {(time.time() - cached_at) / 60:.0f}분 전에 만든 브리핑 재사용 "
+                  f"(API 호출 생략)")
+        elif briefing:
+            self._archive(briefing, scraped_data)
+        return briefing
+    
+    def _call_llm(self, data_text: str, today: str) -> Optional[str]:
         try:
             print("🤖 AI 브리핑 생성 중...")
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=4000,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
+            with span('llm.call', model=self.model) as s:
+                response = self.client.messages.create(**self.build_request(data_text, today))
+                self._record_usage(s, response)
             
             briefing = response.content[0].text
             print("✅ 브리핑 생성 완료!")
@@ -120,6 +205,53 @@ class BriefingGenerator:
             print(f"❌ 브리핑 생성 실패: {e}")
             return None
     
+    def build_request(self, data_text: str, today: str) -> Dict:
+        """messages.create 인자 (지침 system 블록에 캐시 표시, PROMPT_CACHE_DISABLED=1이면 생략)"""
+        system = {"type": "text", "text": BRIEFING_GUIDE}
+        if os.getenv('PROMPT_CACHE_DISABLED') != '1':
+            system["cache_control"] = {"type": "ephemeral"}
+        return {
+            "model": self.model,
+            "max_tokens": 4000,
+            "system": [system],
+            "messages": [{
+                "role": "user",
+                "content": BRIEFING_REQUEST.format(data_text=data_text, today=today),
+            }],
+        }
+    
+    def _archive(self, briefing: str, scraped_data: Dict[str, List[NewsItem]]):
+        """생성한 브리핑을 자료 보관소에 추가"""
+        archive = get_archive()
+        if archive is None:
+            return
+        try:
+            archive.add_briefing(briefing, self.model, sum(len(v) for v in scraped_data.values()))
+        except sqlite3.Error as e:
+            print(f"⚠️ 브리핑 보관 실패: {e}")
+    
+    @staticmethod
+    def _record_usage(s, response):
+        """응답의 입력·출력·프롬프트 캐시 토큰 수를 구간과 누적 카운터에 기록
+
+        input_tokens는 캐시에서 읽거나 캐시에 쓴 토큰을 뺀 나머지다.
+        """
+        usage = getattr(response, 'usage', None)
+        if usage is None:
+            return
+        cache_read = getattr(usage, 'cache_read_input_tokens', None) or 0
+        cache_write = getattr(usage, 'cache_creation_input_tokens', None) or 0
+        s.set(input_tokens=usage.input_tokens, output_tokens=usage.output_tokens,
+              cache_read_tokens=cache_read, cache_write_tokens=cache_write)
+        if cache_read:
+            print(f"🗄️ 프롬프트 캐시 적중: {cache_read}토큰")
+        telemetry = get_telemetry()
+        if telemetry is not None:
+            telemetry.count('llm_tokens', usage.input_tokens, direction='input')
+            telemetry.count('llm_tokens', usage.output_tokens, direction='output')
+            telemetry.count('llm_tokens', cache_read, direction='cache_read')
+            telemetry.count('llm_tokens', cache_write, direction='cache_write')
+    
     def save_briefing(self, briefing: str, output_path: str = None):
         """브리핑을 파일로 저장"""
         
@@ -136,7 +268,7 @@ class BriefingGenerator:
             print(f"❌ 파일 저장 실패: {e}")
             return None
     
-    def generate_and_save(self, scraped_data: Dict[str, List[Dict]], 
+    def generate_and_save(self, scraped_data: Dict[str, List[NewsItem]], 
                          output_path: str = None) -> str:
         """브리핑 생성 및 저장을 한 번에 실행"""
         
@@ -0,0 +1,147 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+게시 저장소 모듈 - 백그라운드 실행(briefing_daemon)이 미리 만든 브리핑과 수집 결과를 여러 앱 세션이 함께 읽음
+
+    published/
+        latest.json                 # 최신 게시본 메타데이터 + 수집 결과
+        briefing_20260128_0700.md   # 브리핑 본문 (generate_and_save 출력)
+
+latest.json은 임시 파일에 쓴 뒤 os.replace로 바꿔 읽는 쪽이 쓰다 만 파일을 보지 않는다.
+앱은 파일 수정 시각이 바뀌었을 때만 다시 읽으므로 화면을 다시 그릴 때마다 비용이 들지 않는다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+import models
+from date_utils import now_kst
+from storage import data_path
+
+
+def fingerprint(prompt_data: str) -> str:
+    """프롬프트 자료의 지문 (같으면 브리핑을 다시 만들 필요가 없음)"""
+    return hashlib.sha256(prompt_data.encode('utf-8')).hexdigest()[:16]
+
+
+@dataclass
+class PublishedBriefing:
+    generated_at: str                       # 브리핑을 만든 시각 (KST ISO)
+    collected_at: str                       # 자료를 마지막으로 수집한 시각
+    briefing: str
+    briefing_path: str
+    data: Dict[str, List[models.NewsItem]]
+    fingerprint: str
+    sources: List[str]
+
+    @property
+    def age_minutes(self) -> float:
+        return (now_kst() - datetime.fromisoformat(self.collected_at)).total_seconds() / 60
+
+
+class BriefingStore:
+    """게시 디렉터리 (latest.json + 브리핑 Markdown)"""
+
+    def __init__(self, directory: str, lock_timeout: float = 15 * 60):
+        self.directory = directory
+        self.lock_timeout = lock_timeout
+        os.makedirs(directory, exist_ok=True)
+        self._latest_path = os.path.join(directory, 'latest.json')
+        self._lock_path = os.path.join(directory, 'refresh.lock')
+        self._cached: Optional[PublishedBriefing] = None
+        self._cached_mtime = 0.0
+        self._lock = threading.Lock()
+
+    def briefing_path(self, when: Optional[datetime] = None) -> str:
+        when = when or now_kst()
+        return os.path.join(self.directory, f"briefing_{when:%Y%m%d_%H%M}.md")
+
+    def latest(self) -> Optional[PublishedBriefing]:
+        """최신 게시본 (없거나 읽지 못하면 None)"""
+        try:
+            mtime = os.path.getmtime(self._latest_path)
+        except OSError:
+            return None
+        with self._lock:
+            if self._cached is not None and mtime == self._cached_mtime:
+                return self._cached
+            try:
+                with open(self._latest_path, encoding='utf-8') as f:
+                    meta = json.load(f)
+                with open(meta['briefing_path'], encoding='utf-8') as f:
+                    briefing = f.read()
+            except (OSError, ValueError, KeyError) as e:
+                print(f"⚠️ 게시된 브리핑을 읽지 못함: {e}")
+                return None
+            self._cached = PublishedBriefing(
+                generated_at=meta['generated_at'],
+                collected_at=meta['collected_at'],
+                briefing=briefing,
+                briefing_path=meta['briefing_path'],
+                data=models.as_results(meta['data']),
+                fingerprint=meta['fingerprint'],
+                sources=meta.get('sources', []),
+            )
+            self._cached_mtime = mtime
+            return self._cached
+
+    def publish(self, briefing_path: str, data: Dict[str, List[models.NewsItem]],
+                fingerprint: str, sources: List[str],
+                generated_at: Optional[str] = None) -> None:
+        """게시본 교체 (generated_at을 주면 브리핑은 그대로 두고 수집 결과만 갱신)"""
+        now = now_kst().isoformat(timespec='seconds')
+        meta = {
+            'generated_at': generated_at or now,
+            'collected_at': now,
+            'briefing_path': briefing_path,
+            'fingerprint': fingerprint,
+            'sources': sources,
+            'data': models.to_plain(data),
+        }
+        tmp = self._latest_path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, self._latest_path)
+
+    @contextmanager
+    def refresh_lock(self) -> Iterator[bool]:
+        """다른 프로세스가 갱신 중이면 False (lock_timeout보다 오래된 잠금은 버려진 것으로 봄)"""
+        try:
+            if time.time() - os.path.getmtime(self._lock_path) > self.lock_timeout:
+                os.remove(self._lock_path)
+        except OSError:
+            pass
+        try:
+            fd = os.open(self._lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            yield False
+            return
+        try:
+            os.write(fd, str(os.getpid()).encode())
+            os.close(fd)
+            yield True
+        finally:
+            try:
+                os.remove(self._lock_path)
+            except OSError:
+                pass
+
+
+_store: Optional[BriefingStore] = None
+_store_lock = threading.Lock()
+
+
+def get_briefing_store() -> BriefingStore:
+    """공용 게시 저장소 (BRIEFING_STORE_DIR로 위치 지정, 기본은 DATA_DIR/published)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = BriefingStore(os.getenv('BRIEFING_STORE_DIR')
+                                   or os.path.dirname(data_path('published', 'latest.json')))
+        return _store
@@ -0,0 +1,347 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+브라우저 풀 모듈 - Playwright Chromium을 프로세스 전체에서 공유
+"""
+
+import atexit
+import importlib.util
+import os
+import queue
+import subprocess
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+from route_policy import SOURCE_POLICIES, RouteFilter, RouteStats
+
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# ensure_playwright_ready() 결과 (None이면 아직 확인 전)
+_playwright_ready: Optional[bool] = None
+_ready_lock = threading.Lock()
+
+
+def playwright_installed() -> bool:
+    """playwright 패키지 설치 여부 (모듈을 import하지 않고 확인)"""
+    return importlib.util.find_spec('playwright') is not None
+
+
+def browsers_installed() -> bool:
+    path = os.getenv('PLAYWRIGHT_BROWSERS_PATH') or os.path.expanduser("~/.cache/ms-playwright")
+    try:
+        return any(name.startswith('chromium') for name in os.listdir(path))
+    except OSError:
+        return False
+
+
+def ensure_playwright_ready(install: bool = True) -> bool:
+    """브라우저 수집 준비 (명시적 준비 단계, 결과는 프로세스 안에서 캐시)
+
+    Chromium이 없으면 install=True일 때 설치를 시도한다 (Streamlit Cloud 등).
+    """
+    global _playwright_ready
+    with _ready_lock:
+        if _playwright_ready is not None:
+            return _playwright_ready
+        
+        if not playwright_installed():
+            print("⚠️ Playwright가 설치되지 않았습니다. 일부 사이트 수집이 제한됩니다.")
+            _playwright_ready = False
+        elif browsers_installed():
+            _playwright_ready = True
+        elif not install:
+            return False
+        else:
+            print("🔄 Playwright 브라우저 설치 중...")
+            try:
+                subprocess.run(["playwright", "install", "chromium", "--with-deps"],
+                               check=True, capture_output=True)
+                print("✅ Playwright 브라우저 설치 완료")
+                _playwright_ready = True
+            except Exception as e:
+                print(f"⚠️ Playwright 브라우저 설치 실패: {e}")
+                _playwright_ready = False
+        return _playwright_ready
+
+
+def playwright_available() -> bool:
+    """브라우저 수집 가능 여부 (준비 단계 전에는 패키지 설치 여부로 판단)"""
+    if _playwright_ready is not None:
+        return _playwright_ready
+    return playwright_installed()
+
+
+class _BrowserWorker:
+    """브라우저 1개를 소유하는 작업 스레드
+
+    Playwright sync API 객체는 생성한 스레드에서만 사용할 수 있으므로
+    브라우저·컨텍스트·페이지 조작은 모두 이 스레드 안에서 실행된다.
+    """
+
+    def __init__(self, pool: 'BrowserPool', index: int):
+        self.pool = pool
+        self.index = index
+        self.playwright = None
+        self.browser = None
+        self.contexts: Dict[str, Any] = {}
+        self.context_uses: Dict[str, int] = {}
+        self.route_filters: Dict[str, RouteFilter] = {}
+        self.last_used = time.monotonic()
+        self.thread = threading.Thread(
+            target=self._loop, name=f"browser-pool-{index}", daemon=True
+        )
+        self.thread.start()
+
+    # ----- 브라우저 수명 관리 -----
+
+    def _healthy(self) -> bool:
+        try:
+            return self.browser is not None and self.browser.is_connected()
+        except Exception:
+            return False
+
+    def _ensure_browser(self):
+        if self._healthy():
+            return
+        if self.browser is not None:
+            self.pool._record('health_failures')
+        self._close_browser()
+
+        if self.playwright is None:
+            from playwright.sync_api import sync_playwright
+            self.playwright = sync_playwright().start()
+
+        started = time.monotonic()
+        self.browser = self.playwright.chromium.launch(
+            headless=True, args=self.pool.launch_args
+        )
+        self.pool._record('launches')
+        self.pool._record('launch_seconds', time.monotonic() - started)
+
+    def _get_context(self, context_key: str):
+        context = self.contexts.get(context_key)
+        uses = self.context_uses.get(context_key, 0)
+
+        if context is not None and uses >= self.pool.max_context_uses:
+            self._close_context(context_key)
+            context = None
+
+        if context is None:
+            context = self.browser.new_context(user_agent=self.pool.user_agent)
+            policy = self.pool.route_policies.get(context_key)
+            if policy is not None:
+                route_filter = RouteFilter(policy)
+                route_filter.install(context)
+                self.route_filters[context_key] = route_filter
+            self.contexts[context_key] = context
+            self.context_uses[context_key] = 0
+            self.pool._record('context_creates')
+        else:
+            self.pool._record('context_reuses')
+
+        self.context_uses[context_key] += 1
+        return context
+
+    def _close_context(self, context_key: str):
+        context = self.contexts.pop(context_key, None)
+        self.context_uses.pop(context_key, None)
+        self.route_filters.pop(context_key, None)
+        if context is not None:
+            try:
+                context.close()
+            except Exception:
+                pass
+
+    def _close_browser(self):
+        for key in list(self.contexts):
+            self._close_context(key)
+        if self.browser is not None:
+            try:
+                self.browser.close()
+            except Exception:
+                pass
+            self.browser = None
+
+    def _stop(self):
+        self._close_browser()
+        if self.playwright is not None:
+            try:
+                self.playwright.stop()
+            except Exception:
+                pass
+            self.playwright = None
+
+    # ----- 작업 루프 -----
+
+    def _run_job(self, fn: Callable, context_key: str, future: Future):
+        if not future.set_running_or_notify_cancel():
+            return
+
+        page = None
+        try:
+            self._ensure_browser()
+            context = self._get_context(context_key)
+            page = context.new_page()
+            self.pool._record('pages')
+            route_filter = self.route_filters.get(context_key)
+            before = route_filter.snapshot() if route_filter else None
+            result = fn(page)
+            if route_filter is not None:
+                # 이 페이지 로드 동안 차단·절감된 양 (컨텍스트 안의 페이지는 순차 실행)
+                future.route_stats = route_filter.snapshot().minus(before)
+                self.pool._record_routes(future.route_stats)
+            future.set_result(result)
+        except BaseException as e:
+            # 브라우저가 죽었으면 다음 작업에서 재시작되도록 컨텍스트 폐기
+            if not self._healthy():
+                self._close_browser()
+            else:
+                self._close_context(context_key)
+            future.set_exception(e)
+        finally:
+            if page is not None:
+                try:
+                    page.close()
+                except Exception:
+                    pass
+            self.last_used = time.monotonic()
+
+    def _loop(self):
+        while True:
+            try:
+                job = self.pool._jobs.get(timeout=self.pool.idle_check_interval)
+            except queue.Empty:
+                # 오래 쉬는 브라우저는 메모리 확보를 위해 종료 (다음 작업 때 재시작)
+                idle = time.monotonic() - self.last_used
+                if self.browser is not None and idle > self.pool.idle_timeout:
+                    self._close_browser()
+                    self.pool._record('idle_closes')
+                continue
+
+            if job is None:
+                self._stop()
+                return
+
+            fn, context_key, future = job
+            self._run_job(fn, context_key, future)
+
+
+class BrowserPool:
+    """장수명 Chromium 브라우저 풀
+
+    - 브라우저는 한 번 띄운 뒤 계속 재사용 (warm browser)
+    - 컨텍스트는 키별로 재사용하다가 일정 횟수 이후 새로 생성
+    - 동시에 열리는 페이지 수는 작업 스레드 수(size)로 제한
+    - 작업 전 브라우저 연결 상태를 확인하고 끊겼으면 재시작
+    - route_policies에 등록된 컨텍스트 키는 요청 차단 정책을 적용
+    """
+
+    def __init__(self, size: int = 1, max_context_uses: int = 20,
+                 idle_timeout: float = 600.0, user_agent: str = DEFAULT_USER_AGENT):
+        self.size = max(1, size)
+        self.max_context_uses = max_context_uses
+        self.idle_timeout = idle_timeout
+        self.idle_check_interval = 30.0
+        self.user_agent = user_agent
+        # 저사양 컨테이너에서 /dev/shm 부족으로 탭이 죽는 문제 방지
+        self.launch_args = ['--disable-dev-shm-usage']
+        self.route_policies = dict(SOURCE_POLICIES)
+        self._route_totals = RouteStats()
+
+        self._jobs: 'queue.Queue' = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers = []
+        self._closed = False
+        self._stats = {
+            'launches': 0,
+            'launch_seconds': 0.0,
+            'pages': 0,
+            'context_creates': 0,
+            'context_reuses': 0,
+            'health_failures': 0,
+            'idle_closes': 0,
+        }
+
+    def _record(self, key: str, value: float = 1):
+        with self._lock:
+            self._stats[key] += value
+
+    def _record_routes(self, stats: RouteStats):
+        with self._lock:
+            self._route_totals.add(stats)
+
+    def _ensure_workers(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("브라우저 풀이 이미 종료되었습니다")
+            while len(self._workers) < self.size:
+                self._workers.append(_BrowserWorker(self, len(self._workers)))
+
+    def submit(self, fn: Callable, context_key: str = 'default') -> Future:
+        """fn(page)를 풀의 브라우저에서 실행하도록 예약
+
+        차단 정책이 있는 컨텍스트면 완료된 Future의 route_stats에 페이지 로드별 집계가 담긴다.
+        """
+        self._ensure_workers()
+        future: Future = Future()
+        self._jobs.put((fn, context_key, future))
+        return future
+
+    def run(self, fn: Callable, context_key: str = 'default',
+            timeout: Optional[float] = None):
+        """fn(page)를 실행하고 결과를 반환 (예외는 그대로 전달)"""
+        return self.submit(fn, context_key).result(timeout=timeout)
+
+    def warm_up(self, timeout: Optional[float] = 60):
+        """브라우저를 미리 띄워 첫 수집의 시작 지연을 없앰"""
+        return self.run(lambda page: True, context_key='warmup', timeout=timeout)
+
+    def stats(self) -> Dict[str, float]:
+        """실행 횟수와 재사용 비율"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['requests_seen'] = self._route_totals.requests
+            stats['requests_blocked'] = self._route_totals.blocked
+            stats['bytes_saved'] = self._route_totals.bytes_saved
+        pages = stats['pages']
+        contexts = stats['context_creates'] + stats['context_reuses']
+        stats['browser_reuse_ratio'] = (
+            (pages - stats['launches']) / pages if pages else 0.0
+        )
+        stats['context_reuse_ratio'] = (
+            stats['context_reuses'] / contexts if contexts else 0.0
+        )
+        stats['workers'] = len(self._workers)
+        return stats
+
+    def shutdown(self, timeout: float = 10.0):
+        """모든 브라우저 종료"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers = list(self._workers)
+        for _ in workers:
+            self._jobs.put(None)
+        for worker in workers:
+            worker.thread.join(timeout=timeout)
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """프로세스 공용 브라우저 풀 (Streamlit 세션 간 공유)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(
+                size=int(os.getenv('BROWSER_POOL_SIZE', '1')),
+                max_context_uses=int(os.getenv('BROWSER_CONTEXT_MAX_USES', '20')),
+                idle_timeout=float(os.getenv('BROWSER_IDLE_TIMEOUT', '600')),
+            )
+            atexit.register(_pool.shutdown)
+        return _pool
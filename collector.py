@@ -0,0 +1,193 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+동시 수집 엔진 - 소스별 병렬 수집과 호스트 단위 요청 간격 관리
+"""
+
+import contextvars
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from page_ready import get_readiness_tuner
+from selector_cache import get_selector_cache
+from source_health import CircuitOpenError, get_source_health
+from sources import SOURCES
+from telemetry import span
+
+
+# 소스별 수집 호스트 (같은 호스트를 쓰는 소스끼리만 요청 간격을 둔다)
+SOURCE_HOSTS = {key: urlsplit(spec.url).hostname for key, spec in SOURCES.items()}
+
+DEFAULT_SOURCES = list(SOURCE_HOSTS)
+
+
+class HostRateLimiter:
+    """호스트별 최소 요청 간격 보장 (전역 sleep 대신 사용)"""
+
+    def __init__(self, min_interval: float = 2.0,
+                 per_host: Optional[Dict[str, float]] = None):
+        self.min_interval = min_interval
+        self.per_host = per_host or {}
+        self._lock = threading.Lock()
+        self._next_allowed: Dict[str, float] = {}
+
+    def interval_for(self, host: str) -> float:
+        return self.per_host.get(host, self.min_interval)
+
+    def wait(self, host: str) -> float:
+        """해당 호스트에 요청해도 될 때까지 대기하고, 대기한 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed.get(host, 0.0))
+            self._next_allowed[host] = slot + self.interval_for(host)
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+_limiter: Optional[HostRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_host_limiter() -> HostRateLimiter:
+    """프로세스 공용 호스트 리미터 (여러 사용자가 동시에 수집해도 간격 유지)"""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = HostRateLimiter(
+                min_interval=float(os.getenv('HOST_MIN_INTERVAL', '2.0'))
+            )
+        return _limiter
+
+
+@dataclass
+class StreamEvent:
+    """수집 스트림 이벤트 (kind: 'item' 항목 도착, 'done' 소스 완료)"""
+    kind: str
+    source: str
+    item: Optional[Dict] = None
+    elapsed: float = 0.0
+    error: Optional[Exception] = None
+
+
+class CollectionScheduler:
+    """여러 소스를 동시에 수집하고 결과를 scraper.results에 모음
+
+    요청 간격은 소스 단위가 아니라 실제 요청 단위로 HostRateLimiter가 관리한다
+    (HTTP는 http_client, 브라우저는 SafetyNewsScraper._run_in_browser).
+    소스 상태(source_health)에서 차단된 소스는 시도하지 않고 바로 건너뛴다.
+    """
+
+    def __init__(self, scraper, max_workers: int = 5):
+        self.scraper = scraper
+        self.max_workers = max_workers
+        self.timings: Dict[str, float] = {'total': 0.0}
+        self.health = get_source_health()
+
+    def _task(self, source: str, keywords: str) -> Callable[[], None]:
+        return lambda: self.scraper.collect(source, keywords)
+
+    def _run_one(self, source: str, keywords: str) -> Tuple[float, Optional[Exception]]:
+        """소스 하나를 수집하고 (소요시간, 실패 원인)을 반환
+
+        실패해도 이 소스가 걸린 시간을 알 수 있도록 접속·로딩 실패는 예외로 던지지 않고
+        돌려준다. 차단된 소스만 CircuitOpenError로 알린다.
+        """
+        if self.health is not None and not self.health.allow(source):
+            raise CircuitOpenError(source, self.health.retry_in(source))
+
+        started = time.monotonic()
+        error = None
+        try:
+            self._task(source, keywords)()
+            error = self.scraper.errors.get(source)
+        except Exception as e:
+            error = e
+        elapsed = time.monotonic() - started
+        if self.health is not None:
+            self.health.record(source, elapsed, error)
+        return elapsed, error
+
+    def run(self, sources: Optional[List[str]] = None,
+            keywords: str = "산업안전 중대재해",
+            on_complete: Optional[Callable[[str, float, Optional[Exception]], None]] = None):
+        """소스를 병렬로 수집
+
+        on_complete(source, elapsed, error)는 호출한 스레드에서 소스가 끝날 때마다
+        호출되므로 Streamlit 위젯 갱신에 바로 쓸 수 있다.
+        """
+        if sources is None:
+            sources = DEFAULT_SOURCES
+        sources = [s for s in sources if s in SOURCE_HOSTS]
+        if not sources:
+            return self.scraper.results
+
+        started = time.monotonic()
+        with span('collect.run', sources=len(sources)), \
+                ThreadPoolExecutor(max_workers=min(self.max_workers, len(sources)),
+                                   thread_name_prefix='collector') as executor:
+            # 소스별 구간이 이 실행의 하위 구간이 되도록 계측 컨텍스트를 넘김
+            futures = {
+                executor.submit(contextvars.copy_context().run, self._run_one, source, keywords): source
+                for source in sources
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    elapsed, error = future.result()
+                except CircuitOpenError as e:
+                    elapsed = 0.0
+                    error = e
+                    print(f"  ⛔ {source} 건너뜀: {e}")
+                else:
+                    if error is not None:
+                        print(f"  ❌ {source} 수집 실패: {error}")
+                self.timings[source] = elapsed
+                if on_complete:
+                    on_complete(source, elapsed, error)
+
+        self.timings['total'] = time.monotonic() - started
+        # 셀렉터 학습 결과와 준비 대기 기록은 소스·대기마다 쓰지 않고 실행이 끝날 때 한 번 저장
+        selectors = get_selector_cache()
+        if selectors is not None:
+            selectors.flush()
+        get_readiness_tuner().flush()
+        return self.scraper.results
+
+    def stream(self, sources: Optional[List[str]] = None,
+               keywords: str = "산업안전 중대재해") -> Iterator[StreamEvent]:
+        """수집을 백그라운드에서 돌리며 항목이 파싱되는 대로 이벤트를 생성
+
+        소스 하나가 끝날 때까지 기다리지 않으므로 첫 항목을 바로 화면에 그릴 수 있다.
+        """
+        events: 'queue.Queue' = queue.Queue()
+        done = object()
+
+        def on_item(source: str, item: Dict):
+            events.put(StreamEvent('item', source, item))
+
+        def on_complete(source: str, elapsed: float, error: Optional[Exception]):
+            events.put(StreamEvent('done', source, elapsed=elapsed, error=error))
+
+        def run():
+            try:
+                self.run(sources, keywords, on_complete=on_complete)
+            finally:
+                events.put(done)
+
+        self.scraper.on_item = on_item
+        threading.Thread(target=run, name='collector-stream', daemon=True).start()
+        try:
+            while True:
+                event = events.get()
+                if event is done:
+                    return
+                yield event
+        finally:
+            self.scraper.on_item = None
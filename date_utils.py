@@ -0,0 +1,159 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+날짜 정규화 모듈 - 소스마다 다른 날짜 문자열을 한국 시간(KST) datetime으로 바꾸고 최근 항목만 남김
+
+다루는 형식: '2026.01.28', '2026-01-28 10:30', '20260128', '2026년 1월 28일', '26.01.28',
+'01-28'·'1월 28일'(올해, 미래가 되면 작년), '10:30'(오늘), '3시간 전'·'어제' 같은 상대 시간,
+epoch 초/밀리초(XHR 응답). 목록 하나에는 같은 날짜 문자열이 반복되므로 parse_dates는
+서로 다른 문자열만 한 번씩 파싱한다.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models import NewsItem, as_item
+
+# 한국은 일광절약시간이 없어 고정 오프셋으로 충분 (Windows에서 tzdata 없이 동작)
+KST = timezone(timedelta(hours=9), 'KST')
+
+_FULL = re.compile(
+    r'(?P<y>\d{4}|\d{2})\s*[.\-/년]\s*(?P<m>\d{1,2})\s*[.\-/월]\s*(?P<d>\d{1,2})(?:\s*일)?\.?'
+    r'(?:[\sT]+(?P<H>\d{1,2}):(?P<M>\d{2})(?::(?P<S>\d{2}))?)?'
+)
+_COMPACT = re.compile(r'^(?P<y>\d{4})(?P<m>\d{2})(?P<d>\d{2})(?:(?P<H>\d{2})(?P<M>\d{2})(?P<S>\d{2})?)?$')
+_MONTH_DAY = re.compile(
+    r'^(?P<m>\d{1,2})\s*[.\-/월]\s*(?P<d>\d{1,2})(?:\s*일)?\.?'
+    r'(?:\s+(?P<H>\d{1,2}):(?P<M>\d{2}))?$'
+)
+_TIME_ONLY = re.compile(r'^(?P<H>\d{1,2}):(?P<M>\d{2})(?::\d{2})?$')
+_RELATIVE = re.compile(r'(?P<n>\d+)\s*(?P<unit>초|분|시간|일|주)\s*전')
+_EPOCH = re.compile(r'^\d{10}(?:\d{3})?$')
+
+_UNITS = {'초': 'seconds', '분': 'minutes', '시간': 'hours', '일': 'days', '주': 'weeks'}
+_DAY_WORDS = {'방금': 0, '오늘': 0, '어제': 1, '그제': 2, '그저께': 2}
+
+
+def now_kst() -> datetime:
+    return datetime.now(KST)
+
+
+def _build(y: int, m: int, d: int, H=None, M=None, S=None) -> Optional[datetime]:
+    try:
+        return datetime(y, m, d, int(H or 0), int(M or 0), int(S or 0), tzinfo=KST)
+    except ValueError:
+        return None
+
+
+def parse_date(value, now: Optional[datetime] = None) -> Optional[datetime]:
+    """날짜 문자열(또는 epoch 숫자)을 KST datetime으로. 알 수 없으면 None"""
+    if value is None or value == '':
+        return None
+    now = now or now_kst()
+    text = str(value).strip()
+
+    if _EPOCH.match(text):
+        seconds = int(text) / (1000 if len(text) == 13 else 1)
+        return datetime.fromtimestamp(seconds, KST)
+
+    match = _COMPACT.match(text)
+    if match:
+        return _build(int(match['y']), int(match['m']), int(match['d']),
+                      match['H'], match['M'], match['S'])
+
+    match = _FULL.search(text)
+    if match:
+        year = int(match['y'])
+        if year < 100:
+            year += 2000
+        return _build(year, int(match['m']), int(match['d']), match['H'], match['M'], match['S'])
+
+    match = _MONTH_DAY.match(text)
+    if match:
+        parsed = _build(now.year, int(match['m']), int(match['d']), match['H'], match['M'])
+        # 연도 없는 날짜가 미래가 되면 작년 게시물 (1월에 보는 12월 글)
+        if parsed is not None and parsed > now + timedelta(days=1):
+            parsed = _build(now.year - 1, int(match['m']), int(match['d']), match['H'], match['M'])
+        return parsed
+
+    match = _TIME_ONLY.match(text)
+    if match:
+        return _build(now.year, now.month, now.day, match['H'], match['M'])
+
+    match = _RELATIVE.search(text)
+    if match:
+        return now - timedelta(**{_UNITS[match['unit']]: int(match['n'])})
+
+    for word, days in _DAY_WORDS.items():
+        if text.startswith(word):
+            return now - timedelta(days=days)
+    return None
+
+
+def parse_dates(values: Iterable, now: Optional[datetime] = None) -> List[Optional[datetime]]:
+    """여러 날짜를 한꺼번에 파싱 (같은 문자열은 한 번만)"""
+    now = now or now_kst()
+    values = list(values)
+    parsed = {value: parse_date(value, now) for value in dict.fromkeys(values)}
+    return [parsed[value] for value in values]
+
+
+def _normalized(item: NewsItem, parsed: Optional[datetime]) -> NewsItem:
+    if parsed is not None:
+        published_at = parsed.isoformat(timespec='minutes')
+        if item.published_at != published_at:
+            item = item.replace(published_at=published_at, date=parsed.strftime('%Y-%m-%d'))
+    elif item.published_at is not None:
+        item = item.replace(published_at=None)
+    return item
+
+
+def _parsed_entries(data: Dict[str, List[NewsItem]], now: Optional[datetime]):
+    entries = [(category, as_item(item, category)) for category, items in data.items() for item in items]
+    dates = parse_dates([item.published_at or item.date for _, item in entries], now)
+    return entries, dates
+
+
+def normalize_dates(data: Dict[str, List[NewsItem]],
+                    now: Optional[datetime] = None) -> Dict[str, List[NewsItem]]:
+    """항목마다 published_at(ISO, KST)을 붙이고 date를 'YYYY-MM-DD'로 맞춘 새 목록
+
+    파싱하지 못한 날짜는 원래 문자열을 두고 published_at을 None으로 둔다.
+    """
+    entries, dates = _parsed_entries(data, now)
+    result: Dict[str, List[NewsItem]] = {category: [] for category in data}
+    for (category, item), parsed in zip(entries, dates):
+        result[category].append(_normalized(item, parsed))
+    return result
+
+
+def recent_items(data: Dict[str, List[NewsItem]], days: Optional[float],
+                 now: Optional[datetime] = None,
+                 keep_undated: bool = True) -> Tuple[Dict[str, List[NewsItem]], int]:
+    """날짜를 정규화하고 최근 days일(오늘 0시 기준) 항목만 최신순으로 남김
+
+    반환: (결과, 기간 밖이라 뺀 건수). days가 None이면 기간 제한 없이 정렬만 한다.
+    날짜를 알 수 없는 항목은 keep_undated면 남기고 맨 뒤에 둔다.
+    """
+    now = now or now_kst()
+    cutoff = None
+    if days is not None:
+        cutoff = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days)
+
+    entries, dates = _parsed_entries(data, now)
+    result: Dict[str, List[NewsItem]] = {category: [] for category in data}
+    dropped = 0
+    for (category, item), parsed in zip(entries, dates):
+        if parsed is None:
+            keep = keep_undated
+        else:
+            keep = cutoff is None or parsed >= cutoff
+        if keep:
+            # 기간 밖 항목은 정규화(새 항목 생성)하지 않음
+            result[category].append(_normalized(item, parsed))
+        else:
+            dropped += 1
+    for items in result.values():
+        # 같은 오프셋의 ISO 문자열은 사전순이 곧 시간순
+        items.sort(key=lambda item: item.published_at or '', reverse=True)
+    return result, dropped
@@ -0,0 +1,215 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+유사 제목 병합 모듈 - 여러 소스에 조금씩 다른 제목으로 실린 같은 소식을 하나로 묶음
+
+제목을 글자 n-gram 집합으로 보고 MinHash 서명을 만든 뒤, LSH(band별 버킷)로
+비슷할 가능성이 있는 쌍만 골라 실제 자카드 유사도로 확인한다. 모든 쌍을 비교하지
+않으므로 수천 건(백필)도 처리할 수 있다.
+
+항목은 프롬프트에 실리는 소스 → 새 항목 → 소스 우선순위 → 최근 날짜 순으로 보며, 앞선 묶음의
+대표 제목과 비교해 붙인다 (A≈B, B≈C라고 A와 C를 묶지 않음). 같은 소스끼리는 묶지 않고, 제목 속 숫자
+(월·회차·인원)가 다르면 다른 소식으로 본다.
+"""
+
+import random
+import re
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from date_utils import parse_dates
+from models import NewsItem, as_item
+from seen_store import normalize_title
+from sources import PROMPT_SOURCES
+
+
+# 묶음의 대표 항목을 고르는 소스 우선순위 (공식 발표가 먼저)
+SOURCE_PRIORITY = ['moel_press', 'kosha_notice', 'major_accident', 'labor_news', 'bigkinds_news']
+
+_MERSENNE = (1 << 31) - 1
+_HANGUL_CJK = re.compile(r'[ᄀ-ᇿ㄰-㆏가-힣一-鿿]')
+_NUMBER = re.compile(r'\d+')
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (한글·한자는 글자당 1, 나머지는 4글자당 1)"""
+    wide = len(_HANGUL_CJK.findall(text))
+    rest = len(text) - wide - text.count(' ') - text.count('\n')
+    return wide + (max(rest, 0) + 3) // 4
+
+
+def shingles(title: str, n: int = 2) -> Set[str]:
+    """공백·문장부호를 뺀 제목의 글자 n-gram 집합"""
+    text = normalize_title(title)
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def numbers(title: str) -> FrozenSet[int]:
+    """제목 속 숫자 (앞자리 0은 무시: '01월'과 '1월'은 같음)"""
+    return frozenset(int(n) for n in _NUMBER.findall(title or ''))
+
+
+class MinHasher:
+    """n-gram 집합의 MinHash 서명 ((a·x + b) mod p 해시 num_perm개의 최솟값)"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.a = [rng.randrange(1, _MERSENNE) for _ in range(num_perm)]
+        self.b = [rng.randrange(0, _MERSENNE) for _ in range(num_perm)]
+        # numpy는 import가 무거워 처음 병합할 때 로드 (설치돼 있지 않으면 순수 파이썬으로 계산)
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        self._np = np
+        if np is not None:
+            self._a = np.array(self.a, dtype=np.uint64)[:, None]
+            self._b = np.array(self.b, dtype=np.uint64)[:, None]
+
+    def signature(self, grams: Set[str]) -> Tuple[int, ...]:
+        xs = [zlib.crc32(g.encode('utf-8')) for g in grams]
+        np = self._np
+        if np is not None:
+            x = np.array(xs, dtype=np.uint64)[None, :]
+            return tuple(((self._a * x + self._b) % _MERSENNE).min(axis=1).tolist())
+        return tuple(min((a * x + b) % _MERSENNE for x in xs)
+                     for a, b in zip(self.a, self.b))
+
+
+class LSHIndex:
+    """서명을 bands개 구간으로 나눠 구간이 하나라도 같으면 후보로 보는 색인
+
+    bands=16, rows=4면 자카드 유사도 약 0.5부터 후보로 잡힐 확률이 급격히 커진다.
+    """
+
+    def __init__(self, bands: int = 16, rows: int = 4):
+        self.bands = bands
+        self.rows = rows
+        self._buckets: Dict[Tuple, List[int]] = {}
+
+    def add(self, key: int, signature: Tuple[int, ...]) -> Set[int]:
+        """서명을 색인에 넣고, 같은 버킷에 있던 기존 키들을 반환"""
+        candidates = set()
+        for band in range(self.bands):
+            bucket = (band, signature[band * self.rows:(band + 1) * self.rows])
+            members = self._buckets.setdefault(bucket, [])
+            candidates.update(members)
+            members.append(key)
+        return candidates
+
+
+@dataclass
+class DedupReport:
+    items_before: int = 0
+    items_after: int = 0
+    clusters: int = 0             # 2건 이상 묶인 묶음 수
+    tokens_before: int = 0
+    tokens_after: int = 0
+
+    @property
+    def removed(self) -> int:
+        return self.items_before - self.items_after
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+
+def _prompt_items(data: Dict[str, List[NewsItem]]) -> Dict[str, List[NewsItem]]:
+    """프롬프트에 실제로 들어갈 항목 (실리는 소스의 새 항목)"""
+    return {category: [item for item in items if as_item(item, category).fresh]
+            for category, items in data.items() if category in PROMPT_SOURCES}
+
+
+def deduplicate(data: Dict[str, List[NewsItem]], threshold: float = 0.6, ngram: int = 2,
+                render: Optional[Callable[[Dict[str, List[NewsItem]]], str]] = None,
+                hasher: Optional[MinHasher] = None) -> Tuple[Dict[str, List[NewsItem]], DedupReport]:
+    """다른 소스에 실린 비슷한 제목을 묶어 묶음마다 대표 항목 하나만 남김
+
+    대표 항목은 프롬프트에 실리는 소스(sources.PROMPT_SOURCES), 새 항목(is_new가 False가 아닌 것),
+    소스 우선순위, 최근 날짜 순으로 고른다. 프롬프트에 실리지 않는 소스(빅카인즈)나 이미 다룬
+    항목이 대표가 되면 같은 소식이 프롬프트에서 통째로 사라지기 때문이다.
+    대표 항목(사본)의 alternates에 나머지 항목의 소스·제목·링크를 담는다.
+    render(프롬프트용 텍스트 변환 함수)를 주면 프롬프트에 들어갈 항목만 놓고 병합 전후 토큰 수를
+    추정해 보고한다.
+    """
+    hasher = hasher or MinHasher()
+    index = LSHIndex(bands=16, rows=hasher.num_perm // 16)
+
+    entries = [(category, as_item(item, category)) for category, items in data.items() for item in items]
+    published = parse_dates([item.published_at or item.date for _, item in entries])
+
+    def rank(i: int):
+        category, item = entries[i]
+        order = SOURCE_PRIORITY.index(category) if category in SOURCE_PRIORITY else len(SOURCE_PRIORITY)
+        when = published[i].timestamp() if published[i] is not None else float('-inf')
+        return (category not in PROMPT_SOURCES, not item.fresh, order, -when, i)
+
+    # 순위가 높은 항목부터 묶음을 만들고, 뒤의 항목은 기존 묶음의 대표 제목과만 비교
+    clusters: Dict[int, List[int]] = {}       # 대표 → 구성원 (대표가 맨 앞)
+    categories: Dict[int, Set[str]] = {}
+    grams: Dict[int, Set[str]] = {}
+    for i in sorted(range(len(entries)), key=rank):
+        gram = grams[i] = shingles(entries[i][1].title, ngram)
+        if not gram:
+            clusters[i] = [i]
+            continue
+        category = entries[i][0]
+        title_numbers = numbers(entries[i][1].title)
+        best, best_score = None, threshold
+        for j in index.add(i, hasher.signature(gram)):
+            if j not in clusters or category in categories[j]:
+                continue
+            other_numbers = numbers(entries[j][1].title)
+            if title_numbers and other_numbers and title_numbers != other_numbers:
+                continue
+            score = jaccard(gram, grams[j])
+            if score >= best_score:
+                best, best_score = j, score
+        if best is None:
+            clusters[i] = [i]
+            categories[i] = {category}
+        else:
+            clusters[best].append(i)
+            categories[best].add(category)
+
+    keep: Dict[int, NewsItem] = {}
+    for canonical, members in clusters.items():
+        item = entries[canonical][1]
+        if len(members) > 1:
+            item = item.replace(alternates=tuple(
+                {
+                    'category': entries[m][0],
+                    'source': entries[m][1].source,
+                    'title': entries[m][1].title,
+                    'link': entries[m][1].link,
+                }
+                for m in members[1:]
+            ))
+        keep[canonical] = item
+
+    result = {category: [] for category in data}
+    for i, (category, _) in enumerate(entries):
+        if i in keep:
+            result[category].append(keep[i])
+
+    report = DedupReport(
+        items_before=len(entries),
+        items_after=len(keep),
+        clusters=sum(1 for members in clusters.values() if len(members) > 1),
+    )
+    if render is not None:
+        # 프롬프트에 실제로 들어갈 항목 기준 (이미 다룬 항목·빅카인즈는 병합과 상관없이 빠짐)
+        report.tokens_before = estimate_tokens(render(_prompt_items(data)))
+        report.tokens_after = estimate_tokens(render(_prompt_items(result)))
+    return result, report
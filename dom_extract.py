@@ -0,0 +1,144 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+DOM 추출 모듈 - 선언형 필드 명세로 페이지 안에서 한 번에 추출 (page.evaluate 1회)
+
+query_selector / inner_text를 행·필드마다 호출하면 호출마다 Chromium과 IPC 왕복이
+생긴다. 여기서는 명세를 JSON으로 넘겨 브라우저 안에서 모든 행을 추출한 뒤 결과만 받는다.
+
+명세 형식:
+    {
+        'rows': ['.card-list .card-item', 'article'],   # 앞에서부터 시도, 처음 매칭된 것 사용
+        'limit': 5,                                      # 앞에서부터 볼 최대 행 수
+        'min_cells': 3,                                  # (선택) td가 이보다 적은 행 제외
+        'fields': {
+            'title': {
+                'selectors': ['.card-title', 'h3'],      # 행 안에서 앞에서부터 시도
+                'attr': 'href',                          # (선택) 텍스트 대신 속성값
+                'cell': -2, 'min_cells': 4,              # (선택) selectors 대신 n번째 td
+                'min_length': 1, 'max_length': 19,       # (선택) 조건에 맞지 않으면 다음 셀렉터
+                'contains_any': ['-', '.'],              # (선택) 이 중 하나를 포함해야 함
+                'keep_last': True,                       # (선택) 조건을 못 맞추면 마지막 값 유지
+                'fallback_row_text': 100,                # (선택) 값이 없으면 행 전체 텍스트 앞부분
+            },
+        },
+    }
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+EXTRACT_JS = r"""
+(spec) => {
+  const text = (el) => (el.innerText || el.textContent || '').trim();
+  const valueOf = (el, f) => f.attr ? (el.getAttribute(f.attr) || '') : text(el);
+  const passes = (value, f) => {
+    if (f.min_length !== undefined && value.length < f.min_length) return false;
+    if (f.max_length !== undefined && value.length > f.max_length) return false;
+    if (f.contains_any && !f.contains_any.some((c) => value.includes(c))) return false;
+    return true;
+  };
+
+  let rows = [];
+  let rowIndex = -1;
+  for (let i = 0; i < spec.rows.length; i++) {
+    let found = [];
+    try { found = Array.from(document.querySelectorAll(spec.rows[i])); } catch (e) { continue; }
+    if (found.length > 0) { rows = found; rowIndex = i; break; }
+  }
+
+  const out = [];
+  const hits = {};
+  for (const row of rows.slice(0, spec.limit)) {
+    const cells = row.querySelectorAll('td');
+    if (spec.min_cells && cells.length < spec.min_cells) continue;
+
+    const record = {};
+    for (const [name, f] of Object.entries(spec.fields)) {
+      let value = '';
+      let matched = -1;
+      if (f.cell !== undefined) {
+        if (!f.min_cells || cells.length >= f.min_cells) {
+          const cell = cells[f.cell < 0 ? cells.length + f.cell : f.cell];
+          if (cell) { value = valueOf(cell, f); matched = 0; }
+        }
+      } else {
+        const selectors = f.selectors || [];
+        for (let i = 0; i < selectors.length; i++) {
+          let el = null;
+          try { el = row.querySelector(selectors[i]); } catch (e) { continue; }
+          if (!el) continue;
+          const candidate = valueOf(el, f);
+          if (passes(candidate, f)) { value = candidate; matched = i; break; }
+          if (f.keep_last) { value = candidate; matched = i; }
+        }
+      }
+      if (!value && f.fallback_row_text) {
+        value = text(row).slice(0, f.fallback_row_text);
+      }
+      record[name] = value;
+      (hits[name] = hits[name] || []).push(matched);
+    }
+    out.push(record);
+  }
+  return {rows: out, rowIndex: rowIndex, hits: hits};
+}
+"""
+
+
+@dataclass
+class ExtractResult:
+    """추출 결과 (행 목록과 어떤 셀렉터가 맞았는지)"""
+    rows: List[Dict[str, str]]
+    row_selector: Optional[str] = None
+    hits: Dict[str, List[int]] = field(default_factory=dict)
+
+
+def extract(page, spec: Dict) -> ExtractResult:
+    """명세대로 페이지에서 행을 추출 (Chromium 왕복 1회)"""
+    raw = page.evaluate(EXTRACT_JS, spec)
+    index = raw.get('rowIndex', -1)
+    return ExtractResult(
+        rows=raw.get('rows', []),
+        row_selector=spec['rows'][index] if index >= 0 else None,
+        hits=raw.get('hits', {}),
+    )
+
+
+# ----- 소스별 명세 -----
+
+KOSHA_NOTICE_SPEC = {
+    'rows': ['tbody tr'],
+    'limit': 15,
+    'min_cells': 3,
+    'fields': {
+        'title': {'selectors': ['td a']},
+        'href': {'selectors': ['td a'], 'attr': 'href'},
+        'date': {'cell': -2, 'min_cells': 4},
+        'number': {'cell': 0},                 # '공지'면 상단 고정 행
+    },
+}
+
+MAJOR_ACCIDENT_SPEC = {
+    'rows': ['.card-list .card-item', 'article', '.list-item', '[class*="card"]'],
+    'limit': 5,
+    'fields': {
+        'title': {'selectors': ['.card-title', 'h3', 'h4', '.title', 'a'],
+                  'fallback_row_text': 100},
+        'date': {'selectors': ['.card-date', '.date', 'time', 'span'],
+                 'min_length': 1, 'max_length': 19},
+    },
+}
+
+BIGKINDS_SPEC = {
+    'rows': ['.news-item', '.search-result-item', 'article', '.list-item', '[class*="result"]'],
+    'limit': 10,
+    'fields': {
+        'title': {'selectors': ['h3', 'h4', '.title', 'a', 'strong'],
+                  'min_length': 11, 'keep_last': True},
+        'href': {'selectors': ['a'], 'attr': 'href'},
+        'date': {'selectors': ['.date', 'time', 'span', '.info'],
+                 'contains_any': ['-', '.', '/'], 'max_length': 14},
+        'source': {'selectors': ['.source', '.press', '.media'], 'min_length': 1},
+    },
+}
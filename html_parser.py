@@ -0,0 +1,274 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+HTML 파싱 모듈 - lxml로 원본 바이트에서 필요한 영역만 파싱
+"""
+
+import re
+from typing import Callable, Dict, List, Optional
+
+from lxml import etree
+from lxml import html as lxml_html
+
+from keyword_matcher import MOEL_MIN_RELEVANCE, get_matcher
+from seen_store import pinned_label
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# 미리 컴파일한 XPath (매 요청마다 셀렉터를 다시 해석하지 않음)
+XPATH = {
+    'table': etree.XPath('(//table)[1]'),
+    'rows': etree.XPath('.//tr'),
+    'cells': etree.XPath('.//td'),
+    'link': etree.XPath('(.//a)[1]'),
+    'time': etree.XPath('(.//time)[1]'),
+    'article_date': etree.XPath(f'(.//*[{_has_class("article-date")}])[1]'),
+}
+
+# 매일노동뉴스 기사 목록 후보 (앞에서부터 시도, 셀렉터 학습 시 마지막 성공 후보부터)
+LABOR_NEWS_LISTS = {
+    '.article-list .article-item':
+        etree.XPath(f'//*[{_has_class("article-list")}]//*[{_has_class("article-item")}]'),
+    'article': etree.XPath('//article'),
+    '.list-group .list-group-item':
+        etree.XPath(f'//*[{_has_class("list-group")}]//*[{_has_class("list-group-item")}]'),
+    'table tbody tr': etree.XPath('//table//tbody//tr'),
+}
+
+_PARSER = lxml_html.HTMLParser(encoding='utf-8', remove_comments=True)
+
+
+def slice_element(content: bytes, tag: bytes) -> Optional[bytes]:
+    """첫 번째 <tag>...</tag> 영역만 잘라냄 (중첩 태그 고려)
+
+    페이지 전체 대신 필요한 부분만 파싱하기 위한 사전 작업.
+    """
+    pattern = re.compile(rb'<(/?)' + tag + rb'\b', re.IGNORECASE)
+    start = None
+    depth = 0
+    for match in pattern.finditer(content):
+        if not match.group(1):
+            if start is None:
+                start = match.start()
+            depth += 1
+        elif start is not None:
+            depth -= 1
+            if depth == 0:
+                end = content.find(b'>', match.end())
+                return content[start:end + 1 if end >= 0 else len(content)]
+    return content[start:] if start is not None else None
+
+
+def parse(content: bytes, encoding: str = 'utf-8'):
+    """원본 바이트를 바로 파싱 (문자열 디코딩 단계 생략)"""
+    parser = _PARSER if encoding == 'utf-8' else lxml_html.HTMLParser(
+        encoding=encoding, remove_comments=True)
+    return lxml_html.document_fromstring(content, parser=parser)
+
+
+def text_of(element) -> str:
+    """BeautifulSoup get_text(strip=True)와 같은 결과"""
+    if element is None:
+        return ''
+    return ''.join(part.strip() for part in element.itertext())
+
+
+def _first(xpath, element):
+    found = xpath(element)
+    return found[0] if found else None
+
+
+def _table_rows(content: bytes, encoding: str = 'utf-8'):
+    region = slice_element(content, b'table')
+    if region is None:
+        return None
+    table = _first(XPATH['table'], parse(region, encoding))
+    if table is None:
+        return None
+    return XPATH['rows'](table)[1:]  # 헤더 제외
+
+
+_PINNED_CLASSES = ('notice', 'fix', 'top', 'pin')
+
+
+def _is_pinned_row(row, cols) -> bool:
+    """상단 고정 행인지 (번호 칸이 '공지' 등이거나 행 class에 notice/fix/top 표시)"""
+    classes = (row.get('class') or '').lower().split()
+    if any(name.startswith(_PINNED_CLASSES) for name in classes):
+        return True
+    if cols:
+        first = cols[0]
+        label = text_of(first) or ' '.join(img.get('alt', '') for img in first.iter('img'))
+        return pinned_label(label)
+    return False
+
+
+def _absolute(href: str, base: str, relative_base: str = None) -> str:
+    if href.startswith('http'):
+        return href
+    if href.startswith('/') or relative_base is None:
+        return base + href
+    return relative_base + href
+
+
+Accept = Optional[Callable[[Dict], bool]]
+
+
+def parse_moel_press(content: bytes, encoding: str = 'utf-8', accept: Accept = None,
+                     min_relevance: Optional[float] = MOEL_MIN_RELEVANCE) -> Optional[List[Dict]]:
+    """고용노동부 보도자료 목록 (테이블이 없으면 None)
+
+    제목 관련도(keyword_matcher)가 min_relevance 이상인 게시물만 담는다.
+    accept(item)가 False를 반환하면 남은 행은 보지 않는다 (이미 수집한 구간).
+    """
+    rows = _table_rows(content, encoding)
+    if rows is None:
+        return None
+
+    matcher = get_matcher()
+    items = []
+    for row in rows[:15]:  # 최근 15개 체크
+        cols = XPATH['cells'](row)
+        if len(cols) < 4:
+            continue
+
+        link_tag = None
+        for col in cols:
+            link_tag = _first(XPATH['link'], col)
+            if link_tag is not None:
+                break
+        if link_tag is None:
+            continue
+
+        title = text_of(link_tag)
+        href = link_tag.get('href', '')
+        link = href if href.startswith('http') else \
+            "https://www.moel.go.kr/news/enews/report/" + href
+        date = text_of(cols[-2])
+
+        # 안전보건 관련 키워드 필터링
+        if matcher.relevant(title, min_relevance):
+            item = {
+                'title': title,
+                'date': date,
+                'link': link,
+                'source': '고용노동부'
+            }
+            if _is_pinned_row(row, cols):
+                item['pinned'] = True   # 이미 본 행 연속 횟수에서 제외 (seen_store)
+            items.append(item)
+            if accept is not None and not accept(item):
+                break
+    return items
+
+
+def parse_kosha_notice(content: bytes, encoding: str = 'utf-8',
+                       accept: Accept = None) -> Optional[List[Dict]]:
+    """산업안전포털 공지사항 목록 (테이블이 없으면 None)"""
+    rows = _table_rows(content, encoding)
+    if rows is None:
+        return None
+
+    items = []
+    for row in rows[:15]:
+        link_tag = _first(XPATH['link'], row)
+        if link_tag is None:
+            continue
+
+        href = link_tag.get('href', '')
+        cols = XPATH['cells'](row)
+        date = ''
+        for td in cols:
+            text = text_of(td)
+            if '.' in text and len(text) < 15:
+                date = text
+                break
+
+        item = {
+            'title': text_of(link_tag),
+            'date': date,
+            'link': _absolute(href, "https://portal.kosha.or.kr"),
+            'source': '산업안전포털'
+        }
+        if _is_pinned_row(row, cols):
+            item['pinned'] = True
+        items.append(item)
+        if accept is not None and not accept(item):
+            break
+    return items
+
+
+def parse_labor_news(content: bytes, encoding: str = 'utf-8', accept: Accept = None,
+                     learner=None) -> List[Dict]:
+    """매일노동뉴스 안전과 건강 코너 목록
+
+    learner(selector_cache.SelectorLearner)를 주면 목록 후보를 학습한 순서로 시도하고 결과를 기록한다.
+    """
+    root = parse(content, encoding)
+    base = "https://www.labortoday.co.kr"
+    relative_base = "https://www.labortoday.co.kr/news/"
+
+    names = learner.order('rows', list(LABOR_NEWS_LISTS)) if learner else list(LABOR_NEWS_LISTS)
+    articles = []
+    winner = None
+    for misses, name in enumerate(names):
+        articles = LABOR_NEWS_LISTS[name](root)
+        if articles:
+            winner = name
+            break
+    if learner is not None:
+        learner.record('rows', winner, misses if winner else 0)
+
+    items = []
+    if not articles:
+        # 테이블 형식인 경우
+        table = _first(XPATH['table'], root)
+        rows = XPATH['rows'](table)[1:] if table is not None else []
+        for row in rows[:15]:
+            link_tag = _first(XPATH['link'], row)
+            if link_tag is None:
+                continue
+
+            cols = XPATH['cells'](row)
+            date = ''
+            for td in cols:
+                text = text_of(td)
+                if '.' in text and len(text) < 20:  # 날짜 형식 추정
+                    date = text
+                    break
+
+            item = {
+                'title': text_of(link_tag),
+                'date': date,
+                'link': _absolute(link_tag.get('href', ''), base, relative_base),
+                'source': '매일노동뉴스'
+            }
+            if _is_pinned_row(row, cols):
+                item['pinned'] = True
+            items.append(item)
+            if accept is not None and not accept(item):
+                break
+        return items
+
+    # 기사 리스트 형식
+    for article in articles[:15]:
+        title_tag = _first(XPATH['link'], article)
+        if title_tag is None:
+            continue
+
+        date_tag = _first(XPATH['article_date'], article)
+        if date_tag is None:
+            date_tag = _first(XPATH['time'], article)
+
+        item = {
+            'title': text_of(title_tag),
+            'date': text_of(date_tag),
+            'link': _absolute(title_tag.get('href', ''), base, relative_base),
+            'source': '매일노동뉴스'
+        }
+        items.append(item)
+        if accept is not None and not accept(item):
+            break
+    return items
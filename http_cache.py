@@ -0,0 +1,170 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+HTTP 캐시 모듈 - 목록 페이지 조건부 요청(ETag/Last-Modified)과 파싱 결과 재사용
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+
+# 소스별 캐시 유지 시간(초) - 이 시간 안에는 서버에 요청하지 않고 캐시를 사용
+SOURCE_TTLS = {
+    'moel_press': 600,
+    'kosha_notice': 600,
+    'labor_news': 300,
+}
+
+
+def body_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """저장된 응답 1건"""
+    url: str
+    status_code: int
+    content: bytes
+    encoding: str
+    etag: str
+    last_modified: str
+    body_hash: str
+    stored_at: float
+
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+
+class HttpCache:
+    """SQLite 기반 디스크 HTTP 캐시
+
+    - 응답 본문과 검증자(ETag, Last-Modified)를 저장해 조건부 GET에 사용
+    - 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+    - 소스별로 마지막 파싱 결과를 본문 해시와 함께 저장해 같은 본문은 다시 파싱하지 않음
+    """
+
+    def __init__(self, path: str, max_bytes: int = 50 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                status_code INTEGER,
+                content BLOB,
+                encoding TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                body_hash TEXT,
+                size INTEGER,
+                stored_at REAL,
+                accessed_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed_at);
+            CREATE TABLE IF NOT EXISTS parsed (
+                source TEXT PRIMARY KEY,
+                body_hash TEXT,
+                items TEXT,
+                stored_at REAL
+            );
+        """)
+        self._conn.commit()
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+    # ----- 응답 캐시 -----
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status_code, content, encoding, etag, last_modified, "
+                "body_hash, stored_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?",
+                               (time.time(), url))
+            self._conn.commit()
+        return CacheEntry(*row)
+
+    def store(self, url: str, status_code: int, content: bytes, encoding: str,
+              headers: Dict[str, str]) -> str:
+        digest = body_hash(content)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, status_code, content, encoding,
+                 headers.get('ETag', ''), headers.get('Last-Modified', ''),
+                 digest, len(content), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+        return digest
+
+    def refresh(self, url: str, headers: Dict[str, str]):
+        """304 응답을 받았을 때 저장 시각과 검증자 갱신"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ?, "
+                "etag = COALESCE(NULLIF(?, ''), etag), "
+                "last_modified = COALESCE(NULLIF(?, ''), last_modified) WHERE url = ?",
+                (now, now, headers.get('ETag', ''), headers.get('Last-Modified', ''), url)
+            )
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, size in self._conn.execute(
+                "SELECT url, size FROM responses ORDER BY accessed_at").fetchall():
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    # ----- 파싱 결과 캐시 -----
+
+    def get_parsed(self, source: str, digest: str) -> Optional[List[Dict]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT items FROM parsed WHERE source = ? AND body_hash = ?",
+                (source, digest)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_parsed(self, source: str, digest: str, items: List[Dict]):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parsed VALUES (?, ?, ?, ?)",
+                (source, digest, json.dumps(items, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+
+    def note(self, outcome: str):
+        """캐시 사용 결과 집계 (hits / revalidations / misses)"""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {'entries': count, 'bytes': size, 'hits': self.hits,
+                'revalidations': self.revalidations, 'misses': self.misses}
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("DELETE FROM parsed")
+            self._conn.commit()
@@ -0,0 +1,306 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+HTTP 전송 모듈 - 연결 재사용, 재시도/백오프, 요청별 소요시간 기록
+"""
+
+import os
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from browser_pool import DEFAULT_USER_AGENT
+from collector import get_host_limiter
+from http_cache import HttpCache, body_hash
+from storage import data_path
+from telemetry import current_span, span
+
+# brotli가 설치되어 있으면 br 압축도 요청
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+
+# 호스트별 커넥션 풀 크기 (나머지는 기본값)
+HOST_POOL_SIZES = {
+    'www.moel.go.kr': 2,
+    'portal.kosha.or.kr': 2,
+    'www.labortoday.co.kr': 2,
+    'www.bigkinds.or.kr': 4,
+}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """재시도를 포함한 전체 시간 예산 초과"""
+
+
+@dataclass
+class FetchResult:
+    """HTTP 응답 (원본 바이트와 요청 통계 포함)"""
+    url: str
+    status_code: int
+    content: bytes
+    headers: Dict[str, str]
+    encoding: str = 'utf-8'
+    elapsed: float = 0.0
+    attempts: int = 1
+    from_cache: bool = False
+    _body_hash: Optional[str] = None
+
+    @property
+    def body_hash(self) -> str:
+        if self._body_hash is None:
+            self._body_hash = body_hash(self.content)
+        return self._body_hash
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def json(self):
+        import json
+        return json.loads(self.text)
+
+
+@dataclass
+class RequestTiming:
+    """요청 1건의 소요시간 기록"""
+    url: str
+    host: str
+    status: Optional[int]
+    elapsed: float
+    attempts: int
+    bytes: int = 0
+    error: str = ''
+    started_at: float = field(default_factory=time.time)
+
+
+class HttpTransport:
+    """공용 HTTP 전송 계층
+
+    - requests.Session 하나로 keep-alive 연결 재사용
+    - 호스트별 커넥션 풀 크기 지정
+    - 일시적 오류(연결 실패, 타임아웃, 429/5xx)는 지터 포함 지수 백오프로 재시도
+    - 재시도까지 포함한 전체 시간 예산(deadline) 적용
+    - cache가 있으면 cache_ttl을 지정한 GET 요청에 조건부 요청 적용
+    """
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.5,
+                 backoff_max: float = 8.0, default_pool_size: int = 4,
+                 pool_sizes: Optional[Dict[str, int]] = None,
+                 cache: Optional[HttpCache] = None):
+        self.cache = cache
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.limiter = get_host_limiter()
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': DEFAULT_USER_AGENT,
+            'Accept-Encoding': ACCEPT_ENCODING,
+        })
+        default_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=default_pool_size)
+        self.session.mount('http://', default_adapter)
+        self.session.mount('https://', default_adapter)
+        for host, size in (pool_sizes or HOST_POOL_SIZES).items():
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+            self.session.mount(f'https://{host}/', adapter)
+            self.session.mount(f'http://{host}/', adapter)
+
+        self._timings: deque = deque(maxlen=500)
+        self._lock = threading.Lock()
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        # full jitter
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _record(self, timing: RequestTiming):
+        with self._lock:
+            self._timings.append(timing)
+
+    def fetch(self, url: str, method: str = 'GET', params=None, data=None,
+              json=None, headers: Optional[Dict[str, str]] = None,
+              timeout: float = 15, deadline: float = 30,
+              encoding: Optional[str] = 'utf-8',
+              raise_for_status: bool = True,
+              cache_ttl: Optional[float] = None,
+              max_retries: Optional[int] = None) -> FetchResult:
+        """요청 실행 (실패 시 재시도, deadline 초과 시 DeadlineExceeded)
+
+        cache_ttl을 지정하면 그 시간 안의 캐시는 바로 반환하고,
+        지난 캐시는 If-None-Match / If-Modified-Since로 재검증한다.
+        max_retries를 주면 이 요청만 재시도 횟수를 바꾼다 (0이면 한 번만 시도).
+        """
+        with span('http.fetch', host=urlsplit(url).hostname or '', method=method) as s:
+            result = self._fetch_cached(url, method, params, data, json, headers, timeout,
+                                        deadline, encoding, raise_for_status, cache_ttl,
+                                        max_retries)
+            s.set(status=result.status_code, attempts=result.attempts, bytes=len(result.content))
+            return result
+
+    def _fetch_cached(self, url, method, params, data, json, headers, timeout, deadline,
+                      encoding, raise_for_status, cache_ttl, max_retries) -> FetchResult:
+        if self.cache is None or cache_ttl is None or method != 'GET' or params:
+            return self._fetch(url, method, params, data, json, headers,
+                               timeout, deadline, encoding, raise_for_status, max_retries)
+
+        entry = self.cache.lookup(url)
+        if entry is not None and entry.age() < cache_ttl:
+            self.cache.note('hits')
+            current_span().set(cache='hit')
+            return self._from_entry(entry)
+
+        headers = dict(headers or {})
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        result = self._fetch(url, method, params, data, json, headers,
+                             timeout, deadline, encoding, raise_for_status, max_retries)
+        if result.status_code == 304 and entry is not None:
+            self.cache.note('revalidations')
+            current_span().set(cache='revalidated')
+            self.cache.refresh(url, result.headers)
+            cached = self._from_entry(entry)
+            cached.elapsed = result.elapsed
+            cached.attempts = result.attempts
+            return cached
+
+        self.cache.note('misses')
+        current_span().set(cache='miss')
+        if result.status_code == 200:
+            result._body_hash = self.cache.store(url, result.status_code, result.content,
+                                                 result.encoding, result.headers)
+        return result
+
+    @staticmethod
+    def _from_entry(entry) -> FetchResult:
+        return FetchResult(
+            url=entry.url,
+            status_code=entry.status_code,
+            content=entry.content,
+            headers={},
+            encoding=entry.encoding,
+            elapsed=0.0,
+            attempts=0,
+            from_cache=True,
+            _body_hash=entry.body_hash,
+        )
+
+    def _fetch(self, url, method, params, data, json, headers, timeout, deadline,
+               encoding, raise_for_status, max_retries=None) -> FetchResult:
+        if max_retries is None:
+            max_retries = self.max_retries
+        host = urlsplit(url).hostname or ''
+        started = time.monotonic()
+        attempt = 0
+        last_error: Optional[Exception] = None
+
+        while True:
+            remaining = deadline - (time.monotonic() - started)
+            if remaining <= 0:
+                error = DeadlineExceeded(f"{url}: {deadline}초 내 응답 없음 ({last_error})")
+                self._record(RequestTiming(url, host, None, time.monotonic() - started,
+                                           attempt, error=type(last_error).__name__))
+                raise error
+
+            self.limiter.wait(host)
+            attempt += 1
+            retry_after = None
+            try:
+                response = self.session.request(
+                    method, url, params=params, data=data, json=json,
+                    headers=headers, timeout=min(timeout, remaining)
+                )
+                if response.status_code in RETRY_STATUSES and attempt <= max_retries:
+                    last_error = requests.HTTPError(f"HTTP {response.status_code}")
+                    retry_after = response.headers.get('Retry-After')
+                else:
+                    content = response.content
+                    elapsed = time.monotonic() - started
+                    self._record(RequestTiming(url, host, response.status_code, elapsed,
+                                               attempt, bytes=len(content)))
+                    if raise_for_status:
+                        response.raise_for_status()
+                    return FetchResult(
+                        url=response.url,
+                        status_code=response.status_code,
+                        content=content,
+                        headers=dict(response.headers),
+                        encoding=encoding or response.encoding or 'utf-8',
+                        elapsed=elapsed,
+                        attempts=attempt,
+                    )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                last_error = e
+                if attempt > max_retries:
+                    self._record(RequestTiming(url, host, None, time.monotonic() - started,
+                                               attempt, error=type(e).__name__))
+                    raise
+
+            delay = self._backoff(attempt - 1, retry_after)
+            time.sleep(max(0.0, min(delay, deadline - (time.monotonic() - started))))
+
+    def get(self, url: str, **kwargs) -> FetchResult:
+        return self.fetch(url, method='GET', **kwargs)
+
+    def post(self, url: str, **kwargs) -> FetchResult:
+        return self.fetch(url, method='POST', **kwargs)
+
+    def timings(self, host: Optional[str] = None) -> List[RequestTiming]:
+        """최근 요청별 소요시간 (host 지정 시 해당 호스트만)"""
+        with self._lock:
+            timings = list(self._timings)
+        if host:
+            timings = [t for t in timings if t.host == host]
+        return timings
+
+    def timing_summary(self) -> Dict[str, Dict[str, float]]:
+        """호스트별 요청 수·평균/최대 소요시간·재시도 횟수"""
+        summary: Dict[str, Dict[str, float]] = {}
+        for t in self.timings():
+            s = summary.setdefault(t.host, {'requests': 0, 'avg': 0.0, 'max': 0.0,
+                                            'retries': 0, 'errors': 0, 'bytes': 0})
+            s['requests'] += 1
+            s['avg'] += t.elapsed
+            s['max'] = max(s['max'], t.elapsed)
+            s['retries'] += t.attempts - 1
+            s['errors'] += 1 if t.error or (t.status or 0) >= 400 else 0
+            s['bytes'] += t.bytes
+        for s in summary.values():
+            s['avg'] /= s['requests']
+        return summary
+
+
+_transport: Optional[HttpTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """프로세스 공용 HTTP 전송 계층"""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            cache = None
+            if os.getenv('HTTP_CACHE_DISABLED', '') not in ('1', 'true'):
+                cache = HttpCache(
+                    data_path('http_cache.sqlite3'),
+                    max_bytes=int(os.getenv('HTTP_CACHE_MAX_MB', '50')) * 1024 * 1024,
+                )
+            _transport = HttpTransport(cache=cache)
+        return _transport
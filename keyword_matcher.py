@@ -0,0 +1,149 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+키워드 매칭 모듈 - 가중치가 있는 안전보건 용어 사전으로 제목을 한 번에 훑어 관련도를 계산
+
+키워드마다 제목을 다시 검사하는 대신 사전 전체를 긴 용어부터 나열한 정규식 하나로
+컴파일해 제목을 한 번만 훑는다 (같은 자리에서는 가장 긴 용어가 잡힘). 관련도는 찾은 용어
+가중치의 합이며, 수집 필터(SourceSpec.min_relevance)와 프롬프트에 넣기 전 순위
+매기기·건수 제한에 쓴다.
+
+사전은 KEYWORDS_PATH(기본: 데이터 디렉터리의 keywords.json)의 {"용어": 가중치}로
+덮어쓸 수 있다. 가중치를 0으로 주면 기본 사전의 용어를 뺀다.
+"""
+
+import json
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from models import NewsItem, as_item
+from storage import data_path
+
+
+# 기본 안전보건 용어 사전 (긴 용어 안에 든 짧은 용어는 긴 용어 하나로만 센다)
+SAFETY_TERMS: Dict[str, float] = {
+    '중대재해처벌법': 3.5,
+    '중대재해': 3.0,
+    '산업재해': 2.5,
+    '사망': 2.5,
+    '산재': 2.0,
+    '산업안전': 2.0,
+    '추락': 2.0,
+    '끼임': 2.0,
+    '질식': 2.0,
+    '폭발': 2.0,
+    '붕괴': 2.0,
+    '감전': 2.0,
+    '직업병': 2.0,
+    '재해': 1.5,
+    '사고': 1.5,
+    '화재': 1.5,
+    '중독': 1.5,
+    '안전': 1.0,
+    '보건': 1.0,
+    '위험': 1.0,
+    '근로': 0.5,
+    '노동': 0.5,
+}
+
+# 가중치가 이보다 낮은 용어(근로·노동)는 맥락어 - 안전보건 용어 없이 맥락어만으로는
+# 기준이 SAFETY_WEIGHT 이상인 필터를 통과하지 못함 (임금·노사 기사가 점수 합으로 넘어오지 않도록)
+SAFETY_WEIGHT = 1.0
+
+# 수집 필터 기준 - 고용노동부는 근로·노동만 있어도, 뉴스 검색은 안전보건 용어가 있어야 수집
+MOEL_MIN_RELEVANCE = 0.5
+NEWS_MIN_RELEVANCE = 1.0
+
+class KeywordMatcher:
+    """가중치 용어 사전을 컴파일한 정규식 (대소문자 구분 없음)"""
+
+    def __init__(self, terms: Dict[str, float]):
+        self.weights = {term.lower(): weight for term, weight in terms.items()
+                        if term and weight > 0}
+        # 긴 용어가 먼저 오면 같은 자리에서 긴 쪽이 잡혀 '중대재해' 안의 '재해'를 따로 세지 않음
+        alternatives = sorted(self.weights, key=lambda term: (-len(term), term))
+        self._pattern = re.compile('|'.join(map(re.escape, alternatives))) if alternatives else None
+
+    def _terms(self, text: str) -> List[str]:
+        """제목에 나온 용어 (나온 순서, 겹치는 일치는 앞의 것만)"""
+        if self._pattern is None or not text:
+            return []
+        return self._pattern.findall(text.lower())
+
+    def _score(self, terms: Iterable[str]) -> float:
+        return sum(self.weights[term] for term in set(terms))
+
+    def find(self, text: str) -> List[str]:
+        """제목에 나온 용어 (나온 순서, 중복 제외)"""
+        return list(dict.fromkeys(self._terms(text)))
+
+    def score(self, text: str) -> float:
+        """관련도 - 나온 용어 가중치의 합 (같은 용어는 한 번만)"""
+        return self._score(self._terms(text))
+
+    def relevant(self, text: str, min_relevance: Optional[float]) -> bool:
+        """관련도가 min_relevance 이상인지
+
+        min_relevance가 SAFETY_WEIGHT 이상이면 안전보건 용어(가중치 SAFETY_WEIGHT 이상)가
+        하나는 있어야 한다 - '최저임금 노동계 근로자 반발'처럼 맥락어만 모인 제목은 제외.
+        """
+        if min_relevance is None:
+            return True
+        terms = set(self._terms(text))
+        if self._score(terms) < min_relevance:
+            return False
+        return min_relevance < SAFETY_WEIGHT or any(
+            self.weights[term] >= SAFETY_WEIGHT for term in terms)
+
+    def score_many(self, texts: List[str]) -> List[float]:
+        """여러 제목의 관련도"""
+        return [self._score(self._terms(text)) for text in texts]
+
+
+def rank_items(data: Dict[str, List[NewsItem]], per_source: Optional[int] = None,
+               matcher: Optional[KeywordMatcher] = None) -> Dict[str, List[NewsItem]]:
+    """소스별로 관련도 높은 순으로 정렬하고 per_source건까지만 남김
+
+    관련도가 같으면 원래(최신) 순서를 지킨다. 항목은 relevance를 채운 새 항목.
+    """
+    matcher = matcher or get_matcher()
+    entries = [(category, as_item(item, category)) for category, items in data.items() for item in items]
+    scores = matcher.score_many([item.title for _, item in entries])
+
+    scored: Dict[str, List] = {category: [] for category in data}
+    for (category, item), score in zip(entries, scores):
+        scored[category].append((score, item))
+
+    ranked: Dict[str, List[NewsItem]] = {}
+    for category, pairs in scored.items():
+        pairs.sort(key=lambda pair: -pair[0])
+        # 잘려 나갈 항목은 새로 만들지 않음
+        ranked[category] = [item.replace(relevance=score) for score, item in pairs[:per_source]]
+    return ranked
+
+
+def load_terms(path: Optional[str] = None) -> Dict[str, float]:
+    """기본 사전에 사용자 사전(JSON)을 덮어쓴 용어 사전"""
+    terms = dict(SAFETY_TERMS)
+    path = path or os.getenv('KEYWORDS_PATH') or data_path('keywords.json')
+    if os.path.exists(path):
+        try:
+            with open(path, encoding='utf-8') as f:
+                terms.update({str(term): float(weight) for term, weight in json.load(f).items()})
+        except (OSError, ValueError, AttributeError, TypeError):
+            print(f"⚠️ 키워드 사전을 읽지 못해 기본 사전 사용: {path}")
+    return terms
+
+
+_matcher: Optional[KeywordMatcher] = None
+_matcher_lock = threading.Lock()
+
+
+def get_matcher() -> KeywordMatcher:
+    """공용 매처 (처음 사용할 때 사전을 읽어 정규식을 만듦)"""
+    global _matcher
+    with _matcher_lock:
+        if _matcher is None:
+            _matcher = KeywordMatcher(load_terms())
+        return _matcher
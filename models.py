@@ -0,0 +1,156 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+수집 항목 모델 - 불변·__slots__ 항목 타입과 직렬화
+
+항목마다 dict를 두면 키 문자열과 해시 테이블이 항목 수만큼 생기고, 소스 이름 같은 같은
+값도 항목마다 따로 만들어진다. NewsItem은 슬롯에 값만 담고 source·category·date는
+sys.intern으로 한 객체를 공유한다. 불변이라 여러 사용자의 세션이 같은 목록을 복사 없이
+함께 써도 안전하며, 값을 바꿀 때는 replace()로 새 항목을 만든다.
+
+파서·추적기(seen_store)는 지금처럼 dict를 다루고, SafetyNewsScraper._emit에서 NewsItem으로 바꾼다.
+"""
+
+import json
+import sys
+from dataclasses import dataclass, fields
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+try:
+    import msgpack
+except ImportError:  # msgpack이 없으면 pack/unpack은 JSON 바이트를 사용
+    msgpack = None
+
+
+@dataclass(frozen=True, slots=True)
+class NewsItem:
+    title: str
+    date: str = ''
+    link: str = ''
+    source: str = ''
+    category: str = ''
+    published_at: Optional[str] = None      # KST ISO 시각 (date_utils)
+    is_new: Optional[bool] = None           # 이전 실행에서 못 본 항목인지 (None: 이력 없음)
+    news_id: str = ''
+    relevance: Optional[float] = None       # 제목 관련도 (keyword_matcher)
+    collected_at: Optional[str] = None
+    alternates: Tuple[Dict[str, str], ...] = ()   # 유사 제목으로 합쳐진 다른 보도 (dedup)
+
+    def __post_init__(self):
+        # 반복되는 짧은 값은 한 객체를 공유 (이미 공유 객체면 다시 쓰지 않음)
+        for name in _INTERNED:
+            value = getattr(self, name)
+            if value:
+                interned = sys.intern(value)
+                if interned is not value:
+                    object.__setattr__(self, name, interned)
+
+    @property
+    def fresh(self) -> bool:
+        """프롬프트에 넣을 새 항목인지 (이력이 없으면 새 항목으로 봄)"""
+        return self.is_new is not False
+
+    def replace(self, **changes) -> 'NewsItem':
+        """일부 필드만 바꾼 새 항목
+
+        dataclasses.replace는 __init__을 다시 거쳐 항목마다 느리므로 슬롯 값을 그대로 옮긴다.
+        """
+        unknown = changes.keys() - _FIELD_SET
+        if unknown:
+            raise TypeError(f"알 수 없는 필드: {', '.join(sorted(unknown))}")
+        item = object.__new__(NewsItem)
+        for name in _FIELD_NAMES:
+            _set(item, name, changes[name] if name in changes else getattr(self, name))
+        if not changes.keys().isdisjoint(_INTERNED):
+            item.__post_init__()
+        return item
+
+    def get(self, key: str, default=None):
+        """dict 항목을 받던 코드(seen_store.item_key, XHR 탐색 등)와 호환되는 읽기"""
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def to_dict(self) -> Dict:
+        """기본값이 아닌 필드만 담은 dict (JSON 저장·다운로드용)"""
+        data = {'title': self.title}
+        for name in _OPTIONAL_FIELDS:
+            value = getattr(self, name)
+            if value not in (None, '', ()):
+                data[name] = list(value) if name == 'alternates' else value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Mapping, category: str = '') -> 'NewsItem':
+        """dict 항목에서 생성 (모르는 키는 버림, category가 비어 있으면 인자 값을 씀)
+
+        역직렬화 경로라 __init__을 거치지 않고 슬롯을 바로 채운다.
+        """
+        item = object.__new__(cls)
+        get = data.get
+        for name, default in _DEFAULTS:
+            value = get(name, default)
+            _set(item, name, default if value is None and default is not None else value)
+        for name in _INTERNED:
+            value = getattr(item, name)
+            if value:
+                _set(item, name, sys.intern(value))
+        if category and not item.category:
+            _set(item, 'category', sys.intern(category))
+        if item.alternates:
+            _set(item, 'alternates', tuple(item.alternates))
+        return item
+
+
+_INTERNED = ('source', 'category', 'date')
+_FIELD_NAMES = tuple(f.name for f in fields(NewsItem))
+_FIELD_SET = frozenset(_FIELD_NAMES)
+_DEFAULTS = tuple((f.name, '' if f.name == 'title' else f.default) for f in fields(NewsItem))
+_set = object.__setattr__
+_OPTIONAL_FIELDS = _FIELD_NAMES[1:]
+
+ItemLike = Union[NewsItem, Mapping]
+Results = Dict[str, List[NewsItem]]
+
+
+def as_item(item: ItemLike, category: str = '') -> NewsItem:
+    """NewsItem이면 그대로, dict면 변환"""
+    if isinstance(item, NewsItem):
+        return item
+    return NewsItem.from_dict(item, category)
+
+
+def as_results(data: Mapping[str, Iterable[ItemLike]]) -> Results:
+    return {category: [as_item(item, category) for item in items]
+            for category, items in data.items()}
+
+
+def to_plain(data: Mapping[str, Iterable[NewsItem]]) -> Dict[str, List[Dict]]:
+    return {category: [item.to_dict() for item in items] for category, items in data.items()}
+
+
+def dumps(data: Mapping[str, Iterable[NewsItem]], indent: Optional[int] = None) -> str:
+    """소스별 항목 목록을 JSON 문자열로"""
+    separators = None if indent else (',', ':')
+    return json.dumps(to_plain(data), ensure_ascii=False, indent=indent, separators=separators)
+
+
+def loads(text: Union[str, bytes]) -> Results:
+    return as_results(json.loads(text))
+
+
+def pack(data: Mapping[str, Iterable[NewsItem]]) -> bytes:
+    """소스별 항목 목록을 msgpack 바이트로 (msgpack이 없으면 JSON UTF-8)"""
+    if msgpack is None:
+        return dumps(data).encode('utf-8')
+    return msgpack.packb(to_plain(data), use_bin_type=True)
+
+
+def unpack(blob: bytes) -> Results:
+    if msgpack is None:
+        return loads(blob)
+    return as_results(msgpack.unpackb(blob, raw=False))
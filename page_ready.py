@@ -0,0 +1,292 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+페이지 준비 판단 모듈 - 고정 대기 대신 실제 신호(요소 수 안정, XHR 완료, DOM 변경 멈춤)를 기다림
+"""
+
+import atexit
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from dom_extract import BIGKINDS_SPEC, MAJOR_ACCIDENT_SPEC
+from storage import data_path, file_lock, read_json, write_json
+
+
+# 요소 수가 0보다 크고 settle_ms 동안 변하지 않으면 true
+SETTLE_JS = """
+({selector, settle}) => {
+  const state = window.__briefingSettle || (window.__briefingSettle = {});
+  const count = document.querySelectorAll(selector).length;
+  const now = performance.now();
+  const prev = state[selector];
+  if (!prev || prev.count !== count) {
+    state[selector] = {count: count, since: now};
+    return false;
+  }
+  return count > 0 && now - prev.since >= settle;
+}
+"""
+
+# DOM 변경 시각을 기록하는 MutationObserver 설치
+OBSERVE_JS = """
+() => {
+  window.__briefingLastMutation = performance.now();
+  if (!window.__briefingObserver) {
+    window.__briefingObserver = new MutationObserver(() => {
+      window.__briefingLastMutation = performance.now();
+    });
+    window.__briefingObserver.observe(document.documentElement,
+      {childList: true, subtree: true, characterData: true});
+  }
+}
+"""
+
+QUIET_JS = "(quiet) => performance.now() - window.__briefingLastMutation >= quiet"
+
+
+@dataclass(frozen=True)
+class ReadySpec:
+    """준비 신호 정의 (지정한 신호를 순서대로 모두 기다림)"""
+    selector: Optional[str] = None          # 요소 수가 안정될 때까지
+    settle_ms: int = 300
+    xhr_pattern: Optional[str] = None       # 일치하는 XHR/fetch가 모두 끝날 때까지
+    xhr_quiet_ms: int = 250
+    xhr_grace_ms: int = 1500                # 이 시간 안에 일치 요청이 없으면 신호 생략
+    mutation_quiet_ms: Optional[int] = None  # DOM 변경이 멈출 때까지
+    default_deadline_ms: int = 10000
+
+
+# 단계별 준비 신호
+READY_SPECS: Dict[str, ReadySpec] = {
+    'kosha_notice': ReadySpec(selector='tbody tr', default_deadline_ms=10000),
+    'major_accident': ReadySpec(
+        selector=', '.join(MAJOR_ACCIDENT_SPEC['rows']),
+        mutation_quiet_ms=300,
+        default_deadline_ms=5000,
+    ),
+    'bigkinds_page': ReadySpec(
+        selector='input[type="text"], #search-input',
+        settle_ms=100,
+        default_deadline_ms=5000,
+    ),
+    'bigkinds_results': ReadySpec(
+        selector=', '.join(BIGKINDS_SPEC['rows']),
+        xhr_pattern=r'/api/news/search',
+        mutation_quiet_ms=300,
+        default_deadline_ms=8000,
+    ),
+}
+
+
+class ReadinessTuner:
+    """단계별 실제 대기시간을 기록하고 다음 실행의 대기 한도를 조정
+
+    샘플이 충분하면 한도 = p95 × 1.5 + 500ms (기본값의 1/4 ~ 기본값 사이로 제한).
+    한도 안에 신호가 없으면 그 단계의 샘플을 버려 다음 대기는 기본 한도로 돌아간다
+    (짧게 줄어든 한도가 느린 날 계속 시간 초과만 내고 다시 늘지 못하는 것을 막음).
+    기록은 메모리에 모았다가 flush()에서 한 번에 저장한다.
+    """
+
+    def __init__(self, path: str, max_samples: int = 50, min_samples: int = 5):
+        self.path = path
+        self.max_samples = max_samples
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        saved = read_json(path, {})
+        self._samples: Dict[str, List[float]] = saved.get('samples', {})
+        self._timeouts: Dict[str, int] = saved.get('timeouts', {})
+        # 아직 저장하지 않은 변경 (단계 → 새 샘플, 시간 초과 수, 샘플 초기화 여부)
+        self._pending: Dict[str, Dict] = {}
+
+    @staticmethod
+    def _apply(samples: Dict[str, List[float]], timeouts: Dict[str, int],
+               stage: str, change: Dict, max_samples: int):
+        if change.get('reset'):
+            samples[stage] = []
+        merged = samples.setdefault(stage, [])
+        merged.extend(change.get('samples', []))
+        del merged[:-max_samples]
+        if change.get('timeouts'):
+            timeouts[stage] = timeouts.get(stage, 0) + change['timeouts']
+
+    def deadline_for(self, stage: str, default_ms: int) -> int:
+        with self._lock:
+            samples = sorted(self._samples.get(stage, []))
+        if len(samples) < self.min_samples:
+            return default_ms
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        return int(max(default_ms / 4, min(default_ms, p95 * 1.5 + 500)))
+
+    def record(self, stage: str, waited_ms: float, timed_out: bool):
+        """대기 결과 기록 (저장은 flush()에서)"""
+        with self._lock:
+            pending = self._pending.setdefault(stage, {'samples': [], 'timeouts': 0})
+            if timed_out:
+                change = {'reset': True, 'timeouts': 1}
+                # 초기화 전에 모은 샘플도 버림
+                pending.update(reset=True, samples=[])
+                pending['timeouts'] += 1
+            else:
+                change = {'samples': [round(waited_ms, 1)]}
+                pending['samples'].extend(change['samples'])
+            self._apply(self._samples, self._timeouts, stage, change, self.max_samples)
+
+    def flush(self):
+        """모은 기록을 파일에 저장 (다른 프로세스가 그사이 저장한 내용에 더함)"""
+        with self._lock:
+            if not self._pending:
+                return
+            try:
+                with file_lock(self.path):
+                    data = read_json(self.path, {})
+                    samples = data.setdefault('samples', {})
+                    timeouts = data.setdefault('timeouts', {})
+                    for stage, change in self._pending.items():
+                        self._apply(samples, timeouts, stage, change, self.max_samples)
+                    write_json(self.path, data)
+            except OSError:
+                return
+            self._samples, self._timeouts = samples, timeouts
+            self._pending.clear()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            stages = set(self._samples) | set(self._timeouts)
+            result = {}
+            for stage in stages:
+                samples = sorted(self._samples.get(stage, []))
+                result[stage] = {
+                    'samples': len(samples),
+                    'median_ms': samples[len(samples) // 2] if samples else 0.0,
+                    'timeouts': self._timeouts.get(stage, 0),
+                }
+            return result
+
+
+_tuner: Optional[ReadinessTuner] = None
+_tuner_lock = threading.Lock()
+
+
+def get_readiness_tuner() -> ReadinessTuner:
+    global _tuner
+    with _tuner_lock:
+        if _tuner is None:
+            _tuner = ReadinessTuner(data_path('readiness.json'))
+            atexit.register(_tuner.flush)
+        return _tuner
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+class PageNotReadyError(Exception):
+    """준비 신호가 필수인 소스(SourceSpec.require_ready)에서 한도 안에 신호가 없을 때"""
+
+    def __init__(self, stage: str):
+        super().__init__(f"준비 신호 없음 ({stage})")
+        self.stage = stage
+
+
+@dataclass
+class ReadyResult:
+    stage: str
+    waited_ms: float
+    deadline_ms: int
+    timed_out: bool
+
+
+class PageReadiness:
+    """페이지 준비 대기
+
+    XHR 신호는 요청이 시작되기 전에 감시해야 하므로, 클릭 등 동작 전에 생성하고
+    동작 후 wait()를 호출한다.
+    """
+
+    def __init__(self, page, stage: str, spec: Optional[ReadySpec] = None):
+        self.page = page
+        self.stage = stage
+        self.spec = spec or READY_SPECS[stage]
+        self.tuner = get_readiness_tuner()
+        self._pattern = re.compile(self.spec.xhr_pattern) if self.spec.xhr_pattern else None
+        self._inflight = 0
+        self._matched = 0
+        self._last_done = 0.0
+        if self._pattern:
+            page.on('request', self._on_request)
+            page.on('requestfinished', self._on_done)
+            page.on('requestfailed', self._on_done)
+
+    def _is_xhr(self, request) -> bool:
+        return request.resource_type in ('xhr', 'fetch') and bool(self._pattern.search(request.url))
+
+    def _on_request(self, request):
+        if self._is_xhr(request):
+            self._inflight += 1
+            self._matched += 1
+
+    def _on_done(self, request):
+        if self._is_xhr(request):
+            self._inflight = max(0, self._inflight - 1)
+            self._last_done = time.monotonic()
+
+    def _detach(self):
+        if self._pattern:
+            for event, handler in (('request', self._on_request),
+                                   ('requestfinished', self._on_done),
+                                   ('requestfailed', self._on_done)):
+                try:
+                    self.page.remove_listener(event, handler)
+                except Exception:
+                    pass
+
+    def _wait_xhr_idle(self, started: float, budget):
+        spec = self.spec
+        while True:
+            now = time.monotonic()
+            if self._matched == 0 and (now - started) * 1000 >= spec.xhr_grace_ms:
+                return
+            if self._matched and self._inflight == 0 \
+                    and (now - self._last_done) * 1000 >= spec.xhr_quiet_ms:
+                return
+            budget()
+            # wait_for_timeout 동안 Playwright 이벤트가 처리됨
+            self.page.wait_for_timeout(50)
+
+    def wait(self) -> ReadyResult:
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        spec = self.spec
+        deadline_ms = self.tuner.deadline_for(self.stage, spec.default_deadline_ms)
+        started = time.monotonic()
+
+        def budget() -> float:
+            remaining = deadline_ms - (time.monotonic() - started) * 1000
+            if remaining <= 0:
+                raise _BudgetExceeded()
+            return remaining
+
+        timed_out = False
+        try:
+            if self._pattern:
+                self._wait_xhr_idle(started, budget)
+            if spec.selector:
+                self.page.wait_for_function(
+                    SETTLE_JS, arg={'selector': spec.selector, 'settle': spec.settle_ms},
+                    polling=100, timeout=budget()
+                )
+            if spec.mutation_quiet_ms:
+                self.page.evaluate(OBSERVE_JS)
+                self.page.wait_for_function(
+                    QUIET_JS, arg=spec.mutation_quiet_ms, polling=100, timeout=budget()
+                )
+        except (PlaywrightTimeoutError, _BudgetExceeded):
+            timed_out = True
+        finally:
+            self._detach()
+
+        waited_ms = (time.monotonic() - started) * 1000
+        self.tuner.record(self.stage, waited_ms, timed_out)
+        return ReadyResult(self.stage, waited_ms, deadline_ms, timed_out)
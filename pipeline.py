@@ -0,0 +1,85 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+항목 파이프라인 - 수집 스트림(collector.StreamEvent)을 거르기·중복 제거·보강 단계로 처리
+
+각 단계는 이벤트 생성기를 받아 이벤트 생성기를 돌려주므로 자유롭게 이어 붙일 수 있고,
+항목은 도착하는 즉시 끝 단계까지 흘러간다. 'done' 이벤트는 그대로 통과시킨다.
+"""
+
+import re
+from datetime import datetime
+from typing import Callable, Iterable, Iterator
+
+from collector import StreamEvent
+from date_utils import now_kst, parse_date
+from models import NewsItem
+from seen_store import item_key, normalize_title
+
+
+Stage = Callable[[Iterable[StreamEvent]], Iterator[StreamEvent]]
+
+_SPACES = re.compile(r'\s+')
+
+
+def filter_stage(keep: Callable[[str, NewsItem], bool]) -> Stage:
+    """keep(source, item)이 False인 항목 제거"""
+    def stage(events):
+        for event in events:
+            if event.kind != 'item' or keep(event.source, event.item):
+                yield event
+    return stage
+
+
+def has_title(source: str, item: NewsItem) -> bool:
+    return bool(item.title.strip())
+
+
+def dedupe_stage() -> Stage:
+    """이번 수집 안에서 링크나 제목이 같은 항목 제거 (소스가 달라도)"""
+    def stage(events):
+        seen = set()
+        for event in events:
+            if event.kind == 'item':
+                keys = {item_key(event.item)}
+                title = normalize_title(event.item.title)
+                if title:
+                    keys.add('title:' + title)
+                if keys & seen:
+                    continue
+                seen.update(keys)
+            yield event
+    return stage
+
+
+def enrich_stage() -> Stage:
+    """화면·프롬프트에서 쓰는 필드 보강 (항목은 불변이므로 바꾼 값으로 새 항목을 만듦)
+
+    날짜는 KST로 파싱해 published_at을 붙이고 date를 'YYYY-MM-DD'로 맞춘다 (date_utils).
+    """
+    def stage(events):
+        now = now_kst()
+        for event in events:
+            if event.kind == 'item':
+                item = event.item
+                changes = {
+                    'title': _SPACES.sub(' ', item.title).strip(),
+                    'category': event.source,
+                    'collected_at': item.collected_at or datetime.now().isoformat(timespec='seconds'),
+                }
+                published = parse_date(item.date, now)
+                if published is not None:
+                    changes['published_at'] = published.isoformat(timespec='minutes')
+                    changes['date'] = published.strftime('%Y-%m-%d')
+                event = StreamEvent('item', event.source, item.replace(**changes))
+            yield event
+    return stage
+
+
+DEFAULT_STAGES = (filter_stage(has_title), dedupe_stage(), enrich_stage())
+
+
+def run_pipeline(events: Iterable[StreamEvent], stages=DEFAULT_STAGES) -> Iterator[StreamEvent]:
+    """이벤트 스트림에 단계를 차례로 적용"""
+    for stage in stages:
+        events = stage(events)
+    return iter(events)
@@ -0,0 +1,137 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+요청 차단 모듈 - 헤드리스 페이지에서 쓰지 않는 이미지·폰트·분석 스크립트 등을 차단
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+
+# 차단한 요청의 절감량 추정치 (리소스 유형별 평균 크기, byte)
+# 차단된 요청은 내려받지 않으므로 실제 크기를 알 수 없어 평균값으로 추정한다.
+TYPICAL_BYTES = {
+    'image': 40_000,
+    'font': 60_000,
+    'media': 500_000,
+    'stylesheet': 30_000,
+    'script': 50_000,
+    'xhr': 5_000,
+    'fetch': 5_000,
+    'other': 5_000,
+}
+
+ANALYTICS_DOMAINS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'googlesyndication.com', 'facebook.net', 'facebook.com',
+    'wcs.naver.net', 'analytics.naver.com', 'daumcdn.net', 'kakao.com',
+    'hotjar.com', 'clarity.ms',
+)
+
+
+def _matches(host: str, domains: Tuple[str, ...]) -> bool:
+    return any(host == d or host.endswith('.' + d) for d in domains)
+
+
+@dataclass(frozen=True)
+class RoutePolicy:
+    """리소스 유형·도메인별 허용/차단 규칙
+
+    판단 순서: 문서 요청은 항상 허용 → 차단 유형 → 차단 도메인
+    → allow_domains가 있으면 그 외 도메인 차단 → 나머지 허용
+    """
+    block_types: Tuple[str, ...] = ('image', 'font', 'media', 'stylesheet')
+    block_domains: Tuple[str, ...] = ANALYTICS_DOMAINS
+    allow_domains: Tuple[str, ...] = ()
+
+    def allows(self, resource_type: str, url: str) -> bool:
+        if resource_type == 'document':
+            return True
+        if resource_type in self.block_types:
+            return False
+        host = (urlsplit(url).hostname or '').lower()
+        if _matches(host, self.block_domains):
+            return False
+        if self.allow_domains and not _matches(host, self.allow_domains):
+            return False
+        return True
+
+
+# 브라우저 컨텍스트 키별 정책
+SOURCE_POLICIES: Dict[str, RoutePolicy] = {
+    'kosha': RoutePolicy(),
+    'bigkinds': RoutePolicy(),
+}
+
+
+@dataclass
+class RouteStats:
+    """요청 처리 집계"""
+    requests: int = 0
+    blocked: int = 0
+    bytes_loaded: int = 0
+    bytes_saved: int = 0
+    blocked_by_type: Dict[str, int] = field(default_factory=dict)
+
+    def copy(self) -> 'RouteStats':
+        return RouteStats(self.requests, self.blocked, self.bytes_loaded,
+                          self.bytes_saved, dict(self.blocked_by_type))
+
+    def minus(self, other: 'RouteStats') -> 'RouteStats':
+        return RouteStats(
+            self.requests - other.requests,
+            self.blocked - other.blocked,
+            self.bytes_loaded - other.bytes_loaded,
+            self.bytes_saved - other.bytes_saved,
+            {k: v - other.blocked_by_type.get(k, 0)
+             for k, v in self.blocked_by_type.items()
+             if v - other.blocked_by_type.get(k, 0)},
+        )
+
+    def add(self, other: 'RouteStats'):
+        self.requests += other.requests
+        self.blocked += other.blocked
+        self.bytes_loaded += other.bytes_loaded
+        self.bytes_saved += other.bytes_saved
+        for k, v in other.blocked_by_type.items():
+            self.blocked_by_type[k] = self.blocked_by_type.get(k, 0) + v
+
+
+class RouteFilter:
+    """브라우저 컨텍스트에 정책을 적용하고 요청 수·바이트를 집계"""
+
+    def __init__(self, policy: RoutePolicy):
+        self.policy = policy
+        self.stats = RouteStats()
+        self._lock = threading.Lock()
+
+    def install(self, context):
+        context.route('**/*', self._handle)
+        context.on('response', self._on_response)
+
+    def snapshot(self) -> RouteStats:
+        with self._lock:
+            return self.stats.copy()
+
+    def _handle(self, route):
+        request = route.request
+        resource_type = request.resource_type
+        allowed = self.policy.allows(resource_type, request.url)
+        with self._lock:
+            self.stats.requests += 1
+            if not allowed:
+                self.stats.blocked += 1
+                self.stats.blocked_by_type[resource_type] = \
+                    self.stats.blocked_by_type.get(resource_type, 0) + 1
+                self.stats.bytes_saved += TYPICAL_BYTES.get(resource_type, TYPICAL_BYTES['other'])
+        if allowed:
+            route.continue_()
+        else:
+            route.abort('blockedbyclient')
+
+    def _on_response(self, response):
+        length = response.headers.get('content-length', '')
+        if length.isdigit():
+            with self._lock:
+                self.stats.bytes_loaded += int(length)
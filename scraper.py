@@ -3,611 +3,504 @@
 데이터 수집 모듈
 """
 
-import requests
-from bs4 import BeautifulSoup
+import contextvars
+import sqlite3
 from datetime import datetime, timedelta
-from typing import List, Dict
-import time
-import os
-import subprocess
+from typing import List, Dict, Set, Union
+from urllib.parse import urlsplit
+
+from browser_pool import ensure_playwright_ready, get_browser_pool, playwright_available
+from collector import CollectionScheduler, get_host_limiter
+from http_client import get_transport
+from archive import get_archive
+from seen_store import get_seen_store, item_key, pinned_label
+from selector_cache import SelectorLearner, get_selector_cache
+from sources import SOURCES, SourceSpec
+from bigkinds_client import BigkindsClient
+from dom_extract import extract
+from dedup import deduplicate
+from keyword_matcher import get_matcher
+from models import NewsItem, Results, as_item
+from page_ready import PageNotReadyError, PageReadiness
+from telemetry import span
+from xhr_discovery import XhrRecorder, get_recipe_store, replay
 
-# Playwright는 선택적으로 import
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
-    
-    # Streamlit Cloud에서 자동으로 브라우저 설치
-    if not os.path.exists(os.path.expanduser("~/.cache/ms-playwright")):
-        print("🔄 Playwright 브라우저 설치 중...")
-        try:
-            subprocess.run(["playwright", "install", "chromium", "--with-deps"], 
-                         check=True, capture_output=True)
-            print("✅ Playwright 브라우저 설치 완료")
-        except Exception as e:
-            print(f"⚠️ Playwright 브라우저 설치 실패: {e}")
-            PLAYWRIGHT_AVAILABLE = False
-            
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
-    print("⚠️ Playwright가 설치되지 않았습니다. 일부 사이트 수집이 제한됩니다.")
+
+def __getattr__(name):
+    # PLAYWRIGHT_AVAILABLE은 import 시점이 아니라 조회할 때 판단 (Playwright는 첫 사용 때 로드)
+    if name == 'PLAYWRIGHT_AVAILABLE':
+        return playwright_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SafetyNewsScraper:
     """노동안전보건 관련 뉴스 스크래퍼"""
     
-    def __init__(self):
+    # 소스별 수집 주소 (벤치마크 등에서는 생성자 urls로 교체, 검색 API는 '<소스>_api')
+    SOURCE_URLS = {
+        **{key: spec.url for key, spec in SOURCES.items()},
+        **{key + '_api': spec.api_url for key, spec in SOURCES.items() if spec.api_url},
+    }
+    
+    def __init__(self, urls: Dict[str, str] = None):
+        self.urls = {**self.SOURCE_URLS, **(urls or {})}
         self.today = datetime.now().strftime("%Y-%m-%d")
-        self.results = {
+        self.results: Results = {
             'moel_press': [],          # 고용노동부 보도자료
             'kosha_notice': [],        # 산업안전포털 공지사항
             'major_accident': [],      # 중대재해 발생알림
             'labor_news': [],          # 매일노동뉴스
             'bigkinds_news': []        # Bigkinds 뉴스 검색
         }
+        # 항목이 추가될 때마다 on_item(source, item) 호출 (수집 스트리밍용, 여러 스레드에서 호출됨)
+        self.on_item = None
+        # 마지막 수집에서 접속·로딩에 실패한 소스와 오류 (소스 상태 기록용)
+        self.errors: Dict[str, Exception] = {}
     
-    def scrape_moel_press_release(self):
-        """고용노동부 보도자료 수집"""
-        print("📄 고용노동부 보도자료 수집 중...")
-        url = "https://www.moel.go.kr/news/enews/report/enewsList.do"
+    def _emit(self, category: str, item: Dict) -> NewsItem:
+        """파싱한 항목(dict)을 NewsItem으로 바꿔 결과에 추가하고 구독자에게 바로 전달"""
+        item = as_item(item, category)
+        self.results[category].append(item)
+        if self.on_item is not None:
+            self.on_item(category, item)
+        return item
+    
+    def _run_in_browser(self, collect, url: str, context_key: str = 'default'):
+        """공용 브라우저 풀에서 collect(page) 실행 (호스트별 요청 간격 준수)"""
+        with span('browser.run', context=context_key):
+            get_host_limiter().wait(urlsplit(url).hostname or '')
+            # 브라우저 풀 스레드에서 실행되는 구간도 이 수집의 하위 구간으로 기록
+            context = contextvars.copy_context()
+            future = get_browser_pool().submit(lambda page: context.run(collect, page),
+                                               context_key=context_key)
+            result = future.result()
+        route_stats = getattr(future, 'route_stats', None)
+        if route_stats and route_stats.blocked:
+            print(f"  🚫 요청 {route_stats.requests}건 중 {route_stats.blocked}건 차단 "
+                  f"(약 {route_stats.bytes_saved // 1024}KB 절감)")
+        return result
+    
+    def _wait_ready(self, page, stage: str, readiness: PageReadiness = None) -> bool:
+        """페이지 준비 신호 대기 (고정 대기 대신). 한도 안에 준비되면 True"""
+        with span('page.wait', stage=stage) as s:
+            result = (readiness or PageReadiness(page, stage)).wait()
+            s.set(waited_ms=round(result.waited_ms), timed_out=result.timed_out)
+        if result.timed_out:
+            print(f"  ⏱️ 준비 신호 없음 ({result.deadline_ms}ms 초과) - 현재 상태로 진행")
+        else:
+            print(f"  ⏱️ 준비 완료 {result.waited_ms:.0f}ms")
+        return not result.timed_out
+    
+    def _collect_from_recipe(self, spec: SourceSpec) -> bool:
+        """저장된 XHR 레시피로 브라우저 없이 수집. 레시피가 없거나 깨졌으면 False"""
+        store = get_recipe_store()
+        recipe = store.get(spec.key) if store else None
+        if recipe is None:
+            return False
         
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, timeout=30, headers=headers)
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 테이블에서 최근 게시물 추출
-            table = soup.find('table')
-            if not table:
-                print("  ⚠️ 테이블을 찾을 수 없습니다")
-                return
-            
-            rows = table.find_all('tr')[1:]  # 헤더 제외
-            
-            for row in rows[:15]:  # 최근 15개 체크
-                try:
-                    cols = row.find_all('td')
-                    if len(cols) < 4:
-                        continue
-                    
-                    # 제목 열 찾기 (보통 2번째 td)
-                    title_col = None
-                    for col in cols:
-                        link_tag = col.find('a')
-                        if link_tag:
-                            title_col = col
-                            break
-                    
-                    if not title_col:
-                        continue
-                    
-                    link_tag = title_col.find('a')
-                    title = link_tag.get_text(strip=True)
-                    href = link_tag.get('href', '')
-                    
-                    # 링크 처리
-                    if href.startswith('http'):
-                        link = href
-                    else:
-                        link = "https://www.moel.go.kr/news/enews/report/" + href
-                    
-                    # 날짜 추출 (마지막에서 2번째 열)
-                    date = cols[-2].get_text(strip=True) if len(cols) >= 2 else ''
-                    
-                    # 안전보건 관련 키워드 필터링
-                    keywords = ['안전', '산재', '중대재해', '보건', '재해', '사고', '위험', '근로', '노동']
-                    if any(keyword in title for keyword in keywords):
-                        self.results['moel_press'].append({
-                            'title': title,
-                            'date': date,
-                            'link': link,
-                            'source': '고용노동부'
-                        })
-                except Exception as e:
-                    continue
-            
-            print(f"  ✅ {len(self.results['moel_press'])}건 수집 완료")
-            
+            with span('recipe.replay', source=spec.key) as s:
+                rows = [row for row in replay(recipe, get_transport(), limit=spec.limit) if row['title']]
+                s.set(rows=len(rows))
+            if not rows:
+                raise ValueError("항목 없음")
         except Exception as e:
-            print(f"  ❌ 수집 실패: {e}")
-    
-    def scrape_kosha_with_playwright(self):
-        """산업안전포털 공지사항 수집 (Playwright 사용)"""
-        print("📄 산업안전포털 공지사항 수집 중...")
+            print(f"  ⚠️ XHR 레시피 실패 ({e}) - 브라우저로 재시도")
+            store.discard(spec.key)
+            return False
         
-        if not PLAYWRIGHT_AVAILABLE:
-            print("  ⚠️ Playwright 미설치 - 건너뜀 (requests 방식으로 시도)")
-            self.scrape_kosha_with_requests()
+        self._add_rows(spec, rows)
+        print(f"  ⚡ XHR 레시피로 수집 (브라우저 생략)")
+        return True
+    
+    def _learn_recipe(self, category: str, recorder: XhrRecorder):
+        """브라우저 수집 결과와 일치하는 JSON 응답을 찾아 레시피로 저장"""
+        store = get_recipe_store()
+        if recorder is None or store is None:
             return
+        try:
+            recipe = recorder.discover(category, self.results[category])
+        except Exception:
+            recipe = None
+        if recipe is not None:
+            store.put(recipe)
+            print(f"  🧪 데이터 XHR 발견 - 다음부터 브라우저 없이 수집 ({recipe.method} {recipe.url})")
+    
+    def _tracker(self, category: str):
+        """수집 이력으로 새 항목을 표시하는 추적기 (이력 저장소를 끄면 None)"""
+        store = get_seen_store()
+        return store.tracker(category) if store else None
+    
+    def _reuse_parsed(self, category: str, response) -> bool:
+        """본문이 지난번과 같으면 저장된 파싱 결과를 그대로 사용"""
+        cache = get_transport().cache
+        if cache is None:
+            return False
+        items = cache.get_parsed(category, response.body_hash)
+        if items is None:
+            return False
         
+        # 새 항목 여부는 실행할 때마다 다시 판단
+        track = self._tracker(category)
+        for item in items:
+            keep_going = track(item) if track else True
+            self._emit(category, item)
+            if not keep_going:
+                break
+        print(f"  ♻️ 변경 없음 - 이전 결과 재사용 ({len(self.results[category])}건)")
+        return True
+    
+    def _store_parsed(self, category: str, response, items: List[Dict]):
+        # 파서가 낸 dict 그대로 저장 (상단 고정 표시 등 항목 모델에 없는 값도 재사용 때 필요)
+        cache = get_transport().cache
+        if cache is not None:
+            cache.put_parsed(category, response.body_hash, items)
+    
+    # ----- 소스 목록(sources.SOURCES) 기반 수집 -----
+    
+    def collect(self, key: str, keywords: Union[str, List[str]] = "산업안전 중대재해",
+                start_date: str = None, end_date: str = None, mode: str = None):
+        """등록된 소스 하나를 수집 방식에 맞게 수집
+
+        mode를 주면 소스의 기본 수집 방식 대신 사용 (예: 브라우저 소스를 'http'로).
+        start_date·end_date는 검색 소스의 기간.
+        """
+        spec = SOURCES[key]
+        mode = mode or spec.mode
+        self.errors.pop(key, None)
+        with span('scrape.collect', source=key, mode=mode) as s:
+            if mode == 'search':
+                queries = self._split_queries(keywords)
+                print(spec.label.format(keywords=', '.join(queries)))
+                self._collect_search(spec, queries, start_date, end_date)
+            else:
+                print(spec.label)
+                if mode == 'http':
+                    self._collect_http(spec)
+                else:
+                    self._collect_browser(spec)
+            s.set(items=len(self.results[key]))
+            if key in self.errors:
+                s.error = type(self.errors[key]).__name__
+        self._archive(key)
+        return self.results[key]
+    
+    def _archive(self, key: str):
+        """수집한 항목을 자료 보관소에 추가 (보관소 오류로 수집이 실패하지는 않음)"""
+        archive = get_archive()
+        if archive is None or not self.results[key]:
+            return
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                )
-                page = context.new_page()
-                
-                # 타임아웃 짧게 설정 (20초)
-                page.set_default_timeout(20000)
-                
-                print("  → 페이지 로딩 중...")
-                try:
-                    page.goto("https://portal.kosha.or.kr/community/notice", 
-                             wait_until='domcontentloaded', timeout=15000)
-                except:
-                    print("  ⚠️ 페이지 로딩 시간 초과 - 건너뜀")
-                    browser.close()
-                    return
-                
-                # 테이블 대기 (짧은 시간)
-                try:
-                    page.wait_for_selector('table', timeout=10000)
-                except:
-                    print("  ⚠️ 데이터 로딩 실패 - 건너뜀")
-                    browser.close()
-                    return
-                
-                print("  → 데이터 추출 중...")
-                rows = page.query_selector_all('tbody tr')
-                
-                count = 0
-                for row in rows[:15]:
-                    try:
-                        tds = row.query_selector_all('td')
-                        if len(tds) < 3:
-                            continue
-                        
-                        title_elem = None
-                        date_elem = None
-                        
-                        for td in tds:
-                            link = td.query_selector('a')
-                            if link and not title_elem:
-                                title_elem = link
-                        
-                        if len(tds) >= 4:
-                            date_elem = tds[-2]
-                        
-                        if title_elem:
-                            title = title_elem.inner_text().strip()
-                            href = title_elem.get_attribute('href') or ''
-                            date = date_elem.inner_text().strip() if date_elem else ''
-                            
-                            if href.startswith('http'):
-                                link = href
-                            else:
-                                link = "https://portal.kosha.or.kr" + href
-                            
-                            self.results['kosha_notice'].append({
-                                'title': title,
-                                'date': date,
-                                'link': link,
-                                'source': '산업안전포털'
-                            })
-                            count += 1
-                    except:
-                        continue
-                
-                browser.close()
+            added = archive.add_items(key, self.results[key])
+        except sqlite3.Error as e:
+            print(f"  ⚠️ 보관소 저장 실패: {e}")
+            return
+        if added:
+            print(f"  📦 보관소에 {added}건 추가")
+    
+    def _learner(self, key: str):
+        cache = get_selector_cache()
+        return SelectorLearner(cache, key) if cache else None
+    
+    @staticmethod
+    def _split_queries(keywords: Union[str, List[str]]) -> List[str]:
+        if isinstance(keywords, str):
+            return [q.strip() for q in keywords.split(',') if q.strip()]
+        return list(keywords)
+    
+    @staticmethod
+    def _matches(spec: SourceSpec, title: str) -> bool:
+        return get_matcher().relevant(title, spec.min_relevance)
+    
+    def _add_rows(self, spec: SourceSpec, rows: List[Dict[str, str]], skip: Set[str] = None):
+        """추출한 행을 항목으로 만들어 결과에 추가 (이미 수집한 구간에 닿으면 중단)
+
+        skip: 이미 결과에 있는 항목 키(item_key) - 같은 항목은 다시 넣지 않음
+        """
+        track = self._tracker(spec.key)
+        for row in rows:
+            title = row.get('title', '')
+            if not title or not self._matches(spec, title):
+                continue
             
-            print(f"  ✅ {len(self.results['kosha_notice'])}건 수집 완료")
+            item = {
+                'title': title,
+                'date': row.get('date') or (self.today if spec.date_default_today else ''),
+            }
+            if 'href' in row:
+                href = row['href']
+                if href.startswith('http'):
+                    item['link'] = href
+                elif href.startswith('/'):
+                    item['link'] = spec.link_base + href
+                else:
+                    item['link'] = ''
+            elif row.get('link'):
+                item['link'] = row['link']
+            item['source'] = row.get('source') or spec.source_name
+            if pinned_label(row.get('number', '')):
+                item['pinned'] = True
+            if skip and item_key(item) in skip:
+                continue
             
-        except Exception as e:
-            print(f"  ⚠️ 접속 불가 - 건너뜀")
+            # 새 항목 여부를 먼저 표시해야 구독자(화면)도 같은 값을 받음
+            keep_going = track(item) if track else True
+            self._emit(spec.key, item)
+            if not keep_going:
+                break
     
-    def scrape_kosha_with_requests(self):
-        """산업안전포털 공지사항 수집 (requests 사용)"""
+    def _collect_http(self, spec: SourceSpec):
+        """목록 페이지를 받아 파서로 추출"""
         try:
-            url = "https://portal.kosha.or.kr/community/notice"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, timeout=15, headers=headers)
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'html.parser')
+            response = get_transport().get(self.urls[spec.key], timeout=spec.timeout,
+                                           deadline=spec.deadline, cache_ttl=spec.cache_ttl)
+            if self._reuse_parsed(spec.key, response):
+                return
+            
+            options = dict(spec.parser_options)
+            if spec.learn_parser:
+                options['learner'] = self._learner(spec.key)
+            with span('parse', parser=spec.parser.__name__) as s:
+                items = spec.parser(response.content, response.encoding,
+                                    accept=self._tracker(spec.key), **options)
+                s.set(items=len(items) if items is not None else None)
+            if items is None:
+                print("  ⚠️ 목록을 찾을 수 없습니다")
+                return
             
-            # 테이블에서 데이터 추출 시도
-            table = soup.find('table')
-            if table:
-                rows = table.find_all('tr')[1:]  # 헤더 제외
-                
-                for row in rows[:15]:
-                    try:
-                        link_tag = row.find('a')
-                        if not link_tag:
-                            continue
-                        
-                        title = link_tag.get_text(strip=True)
-                        href = link_tag.get('href', '')
-                        
-                        if href.startswith('http'):
-                            link = href
-                        else:
-                            link = "https://portal.kosha.or.kr" + href
-                        
-                        # 날짜 찾기
-                        tds = row.find_all('td')
-                        date = ''
-                        for td in tds:
-                            text = td.get_text(strip=True)
-                            if '.' in text and len(text) < 15:
-                                date = text
-                                break
-                        
-                        self.results['kosha_notice'].append({
-                            'title': title,
-                            'date': date,
-                            'link': link,
-                            'source': '산업안전포털'
-                        })
-                    except:
-                        continue
+            for item in items:
+                self._emit(spec.key, item)
+            self._store_parsed(spec.key, response, items)
+            print(f"  ✅ {len(self.results[spec.key])}건 수집 완료")
             
-            print(f"  ✅ {len(self.results['kosha_notice'])}건 수집 완료")
         except Exception as e:
-            print(f"  ⚠️ 접속 불가 - 건너뜀")
+            self.errors[spec.key] = e
+            print(f"  ❌ 수집 실패: {e}")
     
-    def scrape_major_accidents(self):
-        """중대재해 발생알림 수집"""
-        print("🚨 중대재해 발생알림 수집 중...")
+    def _extract_rows(self, spec: SourceSpec, page):
+        """학습한 셀렉터 순서로 추출하고 어떤 셀렉터가 맞았는지 기록"""
+        learner = self._learner(spec.key)
+        dom = learner.apply(spec.dom) if learner else spec.dom
+        with span('extract', source=spec.key) as s:
+            extracted = extract(page, dom)
+            s.set(rows=len(extracted.rows), row_selector=extracted.row_selector)
+        if learner:
+            learner.learn(dom, extracted)
+        return extracted.rows
+    
+    def _collect_browser(self, spec: SourceSpec):
+        """브라우저로 동적 페이지 수집 (XHR 레시피가 있으면 브라우저 생략)"""
+        if spec.use_recipe and self._collect_from_recipe(spec):
+            print(f"  ✅ {len(self.results[spec.key])}건 수집 완료")
+            return
         
-        if not PLAYWRIGHT_AVAILABLE:
-            print("  ⚠️ Playwright 미설치 - 건너뜀")
+        if not ensure_playwright_ready():
+            if spec.parser is not None:
+                print("  ⚠️ Playwright 미설치 - requests 방식으로 시도")
+                self._collect_http(spec)
+            else:
+                print("  ⚠️ Playwright 미설치 - 건너뜀")
             return
         
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                )
-                page = context.new_page()
-                page.set_default_timeout(20000)
-                
-                print("  → 페이지 로딩 중...")
-                try:
-                    page.goto(
-                        "https://portal.kosha.or.kr/archive/imprtnDsstrAlrame/CSADV50000/CSADV50000M02",
-                        wait_until='domcontentloaded', timeout=15000
-                    )
-                except:
-                    print("  ⚠️ 페이지 로딩 시간 초과 - 건너뜀")
-                    browser.close()
-                    return
-                
-                # 약간만 대기
-                page.wait_for_timeout(2000)
-                
-                # 여러 선택자 시도
-                print("  → 데이터 추출 중...")
-                selectors = [
-                    '.card-list .card-item',
-                    'article',
-                    '.list-item',
-                    '[class*="card"]'
-                ]
-                
-                cards = []
-                for selector in selectors:
-                    try:
-                        cards = page.query_selector_all(selector)
-                        if len(cards) > 0:
-                            break
-                    except:
-                        continue
-                
-                if cards:
-                    for card in cards[:5]:
-                        try:
-                            title = ''
-                            title_selectors = ['.card-title', 'h3', 'h4', '.title', 'a']
-                            
-                            for ts in title_selectors:
-                                title_elem = card.query_selector(ts)
-                                if title_elem:
-                                    title = title_elem.inner_text().strip()
-                                    break
-                            
-                            if not title:
-                                title = card.inner_text().strip()[:100]
-                            
-                            date = ''
-                            date_selectors = ['.card-date', '.date', 'time', 'span']
-                            for ds in date_selectors:
-                                date_elem = card.query_selector(ds)
-                                if date_elem:
-                                    date_text = date_elem.inner_text().strip()
-                                    if len(date_text) > 0 and len(date_text) < 20:
-                                        date = date_text
-                                        break
-                            
-                            if title:
-                                self.results['major_accident'].append({
-                                    'title': title,
-                                    'date': date or self.today,
-                                    'source': '안전보건공단'
-                                })
-                        except:
-                            continue
-                
-                browser.close()
+        def collect(page):
+            # 타임아웃 짧게 설정 (20초)
+            page.set_default_timeout(20000)
+            recorder = XhrRecorder(page) if spec.use_recipe and get_recipe_store() else None
             
-            print(f"  ✅ {len(self.results['major_accident'])}건 수집 완료")
+            print("  → 페이지 로딩 중...")
+            try:
+                with span('page.goto', source=spec.key):
+                    page.goto(self.urls[spec.key], wait_until='domcontentloaded', timeout=15000)
+            except Exception as e:
+                self.errors[spec.key] = e
+                print("  ⚠️ 페이지 로딩 시간 초과 - 건너뜀")
+                return
+            
+            # 목록이 안정될 때까지 대기
+            if not self._wait_ready(page, spec.ready_stage) and spec.require_ready:
+                # 소스 상태에서 실패로 세도록 오류를 남김 (차단기가 동작해야 함)
+                self.errors[spec.key] = PageNotReadyError(spec.ready_stage)
+                print("  ⚠️ 데이터 로딩 실패 - 건너뜀")
+                return
+            
+            print("  → 데이터 추출 중...")
+            self._add_rows(spec, self._extract_rows(spec, page))
+            self._learn_recipe(spec.key, recorder)
+        
+        try:
+            self._run_in_browser(collect, self.urls[spec.key], context_key=spec.context_key)
+            print(f"  ✅ {len(self.results[spec.key])}건 수집 완료")
             
         except Exception as e:
+            self.errors[spec.key] = e
             print(f"  ⚠️ 접속 불가 - 건너뜀")
     
-    def scrape_labor_news(self):
-        """매일노동뉴스 안전과 건강 코너 수집"""
-        print("📰 매일노동뉴스 수집 중...")
-        
+    def _collect_search(self, spec: SourceSpec, queries: List[str],
+                        start_date: str = None, end_date: str = None):
+        """검색 API 우선, 실패하면 브라우저로 검색"""
         try:
-            url = "https://www.labortoday.co.kr/news/articleList.html?sc_section_code=S1N7&view_type=sm"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, timeout=30, headers=headers)
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 여러 선택자 시도
-            selectors = [
-                '.article-list .article-item',
-                'article',
-                '.list-group .list-group-item',
-                'table tbody tr'
-            ]
-            
-            articles = []
-            for selector in selectors:
-                articles = soup.select(selector)
-                if len(articles) > 0:
-                    break
-            
-            # 테이블 형식인 경우
-            if not articles:
-                table = soup.find('table')
-                if table:
-                    rows = table.find_all('tr')[1:]  # 헤더 제외
-                    for row in rows[:15]:
-                        try:
-                            link_tag = row.find('a')
-                            if not link_tag:
-                                continue
-                            
-                            title = link_tag.get_text(strip=True)
-                            href = link_tag.get('href', '')
-                            
-                            # 링크 처리
-                            if href.startswith('http'):
-                                link = href
-                            elif href.startswith('/'):
-                                link = "https://www.labortoday.co.kr" + href
-                            else:
-                                link = "https://www.labortoday.co.kr/news/" + href
-                            
-                            # 날짜 찾기
-                            date_text = ''
-                            tds = row.find_all('td')
-                            for td in tds:
-                                text = td.get_text(strip=True)
-                                if '.' in text and len(text) < 20:  # 날짜 형식 추정
-                                    date_text = text
-                                    break
-                            
-                            self.results['labor_news'].append({
-                                'title': title,
-                                'date': date_text,
-                                'link': link,
-                                'source': '매일노동뉴스'
-                            })
-                        except:
-                            continue
-            else:
-                # 기사 리스트 형식
-                for article in articles[:15]:
-                    try:
-                        # 제목과 링크 찾기
-                        title_tag = article.find('a') or article.select_one('.article-title a')
-                        if not title_tag:
-                            continue
-                        
-                        title = title_tag.get_text(strip=True)
-                        href = title_tag.get('href', '')
-                        
-                        # 링크 처리
-                        if href.startswith('http'):
-                            link = href
-                        elif href.startswith('/'):
-                            link = "https://www.labortoday.co.kr" + href
-                        else:
-                            link = "https://www.labortoday.co.kr/news/" + href
-                        
-                        # 날짜 찾기
-                        date_tag = article.select_one('.article-date') or article.find('time')
-                        date = date_tag.get_text(strip=True) if date_tag else ''
-                        
-                        self.results['labor_news'].append({
-                            'title': title,
-                            'date': date,
-                            'link': link,
-                            'source': '매일노동뉴스'
-                        })
-                    except:
-                        continue
-            
-            print(f"  ✅ {len(self.results['labor_news'])}건 수집 완료")
-            
+            self._search_api(spec, queries, start_date, end_date)
+            print(f"  ✅ {len(self.results[spec.key])}건 수집 완료")
+            return
         except Exception as e:
-            print(f"  ❌ 수집 실패: {e}")
+            print(f"  ⚠️ 검색 API 실패 ({e}) - 브라우저로 재시도")
+            self.errors[spec.key] = e
+        
+        # 실패 전에 받은 항목은 이미 화면(on_item)에 나갔으므로 결과에도 남기고,
+        # 브라우저 검색에서는 그 항목들을 빼고 추가
+        emitted = {item_key(item) for item in self.results[spec.key]}
+        self._search_in_browser(spec, ' '.join(queries), skip=emitted)
     
-    def search_bigkinds_news(self, keywords: str = "산업안전 중대재해"):
-        """Bigkinds에서 뉴스 검색"""
-        print(f"🔍 Bigkinds 뉴스 검색 중 (키워드: {keywords})...")
+    def _search_api(self, spec: SourceSpec, queries: List[str], start_date: str = None,
+                    end_date: str = None):
+        """검색 API로 여러 검색어·여러 페이지를 병렬 조회 (결과는 도착하는 대로 반영)"""
+        client = BigkindsClient(search_url=self.urls[spec.key + '_api'])
+        track = self._tracker(spec.key)
         
-        if not PLAYWRIGHT_AVAILABLE:
+        with span('search.api', source=spec.key, queries=len(queries)) as s:
+            for item in client.search(queries, start_date, end_date):
+                if not self._matches(spec, item['title']):
+                    continue
+                item['date'] = item['date'] or self.today
+                keep_going = track(item) if track else True
+                self._emit(spec.key, item)
+                if not keep_going:
+                    break
+            s.set(items=len(self.results[spec.key]))
+    
+    def _search_in_browser(self, spec: SourceSpec, keywords: str, skip: Set[str] = None):
+        """검색 화면을 직접 조작해 검색 (검색 API를 쓸 수 없을 때)"""
+        if not ensure_playwright_ready():
             print("  ⚠️ Playwright 미설치 - 건너뜀")
             return
         
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                )
-                page = context.new_page()
-                page.set_default_timeout(20000)
-                
-                print("  → 검색 페이지 접속 중...")
-                try:
-                    # 통합검색 페이지로 이동
-                    page.goto("https://www.bigkinds.or.kr/v2/news/search.do", 
+        def collect(page):
+            page.set_default_timeout(20000)
+            
+            print("  → 검색 페이지 접속 중...")
+            try:
+                # 통합검색 페이지로 이동
+                with span('page.goto', source=spec.key):
+                    page.goto(self.urls[spec.key], 
                              wait_until='domcontentloaded', timeout=15000)
-                    page.wait_for_timeout(2000)
-                except:
-                    print("  ⚠️ 페이지 접속 실패 - 건너뜀")
-                    browser.close()
-                    return
-                
-                # 검색어 입력
-                try:
-                    search_box = page.query_selector('input[type="text"]') or page.query_selector('#search-input')
-                    if search_box:
-                        search_box.fill(keywords)
-                        page.wait_for_timeout(500)
-                        
-                        # 검색 버튼 클릭
-                        search_btn = page.query_selector('button[type="submit"]') or page.query_selector('.btn-search')
-                        if search_btn:
-                            search_btn.click()
-                            page.wait_for_timeout(3000)
-                        else:
-                            # 엔터키로 검색
-                            search_box.press('Enter')
-                            page.wait_for_timeout(3000)
-                except:
-                    print("  ⚠️ 검색 실행 실패 - 건너뜀")
-                    browser.close()
-                    return
-                
-                print("  → 검색 결과 추출 중...")
-                
-                # 검색 결과 추출
-                # Bigkinds는 동적 로딩이므로 여러 선택자 시도
-                selectors = [
-                    '.news-item',
-                    '.search-result-item',
-                    'article',
-                    '.list-item',
-                    '[class*="result"]'
-                ]
-                
-                results = []
-                for selector in selectors:
-                    try:
-                        results = page.query_selector_all(selector)
-                        if len(results) > 0:
-                            break
-                    except:
-                        continue
-                
-                count = 0
-                for result in results[:10]:  # 최근 10건만
-                    try:
-                        # 제목 찾기
-                        title = ''
-                        title_selectors = ['h3', 'h4', '.title', 'a', 'strong']
-                        for ts in title_selectors:
-                            title_elem = result.query_selector(ts)
-                            if title_elem:
-                                title = title_elem.inner_text().strip()
-                                if len(title) > 10:  # 의미있는 제목
-                                    break
-                        
-                        # 링크 찾기
-                        link = ''
-                        link_elem = result.query_selector('a')
-                        if link_elem:
-                            href = link_elem.get_attribute('href') or ''
-                            if href.startswith('http'):
-                                link = href
-                            elif href.startswith('/'):
-                                link = "https://www.bigkinds.or.kr" + href
-                        
-                        # 날짜 찾기
-                        date = ''
-                        date_selectors = ['.date', 'time', 'span', '.info']
-                        for ds in date_selectors:
-                            date_elem = result.query_selector(ds)
-                            if date_elem:
-                                date_text = date_elem.inner_text().strip()
-                                # 날짜 형식 확인 (YYYY-MM-DD, YYYY.MM.DD 등)
-                                if any(char in date_text for char in ['-', '.', '/']) and len(date_text) < 15:
-                                    date = date_text
-                                    break
-                        
-                        # 언론사 찾기
-                        source = 'Bigkinds'
-                        source_selectors = ['.source', '.press', '.media']
-                        for ss in source_selectors:
-                            source_elem = result.query_selector(ss)
-                            if source_elem:
-                                source_text = source_elem.inner_text().strip()
-                                if source_text:
-                                    source = source_text
-                                    break
-                        
-                        # 안전보건 관련 키워드 필터링
-                        safety_keywords = ['안전', '산재', '중대재해', '재해', '사고', '보건', '위험']
-                        if title and any(kw in title for kw in safety_keywords):
-                            self.results['bigkinds_news'].append({
-                                'title': title,
-                                'date': date or self.today,
-                                'link': link,
-                                'source': source
-                            })
-                            count += 1
-                    except:
-                        continue
-                
-                browser.close()
+                self._wait_ready(page, 'bigkinds_page')
+            except Exception as e:
+                self.errors[spec.key] = e
+                print("  ⚠️ 페이지 접속 실패 - 건너뜀")
+                return
+            
+            # 검색어 입력
+            try:
+                search_box = page.query_selector('input[type="text"]') or page.query_selector('#search-input')
+                if search_box:
+                    search_box.fill(keywords)
+                    
+                    # 검색 API 요청을 놓치지 않도록 클릭 전에 감시 시작
+                    readiness = PageReadiness(page, spec.ready_stage)
+                    search_btn = page.query_selector('button[type="submit"]') or page.query_selector('.btn-search')
+                    if search_btn:
+                        search_btn.click()
+                    else:
+                        # 엔터키로 검색
+                        search_box.press('Enter')
+                    self._wait_ready(page, spec.ready_stage, readiness)
+            except:
+                print("  ⚠️ 검색 실행 실패 - 건너뜀")
+                return
             
-            print(f"  ✅ {len(self.results['bigkinds_news'])}건 수집 완료")
+            print("  → 검색 결과 추출 중...")
+            self._add_rows(spec, self._extract_rows(spec, page), skip)
+            self.errors.pop(spec.key, None)   # 검색 API는 실패했어도 브라우저로 성공
+        
+        try:
+            self._run_in_browser(collect, self.urls[spec.key], context_key=spec.context_key)
+            print(f"  ✅ {len(self.results[spec.key])}건 수집 완료")
             
         except Exception as e:
+            self.errors[spec.key] = e
             print(f"  ⚠️ 검색 실패 - 건너뜀")
     
+    # ----- 소스별 수집 (기존 호출부 호환) -----
+    
+    def scrape_moel_press_release(self):
+        """고용노동부 보도자료 수집"""
+        self.collect('moel_press')
+    
+    def scrape_kosha_with_playwright(self):
+        """산업안전포털 공지사항 수집 (Playwright 사용)"""
+        self.collect('kosha_notice')
+    
+    def scrape_kosha_with_requests(self):
+        """산업안전포털 공지사항 수집 (requests 사용)"""
+        self.collect('kosha_notice', mode='http')
+    
+    def scrape_major_accidents(self):
+        """중대재해 발생알림 수집"""
+        self.collect('major_accident')
+    
+    def scrape_labor_news(self):
+        """매일노동뉴스 안전과 건강 코너 수집"""
+        self.collect('labor_news')
+    
+    def search_bigkinds_news(self, keywords: Union[str, List[str]] = "산업안전 중대재해",
+                             start_date: str = None, end_date: str = None):
+        """Bigkinds에서 뉴스 검색 (검색 API 우선, 실패하면 브라우저로 검색)
+        
+        keywords는 검색어 1개, 쉼표로 구분한 여러 검색어, 또는 검색어 목록.
+        기간을 주지 않으면 어제 ~ 오늘.
+        """
+        self.collect('bigkinds_news', keywords, start_date, end_date)
+    
     def search_additional_news(self):
         """추가 언론기사 검색"""
         print("🔍 추가 언론기사 검색 중...")
         print("  ℹ️  Bigkinds 검색을 사용하려면 search_bigkinds_news() 메서드를 직접 호출하세요")
         print("  ⏭️  추가 뉴스 검색은 별도 구현 필요")
     
-    def run_all_scrapers(self):
-        """모든 스크래퍼 실행"""
+    def run_all_scrapers(self, sources: List[str] = None,
+                         keywords: str = "산업안전 중대재해"):
+        """모든 스크래퍼 실행 (소스별 병렬 수집, 서버 부하는 호스트별 간격으로 관리)"""
         print(f"\n{'='*60}")
         print(f"🤖 일일 동향 데이터 수집 시작: {self.today}")
         print(f"{'='*60}\n")
         
-        self.scrape_moel_press_release()
-        time.sleep(2)  # 서버 부하 방지
-        
-        self.scrape_kosha_with_playwright()
-        time.sleep(2)
-        
-        self.scrape_major_accidents()
-        time.sleep(2)
-        
-        self.scrape_labor_news()
-        time.sleep(2)
+        scheduler = CollectionScheduler(self)
+        scheduler.run(sources, keywords)
         
-        self.search_additional_news()
+        # 여러 소스에 실린 같은 소식은 하나로 묶음
+        from briefing_generator import BriefingGenerator
+        self.results, report = deduplicate(
+            self.results, render=BriefingGenerator().format_data_for_prompt
+        )
         
         print(f"\n{'='*60}")
-        print(f"✅ 데이터 수집 완료!")
+        print(f"✅ 데이터 수집 완료! ({scheduler.timings['total']:.1f}초)")
+        if report.removed:
+            saved = f" (프롬프트 약 {report.tokens_saved}토큰 절감)" if report.tokens_saved > 0 else ""
+            print(f"🧬 유사 제목 병합: {report.clusters}개 묶음, {report.removed}건 제외{saved}")
+        cache = get_transport().cache
+        if cache is not None:
+            c = cache.stats()
+            print(f"🗄️ HTTP 캐시: 적중 {c['hits']}건, 재검증(304) {c['revalidations']}건, "
+                  f"새로 받음 {c['misses']}건")
+        selectors = get_selector_cache()
+        if selectors is not None:
+            st = selectors.stats()
+            print(f"🎯 셀렉터: 첫 시도 적중 {st['first_try']}/{st['runs']}회, "
+                  f"폴백 {st['misses']}회, 전부 실패 {st['failures']}회")
+        for host, t in get_transport().timing_summary().items():
+            print(f"🌐 {host}: 요청 {t['requests']}건, 평균 {t['avg']:.2f}초, "
+                  f"최대 {t['max']:.2f}초, 재시도 {t['retries']}회")
+        if playwright_available():
+            stats = get_browser_pool().stats()
+            print(f"🧭 브라우저 실행 {stats['launches']}회 / 페이지 {stats['pages']}건 "
+                  f"(재사용률 {stats['browser_reuse_ratio']:.0%}), "
+                  f"요청 차단 {stats['requests_blocked']}건 (약 {stats['bytes_saved'] // 1024}KB 절감)")
+        if scheduler.health is not None:
+            for source, h in scheduler.health.snapshot().items():
+                if h['state'] != 'closed':
+                    print(f"🩺 {source}: 차단 중 (최근 오류 {h['last_error']}, "
+                          f"{h['retry_in']:.0f}초 뒤 재확인)")
         print(f"{'='*60}\n")
         
         return self.results
@@ -617,6 +510,7 @@ class SafetyNewsScraper:
         total = sum(len(v) for v in self.results.values())
         summary = {
             'total': total,
+            'new': sum(1 for v in self.results.values() for item in v if item.fresh),
             'by_source': {k: len(v) for k, v in self.results.items()}
         }
         return summary
@@ -628,6 +522,6 @@ if __name__ == "__main__":
     summary = scraper.get_summary()
     
     print("📊 수집 결과 요약:")
-    print(f"  총 {summary['total']}건")
+    print(f"  총 {summary['total']}건 (새 항목 {summary['new']}건)")
     for source, count in summary['by_source'].items():
         print(f"  - {source}: {count}건")
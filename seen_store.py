@@ -0,0 +1,149 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+수집 이력 모듈 - 이미 본 게시물을 기억해 새 항목만 골라내고 목록 탐색을 조기 종료
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from storage import data_path
+
+
+def normalize_title(title: str) -> str:
+    """공백·문장부호 차이를 무시한 제목"""
+    return re.sub(r'[\s\W_]+', '', title or '').lower()
+
+
+def normalize_link(link: str) -> str:
+    if not link:
+        return ''
+    parts = urlsplit(link.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(),
+                       parts.path.rstrip('/'), parts.query, ''))
+
+
+# 상단 고정 게시물 표시 (번호 칸이나 제목 머리에 붙음)
+PINNED_MARKERS = ('공지', '필독', '중요', '고정')
+_PINNED_TITLE = re.compile(r'^\s*[\[【<(]\s*(?:' + '|'.join(PINNED_MARKERS) + r')\s*[\]】>)]')
+
+
+def pinned_label(text: str) -> bool:
+    """번호 칸 글자가 고정 게시물 표시인지 ('공지', '필독' 등 - 숫자면 일반 게시물)"""
+    text = (text or '').strip()
+    return bool(text) and not text.isdigit() and any(marker in text for marker in PINNED_MARKERS)
+
+
+def is_pinned(item: Dict) -> bool:
+    """상단 고정 게시물로 보이는 항목 (파서가 표시했거나 제목이 [공지] 등으로 시작)"""
+    return bool(item.get('pinned')) or bool(_PINNED_TITLE.match(item.get('title', '')))
+
+
+def item_key(item: Dict) -> str:
+    """링크가 있으면 링크, 없으면 제목 기준의 항목 키"""
+    basis = normalize_link(item.get('link', '')) or 'title:' + normalize_title(item.get('title', ''))
+    return hashlib.sha1(basis.encode('utf-8')).hexdigest()
+
+
+class SeenStore:
+    """SQLite 기반 수집 이력
+
+    처음 본 시각(first_seen)이 fresh_window 이내면 '새 항목'으로 본다.
+    같은 날 여러 번 수집해도 그날 처음 나온 게시물은 계속 새 항목으로 남는다.
+    """
+
+    def __init__(self, path: str, fresh_window: float = 18 * 3600):
+        self.fresh_window = fresh_window
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen (
+                key TEXT PRIMARY KEY,
+                category TEXT,
+                title TEXT,
+                first_seen REAL,
+                last_seen REAL
+            )
+        """)
+        self._conn.commit()
+
+    def check(self, category: str, item: Dict) -> bool:
+        """항목을 기록하고 새 항목 여부를 반환"""
+        key = item_key(item)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT first_seen FROM seen WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._conn.execute("INSERT INTO seen VALUES (?, ?, ?, ?, ?)",
+                                   (key, category, item.get('title', ''), now, now))
+                first_seen = now
+            else:
+                self._conn.execute("UPDATE seen SET last_seen = ? WHERE key = ?", (now, key))
+                first_seen = row[0]
+            self._conn.commit()
+        return now - first_seen < self.fresh_window
+
+    def tracker(self, category: str, stop_after: int = 3) -> 'SeenTracker':
+        return SeenTracker(self, category, stop_after)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._conn.execute(
+                "SELECT category, COUNT(*) FROM seen GROUP BY category").fetchall())
+
+
+class SeenTracker:
+    """목록 1개를 훑는 동안 항목을 태깅하고, 이미 본 항목이 연속되면 탐색 중단 신호
+
+    목록은 최신순이므로 본 항목이 stop_after개 연속 나오면 그 뒤도 모두 본 항목이다.
+    상단 고정 게시물(is_pinned)은 날짜 순서와 상관없이 늘 위에 있으므로 연속 횟수에 넣지 않는다.
+    고정 공지가 stop_after개 이상인 게시판도 그 아래 새 글까지 내려가 본다.
+    """
+
+    def __init__(self, store: SeenStore, category: str, stop_after: int = 3):
+        self.store = store
+        self.category = category
+        self.stop_after = stop_after
+        self.new = 0
+        self.seen = 0
+        self.pinned = 0
+        self._stale_run = 0
+
+    def __call__(self, item: Dict) -> bool:
+        """item에 is_new를 기록하고 계속 탐색할지 반환"""
+        item['is_new'] = self.store.check(self.category, item)
+        if is_pinned(item):
+            self.pinned += 1
+        elif item['is_new']:
+            self.new += 1
+            self._stale_run = 0
+        else:
+            self.seen += 1
+            self._stale_run += 1
+        return self._stale_run < self.stop_after
+
+
+_store: Optional[SeenStore] = None
+_store_lock = threading.Lock()
+
+
+def get_seen_store() -> Optional[SeenStore]:
+    """프로세스 공용 수집 이력 (SEEN_STORE_DISABLED=1 이면 None)"""
+    global _store
+    if os.getenv('SEEN_STORE_DISABLED', '') in ('1', 'true'):
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = SeenStore(
+                data_path('seen_items.sqlite3'),
+                fresh_window=float(os.getenv('SEEN_FRESH_HOURS', '18')) * 3600,
+            )
+        return _store
@@ -0,0 +1,180 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+셀렉터 학습 모듈 - 소스별로 마지막에 맞은 셀렉터를 기억해 다음 실행에서 먼저 시도
+
+후보 셀렉터를 매번 정해진 순서로 시도하면 틀린 추측마다 시간이 들고, 브라우저에서는
+왕복이 생긴다. 여기서는 슬롯(목록 행, 필드)별로 마지막 성공 셀렉터를 맨 앞으로 옮기고
+첫 시도 적중·폴백 횟수를 집계한다.
+
+무엇에나 맞는 넓은 폴백(태그 이름만, [class*="card"] 같은 부분 일치)은 앞으로 옮기지
+않는다. 한 번 이겨서 맨 앞에 서면 구체적인 셀렉터를 다시 시도하지 않아 추출 결과가
+명세의 우선순위와 달라지기 때문이다. 구체적인 셀렉터를 옮긴 경우에도 revalidate_every번에
+한 번은 명세 순서 그대로 시도해 우선순위가 높은 셀렉터가 다시 맞는지 확인한다.
+결과는 메모리에 모았다가 flush()로 수집 실행마다 한 번 저장한다. 파일은 앱과 백그라운드
+실행이 함께 쓰므로, 저장할 때 파일 잠금을 잡고 최신 내용을 다시 읽어 이번에 모은 증가분만
+더한다 (storage.file_lock).
+"""
+
+import atexit
+import copy
+import os
+import re
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from storage import data_path, file_lock, read_json, write_json
+
+
+# 태그 이름만 있거나 속성 부분 일치(*= ^= $= ~=)를 쓰는 셀렉터
+_BROAD = re.compile(r'^\s*[a-zA-Z][a-zA-Z0-9]*\s*$|[*^$~]=')
+
+
+def is_broad(selector: str) -> bool:
+    """거의 모든 요소에 맞는 넓은 폴백 셀렉터인지"""
+    return bool(_BROAD.search(selector))
+
+
+class SelectorCache:
+    """소스·슬롯별 마지막 성공 셀렉터와 적중 통계 (JSON 파일)"""
+
+    def __init__(self, path: str, revalidate_every: int = 20):
+        self.path = path
+        self.revalidate_every = revalidate_every
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict[str, Dict]] = read_json(path, {})
+        # 아직 저장하지 않은 증가분 ((소스, 슬롯) → 횟수 증가와 마지막 성공 셀렉터)
+        self._pending: Dict[Tuple[str, str], Dict] = {}
+
+    @staticmethod
+    def _slot(data: Dict, source: str, slot: str) -> Dict:
+        return data.setdefault(source, {}).setdefault(slot, {
+            'last': None, 'runs': 0, 'first_try': 0, 'misses': 0, 'failures': 0,
+        })
+
+    @staticmethod
+    def _apply(entry: Dict, change: Dict):
+        for name in ('runs', 'first_try', 'misses', 'failures'):
+            entry[name] += change.get(name, 0)
+        if change.get('last') is not None:
+            entry['last'] = change['last']
+
+    def order(self, source: str, slot: str, candidates: List[str]) -> List[str]:
+        """마지막 성공 셀렉터를 맨 앞으로 옮긴 후보 목록
+
+        넓은 폴백이 마지막 성공이었거나 재확인할 차례면 명세 순서 그대로.
+        """
+        with self._lock:
+            entry = self._data.get(source, {}).get(slot, {})
+            last = entry.get('last')
+            runs = entry.get('runs', 0)
+        if last not in candidates or is_broad(last):
+            return list(candidates)
+        if self.revalidate_every and runs % self.revalidate_every == self.revalidate_every - 1:
+            return list(candidates)
+        return [last] + [c for c in candidates if c != last]
+
+    def record(self, source: str, slot: str, winner: Optional[str], misses: int = 0):
+        """이번 실행 결과 기록 (misses: 성공 전에 빗나간 시도 수, 저장은 flush()에서)"""
+        change = {'runs': 1}
+        if winner is None:
+            change['failures'] = 1
+        else:
+            change['last'] = winner
+            change['misses'] = misses
+            change['first_try'] = int(misses == 0)
+        with self._lock:
+            self._apply(self._slot(self._data, source, slot), change)
+            pending = self._pending.setdefault((source, slot), {'runs': 0})
+            for name, value in change.items():
+                pending[name] = value if name == 'last' else pending.get(name, 0) + value
+
+    def flush(self):
+        """모은 결과를 파일에 저장 (다른 프로세스가 그사이 저장한 내용에 증가분을 더함)"""
+        with self._lock:
+            if not self._pending:
+                return
+            try:
+                with file_lock(self.path):
+                    data = read_json(self.path, {})
+                    for (source, slot), change in self._pending.items():
+                        self._apply(self._slot(data, source, slot), change)
+                    write_json(self.path, data)
+            except OSError:
+                return
+            self._data = data
+            self._pending.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """전체 실행 수, 첫 시도 적중 수, 폴백(빗나간 시도) 수, 전부 실패한 수"""
+        with self._lock:
+            entries = [e for slots in self._data.values() for e in slots.values()]
+        return {
+            'runs': sum(e['runs'] for e in entries),
+            'first_try': sum(e['first_try'] for e in entries),
+            'misses': sum(e['misses'] for e in entries),
+            'failures': sum(e['failures'] for e in entries),
+        }
+
+    def source_stats(self, source: str) -> Dict[str, Dict]:
+        with self._lock:
+            return copy.deepcopy(self._data.get(source, {}))
+
+
+class SelectorLearner:
+    """한 소스의 셀렉터 순서 조정과 결과 기록"""
+
+    def __init__(self, cache: SelectorCache, source: str):
+        self.cache = cache
+        self.source = source
+
+    def order(self, slot: str, candidates: List[str]) -> List[str]:
+        return self.cache.order(self.source, slot, candidates)
+
+    def record(self, slot: str, winner: Optional[str], misses: int = 0):
+        self.cache.record(self.source, slot, winner, misses)
+
+    def apply(self, spec: Dict) -> Dict:
+        """dom_extract 명세의 행·필드 셀렉터를 학습한 순서로 바꾼 사본"""
+        spec = copy.deepcopy(spec)
+        spec['rows'] = self.order('rows', spec['rows'])
+        for name, field in spec['fields'].items():
+            if len(field.get('selectors', [])) > 1:
+                field['selectors'] = self.order(f'field:{name}', field['selectors'])
+        return spec
+
+    def learn(self, spec: Dict, result) -> None:
+        """apply()한 명세로 추출한 결과(ExtractResult)에서 맞은 셀렉터를 기록"""
+        if len(spec['rows']) > 1:
+            if result.row_selector is None:
+                self.record('rows', None)
+            else:
+                self.record('rows', result.row_selector, spec['rows'].index(result.row_selector))
+
+        for name, field in spec['fields'].items():
+            selectors = field.get('selectors', [])
+            hits = result.hits.get(name, [])
+            if len(selectors) < 2 or not hits:
+                continue
+            matched = [i for i in hits if i >= 0]
+            if not matched:
+                self.record(f'field:{name}', None)
+                continue
+            winner = Counter(matched).most_common(1)[0][0]
+            self.record(f'field:{name}', selectors[winner], sum(matched))
+
+
+_cache: Optional[SelectorCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_selector_cache() -> Optional[SelectorCache]:
+    """공용 셀렉터 캐시 (SELECTOR_CACHE_DISABLED=1이면 None)"""
+    global _cache
+    if os.getenv('SELECTOR_CACHE_DISABLED') == '1':
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = SelectorCache(data_path('selectors.json'))
+            atexit.register(_cache.flush)
+        return _cache
@@ -0,0 +1,259 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+소스 상태 모듈 - 소스별 성공·소요시간·오류 종류를 실행 간에 기록하고 차단기(circuit breaker)로 관리
+
+연속으로 실패한 소스는 차단(open)해 수집기가 브라우저 타임아웃을 기다리지 않고 바로
+건너뛰게 한다. 대기 시간이 지나면 반열림(half_open) 상태에서 한 번만 시도해 보고,
+성공하면 닫고(closed) 실패하면 대기 시간을 늘려 다시 차단한다. HealthProber는 차단된
+소스의 목록 주소를 백그라운드에서 가볍게 확인해 사용자가 수집하기 전에 반열림으로 돌린다.
+
+상태 파일은 앱과 백그라운드 실행이 함께 쓴다. 바꿀 때는 파일 잠금을 잡고 최신 내용을
+다시 읽어 고친 뒤 통째로 바꿔 쓰고(storage.file_lock, write_json), 읽을 때는 파일이
+바뀌었으면 다시 읽는다.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+from storage import data_path, file_lock, read_json, write_json
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+_RECENT = 20   # 소요시간 중앙값 계산에 쓰는 최근 실행 수
+
+
+class CircuitOpenError(Exception):
+    """차단된 소스를 수집하려 할 때"""
+
+    def __init__(self, source: str, retry_in: float):
+        super().__init__(f"접속 불가 상태 - 약 {max(retry_in, 0):.0f}초 뒤 재확인")
+        self.source = source
+        self.retry_in = retry_in
+
+
+class SourceHealth:
+    """소스별 상태와 차단기 (JSON 파일)
+
+    failure_threshold번 연속 실패하면 cooldown초 동안 차단하고, 반열림 시도가 실패할
+    때마다 대기 시간을 두 배로 늘린다 (max_cooldown까지).
+    """
+
+    def __init__(self, path: str, failure_threshold: int = 3,
+                 cooldown: float = 300, max_cooldown: float = 3600,
+                 clock: Callable[[], float] = time.time):
+        self.path = path
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._probing: Dict[str, bool] = {}
+        self._data: Dict[str, Dict] = {}
+        self._mtime: Optional[float] = None
+        self._reload()
+
+    def _entry(self, source: str) -> Dict:
+        return self._data.setdefault(source, {
+            'state': CLOSED, 'successes': 0, 'failures': 0, 'consecutive_failures': 0,
+            'latencies': [], 'last_error': None, 'last_success': None, 'last_failure': None,
+            'open_until': 0.0, 'cooldown': self.cooldown,
+        })
+
+    def _reload(self):
+        """다른 프로세스가 파일을 바꿨으면 다시 읽음 (잠금 안에서 호출)"""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return
+        if mtime != self._mtime:
+            data = read_json(self.path)
+            if isinstance(data, dict):
+                self._data = data
+            self._mtime = mtime
+
+    def _save(self):
+        try:
+            write_json(self.path, self._data)
+            self._mtime = os.path.getmtime(self.path)
+        except OSError:
+            pass
+
+    @contextmanager
+    def _update(self) -> Iterator[None]:
+        """파일 잠금 안에서 최신 상태를 읽고, 블록이 끝나면 저장"""
+        with self._lock, file_lock(self.path):
+            self._reload()
+            yield
+            self._save()
+
+    def allow(self, source: str) -> bool:
+        """지금 수집해도 되는지 (차단 대기 시간이 지났으면 반열림으로 한 번 허용)"""
+        with self._lock:
+            self._reload()
+            entry = self._data.get(source)
+            if entry is None or entry['state'] == CLOSED:
+                return True
+            if entry['state'] == OPEN and self.clock() < entry['open_until']:
+                return False
+        with self._update():
+            entry = self._data.get(source)
+            if entry is None or entry['state'] == CLOSED:
+                return True
+            if entry['state'] == OPEN and self.clock() >= entry['open_until']:
+                entry['state'] = HALF_OPEN
+            if entry['state'] == HALF_OPEN and not self._probing.get(source):
+                self._probing[source] = True   # 반열림 시도는 한 번에 하나만
+                return True
+            return False
+
+    def retry_in(self, source: str) -> float:
+        with self._lock:
+            self._reload()
+            entry = self._data.get(source)
+            return entry['open_until'] - self.clock() if entry else 0.0
+
+    def record(self, source: str, latency: float, error: Optional[BaseException] = None):
+        """수집 결과 기록 (error가 None이면 성공)"""
+        with self._update():
+            entry = self._entry(source)
+            self._probing.pop(source, None)
+            now = self.clock()
+            entry['latencies'] = (entry['latencies'] + [round(latency, 3)])[-_RECENT:]
+            if error is None:
+                entry['successes'] += 1
+                entry['consecutive_failures'] = 0
+                entry['last_success'] = now
+                entry['state'] = CLOSED
+                entry['cooldown'] = self.cooldown
+            else:
+                self._fail(entry, type(error).__name__, now)
+
+    def _fail(self, entry: Dict, error_class: str, now: float):
+        entry['failures'] += 1
+        entry['consecutive_failures'] += 1
+        entry['last_error'] = error_class
+        entry['last_failure'] = now
+        if entry['state'] == HALF_OPEN:
+            entry['cooldown'] = min(entry['cooldown'] * 2, self.max_cooldown)
+        elif entry['consecutive_failures'] < self.failure_threshold:
+            return
+        entry['state'] = OPEN
+        entry['open_until'] = now + entry['cooldown']
+
+    def probe_result(self, source: str, ok: bool, error_class: Optional[str] = None):
+        """백그라운드 확인 결과 - 응답이 오면 반열림(다음 수집을 시도), 아니면 다시 차단"""
+        with self._update():
+            entry = self._data.get(source)
+            if entry is None or entry['state'] == CLOSED:
+                return
+            entry['state'] = HALF_OPEN
+            if not ok:
+                self._fail(entry, error_class or 'ProbeFailed', self.clock())
+
+    def due_for_probe(self) -> List[str]:
+        """차단 대기 시간이 지나 확인이 필요한 소스"""
+        with self._lock:
+            self._reload()
+            now = self.clock()
+            return [source for source, entry in self._data.items()
+                    if entry['state'] == OPEN and now >= entry['open_until']]
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """소스별 상태 요약 (상태, 성공률, 소요시간 중앙값, 마지막 오류)"""
+        with self._lock:
+            self._reload()
+            summary = {}
+            for source, entry in self._data.items():
+                runs = entry['successes'] + entry['failures']
+                latencies = sorted(entry['latencies'])
+                summary[source] = {
+                    'state': entry['state'],
+                    'runs': runs,
+                    'success_rate': entry['successes'] / runs if runs else 1.0,
+                    'p50': latencies[len(latencies) // 2] if latencies else None,
+                    'last_error': entry['last_error'],
+                    'retry_in': max(entry['open_until'] - self.clock(), 0.0)
+                    if entry['state'] == OPEN else 0.0,
+                }
+            return summary
+
+
+class HealthProber:
+    """차단된 소스를 주기적으로 가볍게 확인하는 백그라운드 스레드"""
+
+    def __init__(self, health: SourceHealth, check: Callable[[str], None],
+                 interval: float = 30):
+        self.health = health
+        self.check = check            # check(source): 실패하면 예외
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def probe_once(self) -> List[str]:
+        probed = self.health.due_for_probe()
+        for source in probed:
+            try:
+                self.check(source)
+            except Exception as e:
+                self.health.probe_result(source, False, type(e).__name__)
+            else:
+                self.health.probe_result(source, True)
+        return probed
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.probe_once()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name='health-prober', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+
+_health: Optional[SourceHealth] = None
+_prober: Optional[HealthProber] = None
+_health_lock = threading.Lock()
+
+
+def get_source_health() -> Optional[SourceHealth]:
+    """공용 소스 상태 저장소 (SOURCE_HEALTH_DISABLED=1이면 None)"""
+    global _health
+    if os.getenv('SOURCE_HEALTH_DISABLED') == '1':
+        return None
+    with _health_lock:
+        if _health is None:
+            _health = SourceHealth(
+                data_path('source_health.json'),
+                failure_threshold=int(os.getenv('CIRCUIT_FAILURES', '3')),
+                cooldown=float(os.getenv('CIRCUIT_COOLDOWN', '300')),
+            )
+        return _health
+
+
+def _check_source(source: str):
+    """소스 목록 주소에 응답이 오는지만 확인 (캐시·재시도 없이 짧게)"""
+    from http_client import get_transport
+    from sources import SOURCES
+    get_transport().get(SOURCES[source].url, timeout=5, deadline=5, max_retries=0)
+
+
+def start_prober(interval: float = 30) -> Optional[HealthProber]:
+    """프로세스 공용 백그라운드 확인 시작 (여러 번 불러도 한 번만)"""
+    global _prober
+    health = get_source_health()
+    if health is None:
+        return None
+    with _health_lock:
+        if _prober is None:
+            _prober = HealthProber(health, _check_source, interval)
+            _prober.start()
+        return _prober
@@ -0,0 +1,117 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+수집 소스 목록 - 소스별 주소·수집 방식·추출 명세·키워드 필터를 선언
+
+수집 방식(mode):
+    'http'    - 목록 페이지를 받아 parser로 파싱
+    'browser' - 브라우저로 열어 dom 명세로 추출 (저장된 XHR 레시피가 있으면 그것부터)
+    'search'  - 검색 API를 먼저 쓰고, 실패하면 브라우저로 검색 화면 조작
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from dom_extract import BIGKINDS_SPEC, KOSHA_NOTICE_SPEC, MAJOR_ACCIDENT_SPEC
+from html_parser import parse_kosha_notice, parse_labor_news, parse_moel_press
+from http_cache import SOURCE_TTLS
+from keyword_matcher import MOEL_MIN_RELEVANCE, NEWS_MIN_RELEVANCE
+
+
+@dataclass(frozen=True)
+class SourceSpec:
+    key: str
+    label: str                          # 수집 시작 메시지 ({keywords} 사용 가능)
+    source_name: str                    # 항목의 source 값
+    url: str
+    mode: str
+    parser: Optional[Callable] = None   # http 모드 / 브라우저를 못 쓸 때의 파서
+    parser_options: Tuple[Tuple[str, object], ...] = ()
+    learn_parser: bool = False          # 파서가 목록 후보를 학습하는지 (learner 인자)
+    timeout: float = 30
+    deadline: float = 45
+    cache_ttl: Optional[float] = None
+    dom: Optional[Dict] = None          # 브라우저 추출 명세 (dom_extract 형식)
+    ready_stage: Optional[str] = None   # page_ready 단계 이름
+    require_ready: bool = False         # 준비 신호가 없으면 추출하지 않음
+    context_key: str = 'default'        # 브라우저 풀 컨텍스트 키
+    link_base: str = ''                 # 상대 링크 앞에 붙일 주소
+    date_default_today: bool = False    # 날짜가 없으면 오늘 날짜
+    min_relevance: Optional[float] = None  # 제목 관련도 하한 (keyword_matcher, None이면 전부)
+    limit: int = 15
+    use_recipe: bool = False            # XHR 레시피 사용 (xhr_discovery)
+    api_url: Optional[str] = None       # search 모드 검색 API
+    in_prompt: bool = True              # 브리핑 프롬프트에 싣는지 (format_data_for_prompt)
+
+
+SOURCES: Dict[str, SourceSpec] = {
+    'moel_press': SourceSpec(
+        key='moel_press',
+        label="📄 고용노동부 보도자료 수집 중...",
+        source_name='고용노동부',
+        url="https://www.moel.go.kr/news/enews/report/enewsList.do",
+        mode='http',
+        parser=parse_moel_press,
+        parser_options=(('min_relevance', MOEL_MIN_RELEVANCE),),
+        cache_ttl=SOURCE_TTLS['moel_press'],
+    ),
+    'kosha_notice': SourceSpec(
+        key='kosha_notice',
+        label="📄 산업안전포털 공지사항 수집 중...",
+        source_name='산업안전포털',
+        url="https://portal.kosha.or.kr/community/notice",
+        mode='browser',
+        parser=parse_kosha_notice,
+        timeout=15,
+        deadline=25,
+        cache_ttl=SOURCE_TTLS['kosha_notice'],
+        dom=KOSHA_NOTICE_SPEC,
+        ready_stage='kosha_notice',
+        require_ready=True,
+        context_key='kosha',
+        link_base="https://portal.kosha.or.kr",
+        limit=15,
+        use_recipe=True,
+    ),
+    'major_accident': SourceSpec(
+        key='major_accident',
+        label="🚨 중대재해 발생알림 수집 중...",
+        source_name='안전보건공단',
+        url="https://portal.kosha.or.kr/archive/imprtnDsstrAlrame/CSADV50000/CSADV50000M02",
+        mode='browser',
+        dom=MAJOR_ACCIDENT_SPEC,
+        ready_stage='major_accident',
+        context_key='kosha',
+        date_default_today=True,
+        limit=5,
+        use_recipe=True,
+    ),
+    'labor_news': SourceSpec(
+        key='labor_news',
+        label="📰 매일노동뉴스 수집 중...",
+        source_name='매일노동뉴스',
+        url="https://www.labortoday.co.kr/news/articleList.html?sc_section_code=S1N7&view_type=sm",
+        mode='http',
+        parser=parse_labor_news,
+        learn_parser=True,
+        cache_ttl=SOURCE_TTLS['labor_news'],
+    ),
+    'bigkinds_news': SourceSpec(
+        key='bigkinds_news',
+        label="🔍 Bigkinds 뉴스 검색 중 (키워드: {keywords})...",
+        source_name='Bigkinds',
+        url="https://www.bigkinds.or.kr/v2/news/search.do",
+        mode='search',
+        dom=BIGKINDS_SPEC,
+        ready_stage='bigkinds_results',
+        context_key='bigkinds',
+        link_base="https://www.bigkinds.or.kr",
+        date_default_today=True,
+        min_relevance=NEWS_MIN_RELEVANCE,
+        limit=10,
+        api_url="https://www.bigkinds.or.kr/api/news/search.do",
+        in_prompt=False,                # 검색 결과는 화면에만 보여 줌
+    ),
+}
+
+# 브리핑 프롬프트에 실리는 소스
+PROMPT_SOURCES = [key for key, spec in SOURCES.items() if spec.in_prompt]
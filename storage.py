@@ -0,0 +1,72 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+로컬 저장소 경로 - 캐시·상태 파일 위치를 한 곳에서 관리
+"""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows - 프로세스 간 잠금 없이 원자적 교체만
+    fcntl = None
+
+
+# 배포 환경에서는 BRIEFING_DATA_DIR로 영구 디스크 경로를 지정
+DATA_DIR = os.getenv(
+    'BRIEFING_DATA_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+)
+
+
+def data_path(*parts: str) -> str:
+    """DATA_DIR 아래 경로를 반환 (상위 디렉터리는 자동 생성)"""
+    path = os.path.join(DATA_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def write_json(path: str, data) -> None:
+    """임시 파일에 쓴 뒤 os.replace로 바꿈 (읽는 쪽이 쓰다 만 파일을 보지 않음)"""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                               prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def read_json(path: str, default=None):
+    """JSON 파일 내용 (없거나 깨졌으면 default)"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """path에 대한 프로세스 간 배타 잠금 (path + '.lock' 파일 사용)
+
+    앱과 백그라운드 실행(briefing_daemon)이 같은 상태 파일을 읽고-고치고-쓸 때 서로의
+    변경을 덮어쓰지 않도록 이 안에서 다시 읽고 write_json으로 저장한다.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(path + '.lock', 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
@@ -0,0 +1,293 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+실행 계측 모듈 - 수집·브리핑 단계를 구간(span)으로 기록해 JSON lines와 Prometheus 형식으로 내보냄
+
+    with span('scrape.collect', source='moel_press') as s:
+        ...
+        s.set(items=8)
+
+구간은 contextvars로 부모를 찾으므로 같은 실행(trace)의 구간끼리 트리를 이룬다. 다른
+스레드에서 이어 가려면 copy_context().run(...)으로 감싼다 (collector, 브라우저 풀 호출부).
+끝난 구간은 최근 목록(실행 프로파일 화면), spans.jsonl, 이름별 히스토그램에 쌓인다.
+spans.jsonl은 max_bytes를 넘으면 spans.jsonl.1, .2 ...로 밀어내고 backups개까지만 둔다
+(백그라운드 실행이 계속 돌아도 디스크를 채우지 않도록). TELEMETRY_DISABLED=1이면 기록하지 않는다.
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, List, Optional
+
+from storage import data_path
+
+
+# 구간 소요시간 히스토그램 경계 (초)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start: float                        # epoch 초
+    duration: float = 0.0
+    attrs: Dict[str, object] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def set(self, **attrs) -> 'Span':
+        self.attrs.update(attrs)
+        return self
+
+
+_current: contextvars.ContextVar = contextvars.ContextVar('telemetry_span', default=None)
+
+
+class _Histogram:
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.total = 0
+        self.sum = 0.0
+        self.errors = 0
+
+    def observe(self, value: float, error: bool):
+        self.total += 1
+        self.sum += value
+        self.errors += error
+        for i, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class Telemetry:
+    """끝난 구간 보관·내보내기와 이름별 집계"""
+
+    def __init__(self, jsonl_path: Optional[str] = None, keep: int = 2000,
+                 max_bytes: int = 10 * 1024 * 1024, backups: int = 3):
+        self.jsonl_path = jsonl_path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._jsonl_size: Optional[int] = None
+        self._lock = threading.Lock()
+        self._spans: Deque[Span] = deque(maxlen=keep)
+        self._histograms: Dict[str, _Histogram] = {}
+        self._counters: Dict[tuple, float] = {}
+
+    def finish(self, span: Span):
+        with self._lock:
+            self._spans.append(span)
+            self._histograms.setdefault(span.name, _Histogram()).observe(
+                span.duration, span.error is not None)
+            if self.jsonl_path:
+                self._append(json.dumps(asdict(span), ensure_ascii=False, default=str) + '\n')
+
+    def _append(self, line: str):
+        """spans.jsonl에 한 줄 추가하고 크기가 max_bytes를 넘으면 돌려 씀 (잠금 안에서 호출)"""
+        data = line.encode('utf-8')
+        try:
+            if self._jsonl_size is None:
+                self._jsonl_size = os.path.getsize(self.jsonl_path) \
+                    if os.path.exists(self.jsonl_path) else 0
+            with open(self.jsonl_path, 'ab') as f:
+                f.write(data)
+            self._jsonl_size += len(data)
+            if self.max_bytes and self._jsonl_size >= self.max_bytes:
+                # 다른 프로세스(앱·백그라운드 실행)가 이미 돌렸을 수 있으므로 실제 크기로 확인
+                self._jsonl_size = os.path.getsize(self.jsonl_path)
+                if self._jsonl_size >= self.max_bytes:
+                    self._rotate()
+        except OSError:
+            self._jsonl_size = None
+
+    def _rotate(self):
+        path = self.jsonl_path
+        if self.backups <= 0:
+            os.remove(path)
+        else:
+            for i in range(self.backups - 1, 0, -1):
+                if os.path.exists(f'{path}.{i}'):
+                    os.replace(f'{path}.{i}', f'{path}.{i + 1}')
+            os.replace(path, f'{path}.1')
+        self._jsonl_size = 0
+
+    def count(self, name: str, value: float = 1, **labels):
+        """누적 카운터 (예: count('llm_tokens', 1200, direction='input'))"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        with self._lock:
+            spans = list(self._spans)
+        return [s for s in spans if trace_id is None or s.trace_id == trace_id]
+
+    def last_trace(self, root: Optional[str] = None) -> List[Span]:
+        """가장 최근 실행의 구간 (root를 주면 그 이름의 최상위 구간이 있는 실행)"""
+        for s in reversed(self.spans()):
+            if s.parent_id is None and (root is None or s.name == root):
+                return sorted(self.spans(s.trace_id), key=lambda x: x.start)
+        return []
+
+    def prometheus(self) -> str:
+        """Prometheus 텍스트 형식 (구간 히스토그램 + 카운터)"""
+        with self._lock:
+            histograms = {name: (list(h.counts), h.total, h.sum, h.errors)
+                          for name, h in self._histograms.items()}
+            counters = dict(self._counters)
+
+        lines = [
+            '# HELP briefing_span_duration_seconds 구간 소요시간',
+            '# TYPE briefing_span_duration_seconds histogram',
+        ]
+        for name, (counts, total, total_sum, _) in sorted(histograms.items()):
+            for bound, count in zip(BUCKETS, counts):
+                lines.append(f'briefing_span_duration_seconds_bucket{{span="{name}",le="{bound}"}} {count}')
+            lines.append(f'briefing_span_duration_seconds_bucket{{span="{name}",le="+Inf"}} {total}')
+            lines.append(f'briefing_span_duration_seconds_sum{{span="{name}"}} {total_sum:.6f}')
+            lines.append(f'briefing_span_duration_seconds_count{{span="{name}"}} {total}')
+        lines += [
+            '# HELP briefing_span_errors_total 오류로 끝난 구간 수',
+            '# TYPE briefing_span_errors_total counter',
+        ]
+        for name, (_, _, _, errors) in sorted(histograms.items()):
+            lines.append(f'briefing_span_errors_total{{span="{name}"}} {errors}')
+
+        names = sorted({name for name, _ in counters})
+        for name in names:
+            lines.append(f'# TYPE briefing_{name}_total counter')
+            for (counter, labels), value in sorted(counters.items()):
+                if counter == name:
+                    label_text = ','.join(f'{k}="{v}"' for k, v in labels)
+                    lines.append(f'briefing_{name}_total{{{label_text}}} {value:g}')
+        return '\n'.join(lines) + '\n'
+
+
+class span:
+    """구간 기록 컨텍스트 관리자 (예외는 error에 종류를 남기고 그대로 전달)"""
+
+    def __init__(self, name: str, **attrs):
+        self.name = name
+        self.attrs = attrs
+        self._span: Optional[Span] = None
+        self._token = None
+        self._started = 0.0
+
+    def __enter__(self) -> Span:
+        parent = _current.get()
+        self._span = Span(
+            name=self.name,
+            trace_id=parent.trace_id if parent else uuid.uuid4().hex[:16],
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None,
+            start=time.time(),
+            attrs=dict(self.attrs),
+        )
+        self._token = _current.set(self._span)
+        self._started = time.perf_counter()
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        self._span.duration = time.perf_counter() - self._started
+        if exc_type is not None:
+            self._span.error = exc_type.__name__
+        _current.reset(self._token)
+        telemetry = get_telemetry()
+        if telemetry is not None:
+            telemetry.finish(self._span)
+        return False
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def waterfall_rows(spans: List[Span]) -> List[Dict]:
+    """실행 프로파일 화면용 행 (시작·끝은 실행 시작 기준 ms, label은 깊이만큼 들여씀)"""
+    if not spans:
+        return []
+    origin = min(s.start for s in spans)
+    by_id = {s.span_id: s for s in spans}
+
+    def depth(s: Span) -> int:
+        d = 0
+        while s.parent_id in by_id:
+            s = by_id[s.parent_id]
+            d += 1
+        return d
+
+    rows = []
+    for i, s in enumerate(sorted(spans, key=lambda x: x.start)):
+        detail = ', '.join(f'{k}={v}' for k, v in s.attrs.items())
+        label = '·' * depth(s) + s.name + (f" ({s.attrs['source']})" if 'source' in s.attrs else '')
+        rows.append({
+            'order': i,
+            'label': f"{i + 1:>3}. {label}",   # 같은 이름의 구간도 행을 따로 그리도록 순번을 붙임
+            'start_ms': (s.start - origin) * 1000,
+            'end_ms': (s.start - origin + s.duration) * 1000,
+            'duration_ms': round(s.duration * 1000, 1),
+            'status': 'error' if s.error else 'ok',
+            'detail': detail,
+        })
+    return rows
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        telemetry = get_telemetry()
+        if self.path.rstrip('/') != '/metrics' or telemetry is None:
+            self.send_error(404)
+            return
+        body = telemetry.prometheus().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_telemetry: Optional[Telemetry] = None
+_server: Optional[ThreadingHTTPServer] = None
+_telemetry_lock = threading.Lock()
+
+
+def get_telemetry() -> Optional[Telemetry]:
+    """공용 계측 저장소 (TELEMETRY_DISABLED=1이면 None, TELEMETRY_JSONL=0이면 파일 기록 안 함)"""
+    global _telemetry
+    if os.getenv('TELEMETRY_DISABLED') == '1':
+        return None
+    with _telemetry_lock:
+        if _telemetry is None:
+            path = None if os.getenv('TELEMETRY_JSONL') == '0' else data_path('spans.jsonl')
+            _telemetry = Telemetry(
+                path,
+                max_bytes=int(float(os.getenv('TELEMETRY_JSONL_MAX_MB', '10')) * 1024 * 1024),
+                backups=int(os.getenv('TELEMETRY_JSONL_BACKUPS', '3')),
+            )
+        return _telemetry
+
+
+def start_metrics_server(port: Optional[int] = None) -> Optional[ThreadingHTTPServer]:
+    """/metrics 엔드포인트를 백그라운드로 실행 (METRICS_PORT가 없으면 실행하지 않음)"""
+    global _server
+    port = port or int(os.getenv('METRICS_PORT', '0'))
+    if not port:
+        return None
+    with _telemetry_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer(('0.0.0.0', port), _MetricsHandler)
+            except OSError as e:
+                print(f"⚠️ 메트릭 서버 시작 실패 (포트 {port}): {e}")
+                return None
+            threading.Thread(target=_server.serve_forever, name='metrics', daemon=True).start()
+        return _server
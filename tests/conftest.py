@@ -0,0 +1,22 @@
+"""
+테스트 공통 설정 - 저장소 루트 모듈을 import할 수 있게 하고 모의 Anthropic 클라이언트를 제공
+
+벤치마크(offline_suite)는 import할 때 캐시·기록을 끄는 환경 변수를 설정하므로 테스트에서
+import하지 않는다. 모의 클라이언트는 부작용이 없는 benchmarks/mock_anthropic.py에서 가져온다.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.mock_anthropic import MockAnthropic  # noqa: E402
+
+
+@pytest.fixture
+def mock_client() -> MockAnthropic:
+    return MockAnthropic()
@@ -0,0 +1,54 @@
+"""
+유사 제목 병합 - 대표 항목 선택과 토큰 절감 보고가 프롬프트에 실리는 항목 기준인지 확인
+"""
+
+from datetime import timedelta
+
+from briefing_generator import BriefingGenerator
+from date_utils import now_kst
+from dedup import deduplicate
+from models import NewsItem
+
+
+TODAY = now_kst().strftime('%Y.%m.%d')
+YESTERDAY = (now_kst() - timedelta(days=1)).strftime('%Y.%m.%d')
+LABOR_TITLE = '경기 화성 공장서 끼임 사고로 노동자 사망'
+
+
+def _render(data):
+    return BriefingGenerator(api_key='test', client=object()).format_data_for_prompt(data)
+
+
+def test_newer_bigkinds_copy_does_not_replace_a_prompt_source():
+    data = {
+        'labor_news': [NewsItem(LABOR_TITLE, date=YESTERDAY, link='https://labor/1', source='매일노동뉴스')],
+        'bigkinds_news': [NewsItem('화성 공장서 끼임 사고로 노동자 사망', date=TODAY,
+                                   link='https://bigkinds/1', source='Bigkinds')],
+    }
+    result, report = deduplicate(data, render=_render)
+
+    assert [item.title for item in result['labor_news']] == [LABOR_TITLE]
+    assert result['bigkinds_news'] == []
+    assert [alt['source'] for alt in result['labor_news'][0].alternates] == ['Bigkinds']
+    assert LABOR_TITLE in _render(result)
+    # 빅카인즈는 원래 프롬프트에 없으므로 병합으로 줄어든 토큰도 없음
+    assert report.tokens_saved <= 0
+
+
+def test_official_source_outranks_a_newer_news_copy():
+    data = {
+        'moel_press': [NewsItem('화성 공장 끼임 사망사고 작업중지 명령', date=YESTERDAY, source='고용노동부')],
+        'labor_news': [NewsItem('화성 공장 끼임 사망사고 작업중지 명령 내려', date=TODAY, source='매일노동뉴스')],
+    }
+    result, report = deduplicate(data)
+    assert len(result['moel_press']) == 1 and result['labor_news'] == []
+    assert report.clusters == 1
+
+
+def test_dict_items_are_accepted_with_render():
+    data = {'labor_news': [{'title': LABOR_TITLE, 'date': TODAY, 'link': 'https://labor/1'}],
+            'moel_press': [{'title': LABOR_TITLE, 'date': TODAY, 'link': 'https://moel/1',
+                            'is_new': False}]}
+    result, report = deduplicate(data, render=_render)
+    assert report.items_after == 1
+    assert report.tokens_before > 0
@@ -0,0 +1,72 @@
+"""
+프롬프트 캐시 요청 형식과 사용량 집계 - 모의 Anthropic 클라이언트(conftest.mock_client)로 확인
+"""
+
+import pytest
+
+import telemetry
+from briefing_generator import BRIEFING_GUIDE, BriefingGenerator
+from models import NewsItem
+
+
+DATA = {
+    'moel_press': [NewsItem('건설현장 추락사고 예방 집중 점검 실시', date='2026.10.17',
+                            link='https://www.moel.go.kr/1', source='고용노동부')],
+}
+
+
+@pytest.fixture
+def generator(monkeypatch, mock_client):
+    monkeypatch.setenv('BRIEFING_CACHE_DISABLED', '1')
+    monkeypatch.setenv('ARCHIVE_DISABLED', '1')
+    monkeypatch.delenv('PROMPT_CACHE_DISABLED', raising=False)
+    monkeypatch.delenv('TELEMETRY_DISABLED', raising=False)
+    # 누적 카운터를 이 테스트 것만 보도록 새 계측 저장소 사용 (파일 기록 안 함)
+    monkeypatch.setattr(telemetry, '_telemetry', telemetry.Telemetry(None))
+    return BriefingGenerator(api_key='test', client=mock_client, recency_days=-1)
+
+
+def _counter(direction: str) -> float:
+    return telemetry.get_telemetry()._counters.get(('llm_tokens', (('direction', direction),)), 0)
+
+
+def test_guide_is_sent_as_cached_system_block(generator):
+    request = generator.build_request('자료', '2026년 10월 17일')
+    assert request['system'][-1]['text'] == BRIEFING_GUIDE
+    assert request['system'][-1]['cache_control'] == {'type': 'ephemeral'}
+    # 매일 바뀌는 자료는 캐시되는 system 블록 뒤(사용자 메시지)에 둠
+    assert BRIEFING_GUIDE not in request['messages'][0]['content']
+
+
+def test_cache_marker_can_be_disabled(generator, monkeypatch):
+    monkeypatch.setenv('PROMPT_CACHE_DISABLED', '1')
+    request = generator.build_request('자료', '2026년 10월 17일')
+    assert 'cache_control' not in request['system'][-1]
+
+
+def test_second_call_reads_guide_from_cache(generator):
+    client = generator.client
+    assert generator.generate_briefing(DATA)
+    assert generator.generate_briefing(DATA)
+
+    first, second = client.usages
+    assert first.cache_creation_input_tokens > 0
+    assert first.cache_read_input_tokens == 0
+    assert second.cache_read_input_tokens > 0
+    assert second.cache_creation_input_tokens == 0
+
+    spans = [s for s in telemetry.get_telemetry().spans() if s.name == 'llm.call']
+    assert [s.attrs['cache_read_tokens'] for s in spans] == [0, second.cache_read_input_tokens]
+    assert [s.attrs['cache_write_tokens'] for s in spans] == [first.cache_creation_input_tokens, 0]
+
+
+def test_record_usage_totals_tokens(generator):
+    client = generator.client
+    for _ in range(3):
+        assert generator.generate_briefing(DATA)
+
+    assert _counter('input') == sum(u.input_tokens for u in client.usages)
+    assert _counter('output') == sum(u.output_tokens for u in client.usages)
+    assert _counter('cache_read') == sum(u.cache_read_input_tokens for u in client.usages)
+    assert _counter('cache_write') == sum(u.cache_creation_input_tokens for u in client.usages)
+    assert _counter('cache_read') == 2 * client.usages[1].cache_read_input_tokens
@@ -0,0 +1,47 @@
+"""
+페이지 준비 대기 한도 조정 - 시간 초과 뒤 기본 한도로 돌아가는지, 저장이 합쳐지는지 확인
+"""
+
+from page_ready import ReadinessTuner
+
+
+DEFAULT_MS = 8000
+
+
+def _tuned(path) -> ReadinessTuner:
+    tuner = ReadinessTuner(str(path))
+    for _ in range(10):
+        tuner.record('bigkinds_results', 400, timed_out=False)
+    return tuner
+
+
+def test_fast_samples_shorten_the_deadline(tmp_path):
+    tuner = _tuned(tmp_path / 'readiness.json')
+    assert tuner.deadline_for('bigkinds_results', DEFAULT_MS) == DEFAULT_MS // 4
+
+
+def test_timeout_returns_to_the_default_deadline(tmp_path):
+    tuner = _tuned(tmp_path / 'readiness.json')
+    tuner.record('bigkinds_results', DEFAULT_MS // 4, timed_out=True)
+    assert tuner.deadline_for('bigkinds_results', DEFAULT_MS) == DEFAULT_MS
+
+    # 느려진 날의 대기시간으로 다시 학습
+    for _ in range(5):
+        tuner.record('bigkinds_results', 4000, timed_out=False)
+    assert tuner.deadline_for('bigkinds_results', DEFAULT_MS) == 4000 * 1.5 + 500
+    assert tuner.stats()['bigkinds_results'] == {'samples': 5, 'median_ms': 4000, 'timeouts': 1}
+
+
+def test_flush_merges_records_from_other_processes(tmp_path):
+    path = tmp_path / 'readiness.json'
+    app, daemon = ReadinessTuner(str(path)), ReadinessTuner(str(path))
+    app.record('kosha_notice', 300, timed_out=False)
+    daemon.record('kosha_notice', 500, timed_out=False)
+    daemon.record('major_accident', 5000, timed_out=True)
+    assert not path.exists()            # 대기마다 쓰지 않음
+
+    app.flush()
+    daemon.flush()
+    stats = ReadinessTuner(str(path)).stats()
+    assert stats['kosha_notice']['samples'] == 2
+    assert stats['major_accident'] == {'samples': 0, 'median_ms': 0.0, 'timeouts': 1}
@@ -0,0 +1,374 @@
+"""
+노동안전보건 일일 동향 브리핑 시스템
+XHR 레시피 모듈 - 브라우저 수집 중 데이터를 실어 오는 JSON 요청을 찾아 저장하고,
+다음 실행부터는 브라우저 없이 그 요청만 재현
+
+레시피 형식 (recipes.json):
+    {
+        'kosha_notice': {
+            'method': 'POST', 'url': '...', 'post_data': '{"page":1}',
+            'headers': {'content-type': 'application/json'},
+            'items_path': ['data', 'list'],            # JSON 안에서 목록까지의 경로
+            'fields': {'title': 'nttSj', 'date': 'regDt'},
+            'link_template': 'https://.../view?id={nttId}',   # (선택)
+            'referer': '...', 'discovered_at': '2024-01-15T09:00:00+09:00',
+            'newest_date': '2024-01-15',                # 발견 당시 가장 최근 게시일
+        },
+    }
+
+link_template은 한 행으로 만든 뒤 다른 행들의 링크도 똑같이 만들어 낼 때만 저장한다.
+post_data 안의 날짜(조회 기간)는 재현할 때 발견한 날과 오늘의 차이만큼 옮긴다. 재현한
+목록의 최신 날짜가 newest_date보다 오래되면 깨진 레시피로 보고, 레시피는 max_age마다 다시 찾는다.
+"""
+
+import os
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from date_utils import now_kst, parse_dates
+from storage import data_path, file_lock, read_json, write_json
+
+
+# 재현 시 함께 보낼 요청 헤더 (세션에 묶인 토큰·쿠키는 저장하지 않음)
+REPLAY_HEADERS = ('content-type', 'accept', 'x-requested-with')
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_DATE_RE = re.compile(r'^\d{4}[-./]?\d{2}[-./]?\d{2}')
+
+
+class RecipeError(Exception):
+    """레시피로 재현한 응답이 예상 구조와 다름"""
+
+
+@dataclass
+class Recipe:
+    source: str
+    method: str
+    url: str
+    items_path: List[Any]
+    fields: Dict[str, str]
+    post_data: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    link_template: Optional[str] = None
+    referer: Optional[str] = None
+    discovered_at: str = ''
+    newest_date: str = ''               # 발견 당시 화면의 가장 최근 게시일 (재현 결과가 이보다 오래되면 깨진 것)
+
+
+def _clean(value) -> str:
+    return _TAG_RE.sub('', str(value)).strip() if value is not None else ''
+
+
+def _lists_of_records(data, path=()) -> List[Tuple[Tuple, List[Dict]]]:
+    """JSON 안의 모든 '딕셔너리 목록'과 그 경로"""
+    found = []
+    if isinstance(data, list):
+        if data and all(isinstance(x, dict) for x in data):
+            found.append((path, data))
+        for i, x in enumerate(data[:1]):
+            found.extend(_lists_of_records(x, path + (i,)))
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            found.extend(_lists_of_records(value, path + (key,)))
+    return found
+
+
+def _follow(data, path):
+    for key in path:
+        data = data[key]
+    return data
+
+
+def _title_key(records: List[Dict], titles: List[str]) -> Tuple[Optional[str], int]:
+    """화면 제목과 가장 많이 일치하는 필드명과 일치 수"""
+    best, best_hits = None, 0
+    for key in records[0]:
+        hits = sum(1 for r in records
+                   if isinstance(r.get(key), str) and _clean(r[key]) in titles)
+        if hits > best_hits:
+            best, best_hits = key, hits
+    return best, best_hits
+
+
+def _date_key(records: List[Dict]) -> Optional[str]:
+    for key, value in records[0].items():
+        if isinstance(value, str) and _DATE_RE.match(value.strip()):
+            return key
+    return None
+
+
+def _format_link(template: str, record: Dict) -> str:
+    try:
+        return template.format(**record)
+    except (KeyError, IndexError, ValueError):
+        return ''
+
+
+def _link_template(pairs: List[Tuple[Dict, str]], min_checks: int = 2) -> Optional[str]:
+    """화면 링크에 레코드 값(게시물 ID 등)이 들어 있으면 그 자리를 {필드}로 바꾼 틀
+
+    pairs는 (레코드, 화면 링크) 목록. 첫 쌍으로 틀을 만들고 나머지 쌍의 링크도 그대로
+    만들어 내는지 확인한다 (쪽 번호·연도처럼 우연히 링크에 들어 있는 값을 고르지 않도록).
+    확인할 다른 행이 min_checks개보다 적거나 맞는 틀이 없으면 None (링크 없이 수집).
+    """
+    pairs = [(record, link) for record, link in pairs if link]
+    if len(pairs) < min_checks + 1:
+        return None
+    record, link = pairs[0]
+    escaped = link.replace('{', '{{').replace('}', '}}')
+    candidates = []
+    for key, value in record.items():
+        if isinstance(value, (str, int)) and not isinstance(value, bool):
+            text = str(value)
+            if len(text) >= 2 and text in link and '{' not in text and '}' not in text:
+                candidates.append((key, text))
+    # 긴 값(ID)부터 시도
+    for key, text in sorted(candidates, key=lambda kv: -len(kv[1])):
+        template = escaped.replace(text, '{' + key + '}', 1)
+        if all(_format_link(template, other) == other_link for other, other_link in pairs[1:]):
+            return template
+    return None
+
+
+_DATE_PARAM = re.compile(r'(?<!\d)(20\d{2})([-./]?)(\d{2})\2(\d{2})(?!\d)')
+
+
+def refresh_dates(post_data: Optional[str], discovered_at: str,
+                  today: Optional[date] = None) -> Optional[str]:
+    """요청 본문의 날짜 값(조회 기간 등)을 발견한 날과 오늘의 차이만큼 옮김
+
+    발견한 날 기준 1년 밖의 날짜는 기간 값이 아니라고 보고 두고, 형식(구분자)은 그대로 둔다.
+    """
+    if not post_data or not discovered_at:
+        return post_data
+    try:
+        base = datetime.fromisoformat(discovered_at).date()
+    except ValueError:
+        return post_data
+    shift = (today or now_kst().date()) - base
+    if not shift.days:
+        return post_data
+
+    def move(match):
+        year, sep, month, day = match.groups()
+        try:
+            value = date(int(year), int(month), int(day))
+        except ValueError:
+            return match.group(0)
+        if abs((value - base).days) > 366:
+            return match.group(0)
+        return (value + shift).strftime(f'%Y{sep}%m{sep}%d')
+
+    return _DATE_PARAM.sub(move, post_data)
+
+
+def _newest(dates: List[str]) -> Optional[date]:
+    parsed = [d.date() for d in parse_dates(dates) if d is not None]
+    return max(parsed) if parsed else None
+
+
+class XhrRecorder:
+    """페이지에서 오가는 JSON XHR/fetch 응답 기록 (goto 전에 생성)"""
+
+    def __init__(self, page, max_responses: int = 30):
+        self.page = page
+        self.max_responses = max_responses
+        self.responses = []
+        page.on('response', self._on_response)
+
+    def _on_response(self, response):
+        if len(self.responses) >= self.max_responses:
+            return
+        if response.request.resource_type not in ('xhr', 'fetch'):
+            return
+        if 'json' not in response.headers.get('content-type', ''):
+            return
+        # 본문은 이벤트 처리 중이 아니라 discover()에서 읽음
+        self.responses.append(response)
+
+    def discover(self, source: str, rows: List[Dict[str, str]]) -> Optional[Recipe]:
+        """화면에서 추출한 행(title, link)과 일치하는 JSON 응답으로 레시피 생성"""
+        titles = [row['title'] for row in rows if row.get('title')]
+        if not titles:
+            return None
+        needed = min(2, len(titles))
+
+        best = None
+        for response in self.responses:
+            try:
+                data = response.json()
+            except Exception:
+                continue
+            for path, records in _lists_of_records(data):
+                key, hits = _title_key(records, titles)
+                if key and hits >= needed and (best is None or hits > best[0]):
+                    best = (hits, response, list(path), records, key)
+
+        if best is None:
+            return None
+        _, response, path, records, title_key = best
+        request = response.request
+
+        fields = {'title': title_key}
+        date_key = _date_key(records)
+        if date_key:
+            fields['date'] = date_key
+
+        by_title = {}
+        for record in records:
+            by_title.setdefault(_clean(record.get(title_key)), record)
+        pairs = [(by_title[row['title']], row.get('link') or '')
+                 for row in rows if row.get('title') in by_title]
+        newest = _newest([row.get('date') or '' for row in rows])
+
+        return Recipe(
+            source=source,
+            method=request.method,
+            url=request.url,
+            items_path=path,
+            fields=fields,
+            post_data=request.post_data,
+            headers={k: v for k, v in request.headers.items() if k.lower() in REPLAY_HEADERS},
+            link_template=_link_template(pairs),
+            referer=self.page.url,
+            discovered_at=now_kst().isoformat(timespec='seconds'),
+            newest_date=newest.isoformat() if newest else '',
+        )
+
+
+def replay(recipe: Recipe, transport, limit: Optional[int] = None) -> List[Dict[str, str]]:
+    """레시피의 요청을 그대로 보내 행(title, date, link) 목록을 반환"""
+    headers = dict(recipe.headers)
+    if recipe.referer:
+        headers['Referer'] = recipe.referer
+    post_data = refresh_dates(recipe.post_data, recipe.discovered_at)
+    response = transport.fetch(
+        recipe.url, method=recipe.method,
+        data=post_data.encode('utf-8') if post_data else None,
+        headers=headers, timeout=15, deadline=25,
+    )
+    try:
+        records = _follow(response.json(), recipe.items_path)
+    except (ValueError, KeyError, IndexError, TypeError) as e:
+        raise RecipeError(f"응답 구조가 바뀌었습니다: {e}")
+    if not isinstance(records, list):
+        raise RecipeError("응답에서 목록을 찾지 못했습니다")
+
+    rows = []
+    for record in records[:limit]:
+        if not isinstance(record, dict) or recipe.fields['title'] not in record:
+            raise RecipeError("응답 항목에 제목 필드가 없습니다")
+        link = _format_link(recipe.link_template, record) if recipe.link_template else ''
+        rows.append({
+            'title': _clean(record.get(recipe.fields['title'])),
+            'date': _clean(record.get(recipe.fields.get('date', ''), '')),
+            'link': link,
+        })
+
+    # 세션 값이나 고정된 조회 조건 때문에 예전 목록을 200으로 계속 돌려주는 경우
+    if recipe.newest_date:
+        newest = _newest([row['date'] for row in rows])
+        if newest is not None and newest < date.fromisoformat(recipe.newest_date):
+            raise RecipeError(f"발견 당시({recipe.newest_date})보다 오래된 목록입니다 (최신 {newest})")
+    return rows
+
+
+class RecipeStore:
+    """소스별 레시피 저장소 (JSON 파일)
+
+    max_age가 지난 레시피는 버리고 다음 수집을 브라우저로 해서 다시 찾는다. 요청에 묶인
+    세션 값이 바뀌어도 같은 목록을 200으로 돌려주는 사이트가 있어 응답만으로는 알 수 없다.
+    앱과 백그라운드 실행이 같은 파일을 쓰므로 바꿀 때는 파일 잠금 안에서 다시 읽고 고쳐 저장한다.
+    """
+
+    def __init__(self, path: str, max_age: float = 24 * 3600):
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._recipes: Dict[str, Recipe] = {}
+        self._mtime: Optional[float] = None
+        self._reload()
+
+    def _reload(self):
+        """다른 프로세스(앱·백그라운드 실행)가 파일을 바꿨으면 다시 읽음 (잠금 안에서 호출)"""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return
+        if mtime != self._mtime:
+            recipes = {}
+            try:
+                for source, saved in (read_json(self.path) or {}).items():
+                    recipes[source] = Recipe(**saved)
+            except (AttributeError, TypeError):
+                pass
+            else:
+                self._recipes = recipes
+            self._mtime = mtime
+
+    def _save(self):
+        try:
+            write_json(self.path, {source: asdict(r) for source, r in self._recipes.items()})
+            self._mtime = os.path.getmtime(self.path)
+        except OSError:
+            pass
+
+    @contextmanager
+    def _update(self) -> Iterator[None]:
+        """파일 잠금 안에서 최신 레시피를 읽고, 블록이 끝나면 저장"""
+        with self._lock, file_lock(self.path):
+            self._reload()
+            yield
+            self._save()
+
+    def _expired(self, recipe: Recipe) -> bool:
+        try:
+            discovered = datetime.fromisoformat(recipe.discovered_at)
+        except ValueError:
+            return True
+        if discovered.tzinfo is None:
+            discovered = discovered.replace(tzinfo=now_kst().tzinfo)
+        return (now_kst() - discovered).total_seconds() > self.max_age
+
+    def get(self, source: str) -> Optional[Recipe]:
+        with self._lock:
+            self._reload()
+            recipe = self._recipes.get(source)
+            if recipe is None or not self._expired(recipe):
+                return recipe
+        print("  🧪 XHR 레시피가 오래됨 - 브라우저로 다시 확인")
+        with self._update():
+            # 그 사이 다른 프로세스가 새로 찾은 레시피는 지우지 않음
+            current = self._recipes.get(source)
+            if current is not None and self._expired(current):
+                del self._recipes[source]
+        return None
+
+    def put(self, recipe: Recipe):
+        with self._update():
+            self._recipes[recipe.source] = recipe
+
+    def discard(self, source: str):
+        """깨진 레시피 삭제 (다음 브라우저 수집 때 다시 찾음)"""
+        with self._update():
+            self._recipes.pop(source, None)
+
+
+_store: Optional[RecipeStore] = None
+_store_lock = threading.Lock()
+
+
+def get_recipe_store() -> Optional[RecipeStore]:
+    """공용 레시피 저장소 (XHR_RECIPES_DISABLED=1이면 None)"""
+    global _store
+    if os.getenv('XHR_RECIPES_DISABLED') == '1':
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = RecipeStore(data_path('recipes.json'),
+                                 max_age=float(os.getenv('XHR_RECIPE_MAX_HOURS', '24')) * 3600)
+        return _store